@@ -1278,6 +1278,29 @@ async def config_check():
         }
     )
 
+def _issue_tokens(email: str, user: dict) -> TokenResponse:
+    """Create the access/refresh token pair for an authenticated user"""
+    jwt_service = JWTService(
+        get_settings().JWT_SECRET,
+        get_settings().JWT_ALGORITHM
+    )
+    
+    access_token = jwt_service.create_token(
+        data={"sub": email, "user_id": user['id'], "role": user.get('role', 'candidate'), "token_type": "access"},
+        expires_delta=timedelta(minutes=get_settings().JWT_EXPIRY_MINUTES)
+    )
+    
+    refresh_token = jwt_service.create_token(
+        data={"sub": email, "user_id": user['id'], "role": user.get('role', 'candidate'), "token_type": "refresh"},
+        expires_delta=timedelta(days=get_settings().REFRESH_TOKEN_EXPIRY_DAYS)
+    )
+    
+    return TokenResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        expires_in=get_settings().JWT_EXPIRY_MINUTES * 60
+    )
+
 # Authentication endpoints
 @app.post("/api/auth/register", response_model=dict, tags=["Authentication"])
 async def register(request: UserRegisterRequest):
@@ -1388,29 +1411,9 @@ async def login(request: UserLoginRequest):
     # Reset failed attempts on successful login
     account_lockout.reset(request.email)
     
-    # Create tokens
-    jwt_service = JWTService(
-        get_settings().JWT_SECRET,
-        get_settings().JWT_ALGORITHM
-    )
-    
-    access_token = jwt_service.create_token(
-        data={"sub": request.email, "user_id": user['id'], "role": user.get('role', 'candidate'), "token_type": "access"},
-        expires_delta=timedelta(minutes=get_settings().JWT_EXPIRY_MINUTES)
-    )
-    
-    refresh_token = jwt_service.create_token(
-        data={"sub": request.email, "user_id": user['id'], "role": user.get('role', 'candidate'), "token_type": "refresh"},
-        expires_delta=timedelta(days=get_settings().REFRESH_TOKEN_EXPIRY_DAYS)
-    )
-    
     logger.info(f"User logged in: {request.email}")
     
-    return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        expires_in=get_settings().JWT_EXPIRY_MINUTES * 60
-    )
+    return _issue_tokens(request.email, user)
 
 
 class RefreshTokenRequest(BaseModel):
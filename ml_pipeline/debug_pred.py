@@ -1,9 +1,11 @@
 import joblib
 import numpy as np
+import xgboost as xgb
 from sklearn.preprocessing import LabelEncoder
 
-# Load XGBoost model
-model = joblib.load('./models/xgboost_model.pkl')
+# Load XGBoost model (native JSON format)
+model = xgb.XGBClassifier()
+model.load_model('./models/xgboost_model.json')
 
 # Load vectorizer
 vectorizer = joblib.load('./models/tfidf_vectorizer.pkl')
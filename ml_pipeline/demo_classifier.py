@@ -12,6 +12,13 @@ print("=" * 80)
 print(" " * 20 + "RESUME CLASSIFIER - DEMO")
 print("=" * 80)
 
+def load_xgboost(path):
+    """Load an XGBoost model saved in its native JSON format"""
+    import xgboost as xgb
+    model = xgb.XGBClassifier()
+    model.load_model(path)
+    return model
+
 # Load models
 print("\n[1/3] Loading trained models...")
 try:
@@ -19,7 +26,7 @@ try:
     models = {
         'Logistic Regression': joblib.load('./models/logistic_regression_model.pkl'),
         'Random Forest': joblib.load('./models/random_forest_model.pkl'),
-        'XGBoost': joblib.load('./models/xgboost_model.pkl'),
+        'XGBoost': load_xgboost('./models/xgboost_model.json'),
         'Neural Network': joblib.load('./models/neural_network_mlp_model.pkl')
     }
     print(f"[OK] Loaded {len(models)} models")
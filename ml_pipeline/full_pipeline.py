@@ -193,8 +193,12 @@ for name, model in models.items():
         mlflow.end_run()
     
     # Save locally
-    model_filename = f"./models/{name.replace(' ', '_').replace('(', '').replace(')', '').lower()}_model.pkl"
-    joblib.dump(model, model_filename)
+    # XGBoost uses its native JSON format (no unpickling on load)
+    model_stem = f"./models/{name.replace(' ', '_').replace('(', '').replace(')', '').lower()}_model"
+    if isinstance(model, xgb.XGBClassifier):
+        model.save_model(f"{model_stem}.json")
+    else:
+        joblib.dump(model, f"{model_stem}.pkl")
     
     results[name] = {
         'accuracy': accuracy,
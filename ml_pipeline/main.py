@@ -283,7 +283,7 @@ class ResumePipeline:
             best_run = self.mlflow_logger.get_best_run(metric_name='f1_macro')
             
             logger.info("✓ MLflow tracking completed successfully")
-            logger.info(f"\nMLflow UI: Run 'mlflow ui' and open http://localhost:5000")
+            logger.info(f"\nMLflow UI: Run 'mlflow ui --backend-store-uri sqlite:///mlruns.db' and open http://localhost:5000")
             
         except Exception as e:
             logger.error(f"✗ MLflow tracking failed: {str(e)}")
@@ -376,7 +376,7 @@ class ResumePipeline:
             logger.info(f"Models Trained: {len(self.trainer.trained_models)}")
             logger.info(f"Best Model: {self.evaluator.get_best_model()[0]}")
             logger.info(f"Results saved in: ./results, ./models, ./artifacts")
-            logger.info(f"MLflow UI: Run 'mlflow ui' and open http://localhost:5000")
+            logger.info(f"MLflow UI: Run 'mlflow ui --backend-store-uri sqlite:///mlruns.db' and open http://localhost:5000")
             logger.info("="*80)
             
             return True
@@ -53,7 +53,7 @@ echo.
 
 REM Download NLTK data
 echo [6/6] Downloading NLTK data...
-python -c "import nltk; nltk.download('stopwords', quiet=True); nltk.download('wordnet', quiet=True); nltk.download('punkt', quiet=True); nltk.download('omw-1.4', quiet=True); print('NLTK data downloaded')"
+python -c "import nltk; nltk.download('stopwords', quiet=True); nltk.download('wordnet', quiet=True); nltk.download('omw-1.4', quiet=True); print('NLTK data downloaded')"
 echo.
 
 REM Download spaCy model
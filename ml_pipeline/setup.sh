@@ -50,7 +50,7 @@ echo ""
 
 # Download NLTK data
 echo "[6/7] Downloading NLTK data..."
-python3 -c "import nltk; nltk.download('stopwords', quiet=True); nltk.download('wordnet', quiet=True); nltk.download('punkt', quiet=True); nltk.download('omw-1.4', quiet=True); print('NLTK data downloaded')"
+python3 -c "import nltk; nltk.download('stopwords', quiet=True); nltk.download('wordnet', quiet=True); nltk.download('omw-1.4', quiet=True); print('NLTK data downloaded')"
 echo ""
 
 # Download spaCy model
@@ -18,17 +18,23 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Dict, List, Tuple, Any, Optional
-from sklearn.metrics import (
-    accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
-    confusion_matrix,
-    classification_report
-)
+from typing import Dict, List, Tuple, Any, Optional, Iterator
+import copy
+import gc
+import heapq
+import importlib.util
+import io
+import joblib
+from joblib import Parallel, cpu_count, delayed, effective_n_jobs
 import os
+import tempfile
 from datetime import datetime
+from threadpoolctl import threadpool_limits
+
+from ._fast_metrics import NUMBA_AVAILABLE, check_label_range
+
+if NUMBA_AVAILABLE:
+    from ._fast_metrics import cm_prf
 
 # Configure logging
 logging.basicConfig(
@@ -41,6 +47,294 @@ logger = logging.getLogger(__name__)
 sns.set_style('whitegrid')
 plt.rcParams['figure.figsize'] = (10, 8)
 
+# Compression for persisted evaluator state: LZ4 when available (fast),
+# otherwise zlib which ships with Python
+STATE_COMPRESSION = ('lz4', 3) if importlib.util.find_spec('lz4') else ('zlib', 3)
+
+# Raster resolution for saved PNG plots (PDFs are vector and resolution-free)
+PLOT_DPI = 100
+
+# Dense X_test larger than this is evaluated from a disk-backed memmap
+MEMMAP_THRESHOLD_BYTES = 500_000_000
+
+# Confusion matrices with more classes than this are drawn without cell text
+CM_ANNOTATE_MAX_CLASSES = 20
+
+# Test sets larger than this use the compiled Numba kernel when available
+NUMBA_MIN_SAMPLES = 50_000
+
+
+def _fast_cm(y_true: np.ndarray, y_pred: np.ndarray, n: int) -> np.ndarray:
+    """
+    Compute an n x n confusion matrix in a single vectorized pass.
+    
+    Labels must be integer-encoded in ``[0, n)``; anything else raises
+    before a matrix is built, since every path below indexes with the labels
+    directly. Very large test sets go through the parallel Numba kernel when
+    it is installed. Otherwise the binary case is short-circuited to boolean
+    masked sums and the general case flattens each (true, pred) pair to
+    ``n * true + pred`` and counts with ``np.bincount``.
+    
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+        n: Number of classes
+        
+    Returns:
+        Confusion matrix with rows as true labels and columns as predictions
+        
+    Raises:
+        ValueError: If the label arrays differ in length or hold labels
+            outside ``[0, n)``
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(
+            f"y_true and y_pred must have the same shape, got {y_true.shape} and {y_pred.shape}"
+        )
+    check_label_range(y_true, n, 'y_true')
+    check_label_range(y_pred, n, 'y_pred')
+    
+    if NUMBA_AVAILABLE and y_true.shape[0] > NUMBA_MIN_SAMPLES:
+        cm, _, _, _ = cm_prf(
+            np.ascontiguousarray(y_true, dtype=np.int64),
+            np.ascontiguousarray(y_pred, dtype=np.int64),
+            n
+        )
+        return cm
+    
+    if n == 2:
+        true_pos = y_true == 1
+        pred_pos = y_pred == 1
+        tp = np.count_nonzero(true_pos & pred_pos)
+        fn = np.count_nonzero(true_pos & ~pred_pos)
+        fp = np.count_nonzero(~true_pos & pred_pos)
+        tn = y_true.shape[0] - tp - fn - fp
+        return np.array([[tn, fp], [fn, tp]], dtype=np.int64)
+    
+    flat = n * y_true.astype(np.int64) + y_pred.astype(np.int64)
+    return np.bincount(flat, minlength=n * n).reshape(n, n)
+
+
+def _spill_to_memmap(X: Any) -> Tuple[Any, Optional[str]]:
+    """
+    Prepare X_test for evaluation without duplicating it in memory.
+    
+    Sparse inputs are converted to CSR (the fast row format for predict).
+    Dense arrays above ``MEMMAP_THRESHOLD_BYTES`` are written to a temporary
+    file and reopened as a read-only ``np.memmap``; the caller must delete
+    the returned path when done.
+    
+    Args:
+        X: Dense array or scipy sparse matrix
+        
+    Returns:
+        Tuple of (matrix to evaluate on, temporary file path or None)
+    """
+    if hasattr(X, 'tocsr'):
+        return X.tocsr(), None
+    
+    if not isinstance(X, np.ndarray) or isinstance(X, np.memmap) or X.nbytes <= MEMMAP_THRESHOLD_BYTES:
+        return X, None
+    
+    fd, path = tempfile.mkstemp(suffix='.dat', prefix='X_test_')
+    with os.fdopen(fd, 'wb') as f:
+        np.ascontiguousarray(X).tofile(f)
+    
+    logger.info(f"Spilled X_test ({X.nbytes / 1e6:.0f} MB) to memmap: {path}")
+    return np.memmap(path, dtype=X.dtype, mode='r', shape=X.shape), path
+
+
+def _metrics_from_cm(cm: np.ndarray) -> Dict[str, Any]:
+    """
+    Derive accuracy and per-class / macro / weighted precision, recall and F1
+    from a confusion matrix, matching sklearn's ``zero_division=0`` semantics.
+    
+    Args:
+        cm: Confusion matrix with rows as true labels
+        
+    Returns:
+        Dictionary of accuracy, per-class arrays, averages and support
+    """
+    tp = np.diag(cm).astype(np.float64)
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    total = support.sum()
+    
+    precision = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+    recall = np.divide(tp, support, out=np.zeros_like(tp), where=support > 0)
+    denom = support + predicted
+    f1 = np.divide(2 * tp, denom, out=np.zeros_like(tp), where=denom > 0)
+    
+    # sklearn averages only over labels seen in y_true or y_pred
+    present = denom > 0
+    
+    # Support-weighted averages as inner products with the class weights
+    weights = support / total if total else np.zeros_like(tp)
+    
+    return {
+        'accuracy': float(tp.sum() / total) if total else 0.0,
+        'precision_per_class': precision,
+        'recall_per_class': recall,
+        'f1_per_class': f1,
+        'precision_macro': float(precision[present].mean()) if present.any() else 0.0,
+        'recall_macro': float(recall[present].mean()) if present.any() else 0.0,
+        'f1_macro': float(f1[present].mean()) if present.any() else 0.0,
+        'precision_weighted': float(np.dot(precision, weights)),
+        'recall_weighted': float(np.dot(recall, weights)),
+        'f1_weighted': float(np.dot(f1, weights)),
+        'support': support,
+    }
+
+
+def _build_report_dict(label_names: List[str], fused: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a classification report from confusion-matrix-derived metrics.
+    
+    Produces the same nested layout as sklearn's
+    ``classification_report(output_dict=True)`` (one entry per label plus
+    ``'accuracy'``, ``'macro avg'`` and ``'weighted avg'``) without another
+    pass over the labels.
+    
+    Args:
+        label_names: List of class label names
+        fused: Output of ``_metrics_from_cm``
+        
+    Returns:
+        Classification report dictionary
+    """
+    precision = fused['precision_per_class']
+    recall = fused['recall_per_class']
+    f1 = fused['f1_per_class']
+    support = fused['support']
+    total = int(support.sum())
+    
+    report = {
+        label: {
+            'precision': float(precision[i]),
+            'recall': float(recall[i]),
+            'f1-score': float(f1[i]),
+            'support': int(support[i])
+        }
+        for i, label in enumerate(label_names)
+    }
+    report['accuracy'] = fused['accuracy']
+    report['macro avg'] = {
+        'precision': fused['precision_macro'],
+        'recall': fused['recall_macro'],
+        'f1-score': fused['f1_macro'],
+        'support': total
+    }
+    report['weighted avg'] = {
+        'precision': fused['precision_weighted'],
+        'recall': fused['recall_weighted'],
+        'f1-score': fused['f1_weighted'],
+        'support': total
+    }
+    
+    return report
+
+
+def _compute_metrics(
+    model_name: str,
+    y_test: np.ndarray,
+    y_pred: np.ndarray,
+    label_names: List[str]
+) -> Dict[str, Any]:
+    """
+    Compute every evaluation metric for one set of predictions.
+    
+    Args:
+        model_name: Name of the model
+        y_test: True labels
+        y_pred: Predicted labels
+        label_names: List of class label names
+        
+    Returns:
+        Dictionary containing all evaluation metrics
+    """
+    # Confusion matrix and the metrics derived from it in one pass
+    cm = _fast_cm(y_test, y_pred, len(label_names))
+    fused = _metrics_from_cm(cm)
+    
+    # Calculate metrics
+    metrics = {
+        'model_name': model_name,
+        'accuracy': fused['accuracy'],
+        'precision_macro': fused['precision_macro'],
+        'recall_macro': fused['recall_macro'],
+        'f1_macro': fused['f1_macro'],
+        'precision_weighted': fused['precision_weighted'],
+        'recall_weighted': fused['recall_weighted'],
+        'f1_weighted': fused['f1_weighted'],
+    }
+    
+    # Per-class metrics
+    metrics['precision_per_class'] = fused['precision_per_class']
+    metrics['recall_per_class'] = fused['recall_per_class']
+    metrics['f1_per_class'] = fused['f1_per_class']
+    
+    metrics['confusion_matrix'] = cm
+    
+    # Classification report, assembled from the arrays above
+    metrics['classification_report'] = _build_report_dict(label_names, fused)
+    total = int(fused['support'].sum())
+    
+    # Downcast stored arrays; the report above keeps full precision and
+    # display only uses four decimals
+    for key in ('precision_per_class', 'recall_per_class', 'f1_per_class'):
+        metrics[key] = metrics[key].astype(np.float32)
+    if total <= np.iinfo(np.int32).max:
+        metrics['confusion_matrix'] = cm.astype(np.int32)
+    
+    return metrics
+
+
+def _evaluate_one(
+    model_name: str,
+    model: Any,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    label_names: List[str],
+    y_pred: Optional[np.ndarray] = None,
+    inner_threads: Optional[int] = None
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[np.ndarray], Optional[Exception]]:
+    """
+    Evaluate one model without touching evaluator state or logging.
+    
+    Module-level so joblib workers receive only the model. A failure is
+    returned rather than raised, so the parent can re-raise it in model
+    order (joblib would otherwise raise it ahead of earlier results); all
+    logging is left to the parent process.
+    
+    Args:
+        model_name: Name of the model
+        model: Trained model object (left untouched)
+        X_test: Test features
+        y_test: True labels
+        label_names: List of class label names
+        y_pred: Cached predictions, if already available
+        inner_threads: Cap on the model's own ``n_jobs`` and on the
+            BLAS/OpenMP pools while predicting, for callers that already run
+            several of these in parallel (None leaves both untouched)
+        
+    Returns:
+        Tuple of (model_name, metrics, y_pred, exception or None)
+    """
+    try:
+        if y_pred is None:
+            # Only models that set n_jobs themselves (the tree models' -1);
+            # the shallow copy keeps the caller's model as it was
+            if inner_threads is not None and getattr(model, 'n_jobs', None) is not None:
+                model = copy.copy(model)
+                model.set_params(n_jobs=inner_threads)
+            with threadpool_limits(limits=inner_threads):
+                y_pred = model.predict(X_test)
+        return model_name, _compute_metrics(model_name, y_test, y_pred, label_names), y_pred, None
+    except Exception as e:
+        return model_name, None, None, e
+
 
 class ModelEvaluator:
     """
@@ -49,17 +343,35 @@ class ModelEvaluator:
     Attributes:
         label_names: List of class label names
         evaluation_results: Dictionary storing all evaluation metrics
+        cache_dir: Directory for persisted predictions (None disables)
+        save_pdf: Whether plots are also archived as vector PDFs
+        defer_logging: Whether per-model result logging is suppressed
     """
     
-    def __init__(self, label_names: List[str]):
+    def __init__(
+        self,
+        label_names: List[str],
+        cache_dir: Optional[str] = None,
+        save_pdf: bool = False,
+        defer_logging: bool = False
+    ):
         """
         Initialize the evaluator with label information.
         
         Args:
             label_names: List of class label names
+            cache_dir: Optional directory (e.g. './artifacts/pred_cache') where
+                predictions are persisted so re-runs can skip inference
+            save_pdf: Also write a vector PDF next to every PNG plot
+            defer_logging: Suppress per-model result logging in
+                ``evaluate_model``; ``evaluate_all_models`` always batches
         """
         self.label_names = label_names
         self.evaluation_results = {}
+        self.cache_dir = cache_dir
+        self.save_pdf = save_pdf
+        self.defer_logging = defer_logging
+        self._comparison_cache = None
         
         logger.info(f"ModelEvaluator initialized with {len(label_names)} classes")
         logger.info(f"Classes: {label_names}")
@@ -85,46 +397,17 @@ class ModelEvaluator:
         """
         logger.info(f"\nEvaluating {model_name}...")
         
+        # Fail fast before any inference work
+        y_test = self._validate_inputs(X_test, y_test)
+        
         try:
-            # Make predictions
-            y_pred = model.predict(X_test)
-            
-            # Calculate metrics
-            metrics = {
-                'model_name': model_name,
-                'accuracy': accuracy_score(y_test, y_pred),
-                'precision_macro': precision_score(y_test, y_pred, average='macro', zero_division=0),
-                'recall_macro': recall_score(y_test, y_pred, average='macro', zero_division=0),
-                'f1_macro': f1_score(y_test, y_pred, average='macro', zero_division=0),
-                'precision_weighted': precision_score(y_test, y_pred, average='weighted', zero_division=0),
-                'recall_weighted': recall_score(y_test, y_pred, average='weighted', zero_division=0),
-                'f1_weighted': f1_score(y_test, y_pred, average='weighted', zero_division=0),
-            }
-            
-            # Calculate per-class metrics
-            precision_per_class = precision_score(y_test, y_pred, average=None, zero_division=0)
-            recall_per_class = recall_score(y_test, y_pred, average=None, zero_division=0)
-            f1_per_class = f1_score(y_test, y_pred, average=None, zero_division=0)
-            
-            metrics['precision_per_class'] = precision_per_class
-            metrics['recall_per_class'] = recall_per_class
-            metrics['f1_per_class'] = f1_per_class
+            # Make predictions (served from cache_dir when enabled)
+            y_pred = self._predict(model, X_test, model_name)
             
-            # Confusion matrix
-            cm = confusion_matrix(y_test, y_pred)
-            metrics['confusion_matrix'] = cm
-            
-            # Classification report
-            report = classification_report(
-                y_test, y_pred,
-                target_names=self.label_names,
-                output_dict=True,
-                zero_division=0
-            )
-            metrics['classification_report'] = report
+            metrics = _compute_metrics(model_name, y_test, y_pred, self.label_names)
             
             # Store results
-            self.evaluation_results[model_name] = metrics
+            self._store_result(model_name, metrics)
             
             # Log results
             self._log_metrics(model_name, metrics)
@@ -135,14 +418,154 @@ class ModelEvaluator:
             logger.error(f"Error evaluating {model_name}: {str(e)}")
             raise
     
+    def _validate_inputs(self, X_test: Any, y_test: Any) -> np.ndarray:
+        """
+        Check test inputs before any prediction is made.
+        
+        Args:
+            X_test: Test features
+            y_test: True labels
+            
+        Returns:
+            ``y_test`` as a contiguous int32 array
+            
+        Raises:
+            ValueError: If shapes, dtype or label range do not match
+        """
+        y = np.asarray(y_test)
+        if y.ndim != 1:
+            raise ValueError(f"y_test must be 1-dimensional, got shape {y.shape}")
+        if X_test.shape[0] != y.shape[0]:
+            raise ValueError(
+                f"X_test has {X_test.shape[0]} rows but y_test has {y.shape[0]} labels"
+            )
+        if not np.issubdtype(y.dtype, np.integer):
+            raise ValueError(f"y_test must hold integer-encoded labels, got dtype {y.dtype}")
+        
+        n_classes = len(self.label_names)
+        if y.size and (y.min() < 0 or y.max() >= n_classes):
+            raise ValueError(
+                f"y_test labels must lie in [0, {n_classes}) to match label_names, "
+                f"got [{y.min()}, {y.max()}]"
+            )
+        
+        return np.ascontiguousarray(y, dtype=np.int32)
+    
+    def _store_result(self, model_name: str, metrics: Dict[str, Any]):
+        """
+        Record a model's metrics and invalidate derived caches.
+        
+        Args:
+            model_name: Name of the model
+            metrics: Dictionary of metrics
+        """
+        self.evaluation_results[model_name] = metrics
+        self._comparison_cache = None
+    
+    def _cache_lookup(
+        self,
+        model: Any,
+        X_test: np.ndarray,
+        model_name: str,
+        x_digest: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """
+        Look up persisted predictions for a model.
+        
+        Only active when ``cache_dir`` is set. Entries are keyed by a content
+        hash of the fitted model and X_test, so a model refit in place gets a
+        new key instead of its previous predictions, and each entry lives in
+        its own ``{model_name}_{digest}.pkl`` file.
+        
+        Args:
+            model: Trained model object
+            X_test: Test features
+            model_name: Name of the model
+            x_digest: Precomputed ``joblib.hash(X_test)``, so several models
+                evaluated on the same matrix hash it only once
+            
+        Returns:
+            Tuple of (digest, cached predictions or None); digest is None
+            when caching is disabled
+        """
+        if self.cache_dir is None:
+            return None, None
+        
+        if x_digest is None:
+            x_digest = joblib.hash(X_test)
+        digest = joblib.hash((joblib.hash(model), x_digest))
+        disk_path = self._cache_path(model_name, digest)
+        if os.path.exists(disk_path):
+            try:
+                y_pred = joblib.load(disk_path)
+                logger.info(f"Loaded cached predictions: {disk_path}")
+                return digest, y_pred
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable prediction cache {disk_path}: {str(e)}")
+        
+        return digest, None
+    
+    def _cache_store(self, digest: Optional[str], y_pred: np.ndarray, model_name: str):
+        """
+        Persist fresh predictions under their digest.
+        
+        Args:
+            digest: Digest from ``_cache_lookup`` (None skips the cache)
+            y_pred: Predicted labels
+            model_name: Name of the model
+        """
+        if digest is None:
+            return
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        joblib.dump(y_pred, self._cache_path(model_name, digest))
+    
+    def _cache_path(self, model_name: str, digest: str) -> str:
+        """Path of the persisted predictions for one model and digest."""
+        return os.path.join(self.cache_dir, f"{model_name}_{digest}.pkl")
+    
+    def _predict(self, model: Any, X_test: np.ndarray, model_name: str) -> np.ndarray:
+        """
+        Predict, reusing persisted predictions when ``cache_dir`` is set.
+        
+        Args:
+            model: Trained model object
+            X_test: Test features
+            model_name: Name of the model
+            
+        Returns:
+            Predicted labels
+        """
+        digest, y_pred = self._cache_lookup(model, X_test, model_name)
+        if y_pred is None:
+            y_pred = model.predict(X_test)
+            self._cache_store(digest, y_pred, model_name)
+        
+        return y_pred
+    
+    def clear_cache(self):
+        """Delete persisted predictions from ``cache_dir``."""
+        if self.cache_dir is not None and os.path.isdir(self.cache_dir):
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith('.pkl'):
+                    os.remove(os.path.join(self.cache_dir, filename))
+        
+        logger.info("Prediction cache cleared")
+    
     def _log_metrics(self, model_name: str, metrics: Dict[str, Any]):
         """
         Log evaluation metrics to console.
         
+        No-op while ``defer_logging`` is set; ``_log_all_metrics`` then emits
+        every model at once.
+        
         Args:
             model_name: Name of the model
             metrics: Dictionary of metrics
         """
+        if self.defer_logging:
+            return
+        
         logger.info(f"\n{'='*60}")
         logger.info(f"Results for {model_name}")
         logger.info(f"{'='*60}")
@@ -152,26 +575,183 @@ class ModelEvaluator:
         logger.info(f"F1-Score (macro):   {metrics['f1_macro']:.4f}")
         logger.info(f"{'='*60}")
         
-        logger.info("\nPer-Class Metrics:")
-        for i, label in enumerate(self.label_names):
-            logger.info(f"  {label}:")
-            logger.info(f"    Precision: {metrics['precision_per_class'][i]:.4f}")
-            logger.info(f"    Recall:    {metrics['recall_per_class'][i]:.4f}")
-            logger.info(f"    F1-Score:  {metrics['f1_per_class'][i]:.4f}")
+        logger.info("\nPer-Class Metrics:\n%s", self._per_class_frame(metrics).to_string())
+    
+    def _log_all_metrics(self, model_names: List[str]):
+        """
+        Log results for several models as two tables in one pass.
+        
+        Args:
+            model_names: Models to include (must be in ``evaluation_results``)
+        """
+        if not model_names:
+            return
+        
+        summary = pd.DataFrame(
+            {
+                'Accuracy': [self.evaluation_results[name]['accuracy'] for name in model_names],
+                'Precision (macro)': [self.evaluation_results[name]['precision_macro'] for name in model_names],
+                'Recall (macro)': [self.evaluation_results[name]['recall_macro'] for name in model_names],
+                'F1-Score (macro)': [self.evaluation_results[name]['f1_macro'] for name in model_names]
+            },
+            index=pd.Index(model_names, name='Model')
+        ).round(4)
+        per_class = pd.concat(
+            {name: self._per_class_frame(self.evaluation_results[name]) for name in model_names},
+            names=['Model', 'Label']
+        )
+        
+        logger.info(
+            "\nResults:\n%s\n\nPer-Class Metrics:\n%s",
+            summary.to_string(),
+            per_class.to_string()
+        )
+    
+    def _per_class_frame(self, metrics: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Build a label-indexed table of per-class precision, recall and F1.
+        
+        Args:
+            metrics: Dictionary of metrics for one model
+            
+        Returns:
+            DataFrame rounded to four decimals
+        """
+        return pd.DataFrame(
+            {
+                'Precision': metrics['precision_per_class'],
+                'Recall': metrics['recall_per_class'],
+                'F1-Score': metrics['f1_per_class']
+            },
+            index=self.label_names
+        ).round(4)
+    
+    def _report_frame(self, report: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Build a per-class table from a classification report dictionary.
+        
+        Args:
+            report: Classification report (``output_dict=True`` layout)
+            
+        Returns:
+            DataFrame indexed by label with precision, recall, F1 and support
+        """
+        df = pd.DataFrame(
+            [report[label] for label in self.label_names],
+            index=self.label_names
+        )[['precision', 'recall', 'f1-score', 'support']]
+        df.columns = ['Precision', 'Recall', 'F1-Score', 'Support']
+        df['Support'] = df['Support'].astype(int)
+        return df.round(4)
+    
+    def iter_evaluate(
+        self,
+        models: Dict[str, Any],
+        X_test: np.ndarray,
+        y_test: np.ndarray,
+        n_jobs: int = 1,
+        target_f1: Optional[float] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Lazily evaluate models, yielding each result as soon as it is ready.
+        
+        Models are evaluated one after another by default, or in parallel
+        worker processes when ``n_jobs`` allows; metrics are merged and
+        logged in the calling process, in the order of ``models``. Stopping
+        iteration early (or reaching ``target_f1``) cancels the remaining
+        evaluations. A model that fails to evaluate raises, as in
+        ``evaluate_model``.
+        
+        Args:
+            models: Dictionary of trained models
+            X_test: Test features
+            y_test: True labels
+            n_jobs: Number of parallel worker processes (1 is serial, -1 uses
+                all cores and caps each model's own threads to its share)
+            target_f1: Stop once a model reaches this macro F1 (optional)
+            
+        Yields:
+            Tuples of (model_name, metrics)
+        """
+        # Validate and coerce once for every model
+        y_test = self._validate_inputs(X_test, y_test)
+        
+        # Serve cached predictions up front; only the rest are recomputed
+        x_digest = joblib.hash(X_test) if self.cache_dir is not None else None
+        lookups = {
+            model_name: self._cache_lookup(model, X_test, model_name, x_digest)
+            for model_name, model in models.items()
+        }
+        
+        n_workers = min(effective_n_jobs(n_jobs), max(1, len(models)))
+        if n_workers > 1:
+            # Large dense matrices are spilled to a read-only memmap so
+            # workers share pages instead of receiving pickled copies
+            X_eval, spill_path = _spill_to_memmap(X_test)
+            # Each worker's model gets its share of the cores, so tree models
+            # with n_jobs=-1 don't oversubscribe the machine
+            inner_threads = max(1, cpu_count() // n_workers)
+        else:
+            X_eval, spill_path, inner_threads = X_test, None, None
+        
+        outcomes = Parallel(n_jobs=n_workers, prefer='processes', return_as='generator')(
+            delayed(_evaluate_one)(
+                model_name, model, X_eval, y_test, self.label_names,
+                y_pred=lookups[model_name][1], inner_threads=inner_threads
+            )
+            for model_name, model in models.items()
+        )
+        
+        try:
+            for model_name, metrics, y_pred, error in outcomes:
+                if error is not None:
+                    logger.error(f"Error evaluating {model_name}: {str(error)}")
+                    raise error
+                
+                digest, cached = lookups[model_name]
+                if cached is None:
+                    self._cache_store(digest, y_pred, model_name)
+                
+                self._store_result(model_name, metrics)
+                self._log_metrics(model_name, metrics)
+                
+                yield model_name, metrics
+                
+                if target_f1 is not None and metrics['f1_macro'] >= target_f1:
+                    logger.info(
+                        f"{model_name} reached target F1 {target_f1:.4f}, "
+                        f"skipping remaining models"
+                    )
+                    break
+        finally:
+            outcomes.close()
+            del X_eval
+            if spill_path is not None:
+                gc.collect()
+                os.remove(spill_path)
     
     def evaluate_all_models(
         self,
         models: Dict[str, Any],
         X_test: np.ndarray,
-        y_test: np.ndarray
+        y_test: np.ndarray,
+        n_jobs: int = 1,
+        target_f1: Optional[float] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         Evaluate all models and compile results.
         
+        Thin wrapper that drains ``iter_evaluate`` and logs every model's
+        results together once evaluation is finished. A model that fails to
+        evaluate raises instead of being left out of the results.
+        
         Args:
             models: Dictionary of trained models
             X_test: Test features
             y_test: True labels
+            n_jobs: Number of parallel worker processes (1 is serial, -1 uses
+                all cores and caps each model's own threads to its share)
+            target_f1: Stop once a model reaches this macro F1 (optional)
             
         Returns:
             Dictionary of evaluation results for all models
@@ -180,20 +760,45 @@ class ModelEvaluator:
         logger.info("EVALUATING ALL MODELS")
         logger.info("="*60)
         
-        for model_name, model in models.items():
-            try:
-                self.evaluate_model(model, X_test, y_test, model_name)
-            except Exception as e:
-                logger.error(f"Failed to evaluate {model_name}: {str(e)}")
-                continue
+        # Per-model logging is batched into one multi-index table at the end
+        previous, self.defer_logging = self.defer_logging, True
+        try:
+            evaluated = [
+                model_name for model_name, _ in
+                self.iter_evaluate(models, X_test, y_test, n_jobs=n_jobs, target_f1=target_f1)
+            ]
+        finally:
+            self.defer_logging = previous
+        
+        self._log_all_metrics(evaluated)
         
         logger.info(f"\nEvaluated {len(self.evaluation_results)} models successfully")
         return self.evaluation_results
     
+    def get_top_models(self, k: int = 3) -> List[Tuple[str, float]]:
+        """
+        Return the ``k`` best evaluated models by macro F1.
+        
+        Args:
+            k: Number of models to return
+            
+        Returns:
+            List of (model_name, f1_macro) tuples, best first
+        """
+        return heapq.nlargest(
+            k,
+            ((name, metrics['f1_macro']) for name, metrics in self.evaluation_results.items()),
+            key=lambda item: item[1]
+        )
+    
     def create_comparison_table(self) -> pd.DataFrame:
         """
         Create a comparison table of all evaluated models.
         
+        The table is memoized until another model is evaluated, so repeated
+        calls (e.g. from ``export_results``) return a copy without rebuilding
+        or re-logging it.
+        
         Returns:
             DataFrame with model comparison
         """
@@ -201,6 +806,9 @@ class ModelEvaluator:
             logger.warning("No evaluation results available")
             return pd.DataFrame()
         
+        if self._comparison_cache is not None:
+            return self._comparison_cache.copy()
+        
         # Extract key metrics for comparison
         comparison_data = []
         for model_name, metrics in self.evaluation_results.items():
@@ -225,7 +833,8 @@ class ModelEvaluator:
         logger.info("\n" + df.to_string(index=False))
         logger.info("="*80)
         
-        return df
+        self._comparison_cache = df
+        return df.copy()
     
     def print_classification_report(self, model_name: str):
         """
@@ -245,14 +854,7 @@ class ModelEvaluator:
         logger.info(f"{'='*60}\n")
         
         # Print per-class metrics
-        for label in self.label_names:
-            metrics = report[label]
-            logger.info(f"{label}:")
-            logger.info(f"  Precision: {metrics['precision']:.4f}")
-            logger.info(f"  Recall:    {metrics['recall']:.4f}")
-            logger.info(f"  F1-Score:  {metrics['f1-score']:.4f}")
-            logger.info(f"  Support:   {int(metrics['support'])}")
-            logger.info("")
+        logger.info("Per-Class Metrics:\n%s\n", self._report_frame(report).to_string())
         
         # Print overall metrics
         logger.info("Overall Metrics:")
@@ -296,20 +898,10 @@ class ModelEvaluator:
             title = f'Confusion Matrix - {model_name}'
             fmt = 'd'
         
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(
-            cm,
-            annot=True,
-            fmt=fmt,
-            cmap='Blues',
-            xticklabels=self.label_names,
-            yticklabels=self.label_names,
-            cbar_kws={'label': 'Count' if not normalize else 'Proportion'}
-        )
-        plt.title(title, fontsize=16, fontweight='bold')
-        plt.ylabel('True Label', fontsize=12)
-        plt.xlabel('Predicted Label', fontsize=12)
-        plt.tight_layout()
+        fig, ax = plt.subplots(figsize=(10, 8))
+        self._draw_confusion_matrix(fig, ax, cm, fmt, 'Count' if not normalize else 'Proportion')
+        ax.set_title(title, fontsize=16, fontweight='bold')
+        fig.tight_layout()
         
         # Save plot
         if save_path is None:
@@ -317,32 +909,108 @@ class ModelEvaluator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             save_path = f"artifacts/confusion_matrix_{model_name}_{timestamp}.png"
         
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, save_path)
         
         logger.info(f"Confusion matrix saved: {save_path}")
         return save_path
     
+    def _save_figure(self, fig: Any, save_path: str):
+        """
+        Save a figure as a PNG at ``PLOT_DPI`` (plus a PDF if enabled) and
+        close it.
+        
+        Args:
+            fig: Matplotlib figure
+            save_path: Destination PNG path
+        """
+        fig.savefig(save_path, dpi=PLOT_DPI, bbox_inches='tight')
+        if self.save_pdf:
+            fig.savefig(os.path.splitext(save_path)[0] + '.pdf', bbox_inches='tight')
+        plt.close(fig)
+    
+    def _draw_confusion_matrix(
+        self,
+        fig: Any,
+        ax: Any,
+        cm: np.ndarray,
+        fmt: str,
+        cbar_label: Optional[str],
+        vmax: Optional[float] = None
+    ) -> Any:
+        """
+        Render a confusion matrix onto an axis with ``imshow``.
+        
+        Cell annotations are only drawn up to ``CM_ANNOTATE_MAX_CLASSES``
+        classes; beyond that the per-cell text objects dominate render time
+        and are unreadable anyway.
+        
+        Args:
+            fig: Figure owning the axis (for the colorbar)
+            ax: Matplotlib axis to draw on
+            cm: Confusion matrix (counts or proportions)
+            fmt: Format spec for cell annotations
+            cbar_label: Colorbar label (None skips the per-axis colorbar)
+            vmax: Upper color limit, to share one scale across axes
+            
+        Returns:
+            The image artist
+        """
+        n = len(self.label_names)
+        im = ax.imshow(cm, cmap='Blues', vmin=0 if vmax is not None else None, vmax=vmax)
+        if cbar_label is not None:
+            fig.colorbar(im, ax=ax, label=cbar_label)
+        
+        ax.set_xticks(range(n))
+        ax.set_xticklabels(self.label_names, rotation=45, ha='right')
+        ax.set_yticks(range(n))
+        ax.set_yticklabels(self.label_names)
+        ax.set_ylabel('True Label', fontsize=12)
+        ax.set_xlabel('Predicted Label', fontsize=12)
+        ax.grid(False)
+        
+        if n <= CM_ANNOTATE_MAX_CLASSES:
+            threshold = (vmax if vmax is not None else cm.max()) / 2.0
+            for (i, j), value in np.ndenumerate(cm):
+                ax.text(
+                    j, i, format(value, fmt),
+                    ha='center', va='center',
+                    color='white' if value > threshold else 'black'
+                )
+        
+        return im
+    
     def plot_all_confusion_matrices(
         self,
-        save_dir: str = "./artifacts"
+        save_dir: str = "./artifacts",
+        mode: str = "grid"
     ) -> Dict[str, str]:
         """
         Plot confusion matrices for all evaluated models.
         
+        In ``'grid'`` mode all models are drawn as subplots of one figure that
+        shares a single color scale and colorbar, so only one PNG is encoded.
+        ``'individual'`` writes one figure per model.
+        
         Args:
             save_dir: Directory to save plots
+            mode: ``'grid'`` (default) or ``'individual'``
             
         Returns:
             Dictionary mapping model names to plot paths
         """
+        if mode not in ('grid', 'individual'):
+            raise ValueError(f"Unknown mode '{mode}'. Use 'grid' or 'individual'")
+        
         os.makedirs(save_dir, exist_ok=True)
         
         logger.info(f"\nGenerating confusion matrices for all models...")
-        plot_paths = {}
         
+        if mode == 'grid':
+            return self._plot_confusion_matrix_grid(save_dir)
+        
+        plot_paths = {}
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         for model_name in self.evaluation_results.keys():
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             save_path = os.path.join(
                 save_dir,
                 f"confusion_matrix_{model_name}_{timestamp}.png"
@@ -357,6 +1025,54 @@ class ModelEvaluator:
         logger.info(f"Generated {len(plot_paths)} confusion matrix plots")
         return plot_paths
     
+    def _plot_confusion_matrix_grid(self, save_dir: str) -> Dict[str, str]:
+        """
+        Draw every model's confusion matrix into one subplot grid.
+        
+        Args:
+            save_dir: Directory to save the plot
+            
+        Returns:
+            Dictionary mapping each model name to the shared grid path
+        """
+        model_names = list(self.evaluation_results.keys())
+        if not model_names:
+            logger.warning("No evaluation results available for confusion matrices")
+            return {}
+        
+        cols = int(np.ceil(np.sqrt(len(model_names))))
+        rows = int(np.ceil(len(model_names) / cols))
+        fig, axes = plt.subplots(
+            rows, cols,
+            figsize=(5 * cols, 4 * rows),
+            constrained_layout=True,
+            squeeze=False
+        )
+        
+        vmax = max(
+            self.evaluation_results[name]['confusion_matrix'].max()
+            for name in model_names
+        )
+        
+        im = None
+        for ax, model_name in zip(axes.flat, model_names):
+            cm = self.evaluation_results[model_name]['confusion_matrix']
+            im = self._draw_confusion_matrix(fig, ax, cm, 'd', None, vmax=vmax)
+            ax.set_title(model_name, fontsize=14, fontweight='bold')
+        
+        for ax in axes.flat[len(model_names):]:
+            ax.axis('off')
+        
+        fig.colorbar(im, ax=axes, label='Count')
+        fig.suptitle('Confusion Matrices', fontsize=18, fontweight='bold')
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        save_path = os.path.join(save_dir, f"confusion_matrices_{timestamp}.png")
+        self._save_figure(fig, save_path)
+        
+        logger.info(f"Confusion matrix grid saved: {save_path}")
+        return {model_name: save_path for model_name in model_names}
+    
     def plot_model_comparison(
         self,
         save_path: Optional[str] = None
@@ -389,7 +1105,7 @@ class ModelEvaluator:
             f1_scores.append(metrics['f1_macro'])
         
         # Create subplots
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig, axes = plt.subplots(2, 2, figsize=(16, 12), sharex=True)
         fig.suptitle('Model Performance Comparison', fontsize=18, fontweight='bold')
         
         metrics_data = [
@@ -406,17 +1122,12 @@ class ModelEvaluator:
             ax.set_ylim([0, 1])
             ax.grid(axis='y', alpha=0.3)
             
-            # Rotate x-axis labels
-            ax.set_xticklabels(models, rotation=45, ha='right')
-            
             # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(
-                    bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.3f}',
-                    ha='center', va='bottom', fontsize=10
-                )
+            ax.bar_label(bars, fmt='%.3f', padding=3, fontsize=10)
+        
+        # Shared x-axis: only the bottom row carries (rotated) tick labels
+        for ax in axes[-1, :]:
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         plt.tight_layout()
         
@@ -426,8 +1137,7 @@ class ModelEvaluator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             save_path = f"artifacts/model_comparison_{timestamp}.png"
         
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, save_path)
         
         logger.info(f"Model comparison plot saved: {save_path}")
         return save_path
@@ -443,10 +1153,14 @@ class ModelEvaluator:
             logger.warning("No evaluation results available")
             return "", {}
         
-        best_model = max(
-            self.evaluation_results.items(),
-            key=lambda x: x[1]['f1_macro']
+        names = list(self.evaluation_results)
+        f1_scores = np.fromiter(
+            (self.evaluation_results[name]['f1_macro'] for name in names),
+            dtype=np.float64,
+            count=len(names)
         )
+        best_name = names[int(f1_scores.argmax())]
+        best_model = (best_name, self.evaluation_results[best_name])
         
         logger.info("\n" + "="*60)
         logger.info("BEST MODEL IDENTIFICATION")
@@ -458,12 +1172,17 @@ class ModelEvaluator:
         
         return best_model
     
-    def export_results(self, output_dir: str = "./results"):
+    def export_results(self, output_dir: str = "./results", verbose: bool = False):
         """
         Export all evaluation results to files.
         
+        Per-class reports for every model are written as one long-format
+        table (Model, Label, Precision, Recall, F1-Score, Support) to CSV,
+        and to Parquet when a Parquet engine is installed.
+        
         Args:
             output_dir: Directory to save results
+            verbose: Also write the legacy per-model text reports
         """
         os.makedirs(output_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -474,27 +1193,83 @@ class ModelEvaluator:
         comparison_df.to_csv(comparison_path, index=False)
         logger.info(f"Comparison table saved: {comparison_path}")
         
-        # Export detailed reports for each model
-        for model_name in self.evaluation_results.keys():
-            report_path = os.path.join(output_dir, f"report_{model_name}_{timestamp}.txt")
-            with open(report_path, 'w') as f:
-                f.write(f"{'='*60}\n")
-                f.write(f"Classification Report - {model_name}\n")
-                f.write(f"{'='*60}\n\n")
+        if not self.evaluation_results:
+            logger.info(f"All results exported to {output_dir}")
+            return
+        
+        # Export detailed reports for all models in one table
+        report_frames = {
+            model_name: self._report_frame(metrics['classification_report'])
+            for model_name, metrics in self.evaluation_results.items()
+        }
+        reports_df = pd.concat(report_frames, names=['Model', 'Label']).reset_index()
+        
+        reports_path = os.path.join(output_dir, f"reports_{timestamp}.csv")
+        reports_df.to_csv(reports_path, index=False)
+        logger.info(f"Reports saved: {reports_path}")
+        
+        parquet_path = os.path.join(output_dir, f"reports_{timestamp}.parquet")
+        try:
+            reports_df.to_parquet(parquet_path, index=False)
+            logger.info(f"Reports saved: {parquet_path}")
+        except ImportError:
+            logger.warning("pyarrow/fastparquet not installed, skipping Parquet export")
+        
+        if verbose:
+            for model_name, frame in report_frames.items():
+                buffer = io.StringIO()
+                buffer.write(f"{'='*60}\n")
+                buffer.write(f"Classification Report - {model_name}\n")
+                buffer.write(f"{'='*60}\n\n")
+                buffer.write(frame.to_string())
+                buffer.write("\n")
                 
-                report = self.evaluation_results[model_name]['classification_report']
-                for label in self.label_names:
-                    metrics = report[label]
-                    f.write(f"{label}:\n")
-                    f.write(f"  Precision: {metrics['precision']:.4f}\n")
-                    f.write(f"  Recall:    {metrics['recall']:.4f}\n")
-                    f.write(f"  F1-Score:  {metrics['f1-score']:.4f}\n")
-                    f.write(f"  Support:   {int(metrics['support'])}\n\n")
-            
-            logger.info(f"Report saved: {report_path}")
+                report_path = os.path.join(output_dir, f"report_{model_name}_{timestamp}.txt")
+                with open(report_path, 'w') as f:
+                    f.write(buffer.getvalue())
+                
+                logger.info(f"Report saved: {report_path}")
+        
+        self.save(os.path.join(output_dir, f"evaluator_{timestamp}.joblib"))
         
         logger.info(f"All results exported to {output_dir}")
-
+    
+    def save(self, path: str) -> str:
+        """
+        Persist labels and evaluation results so reporting and plotting can be
+        re-run later without re-evaluating the models.
+        
+        Args:
+            path: Destination file path
+            
+        Returns:
+            Path to the saved state
+        """
+        joblib.dump(
+            {'label_names': self.label_names, 'results': self.evaluation_results},
+            path,
+            compress=STATE_COMPRESSION
+        )
+        logger.info(f"Evaluator state saved: {path}")
+        return path
+    
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'ModelEvaluator':
+        """
+        Restore an evaluator saved with ``save``.
+        
+        Args:
+            path: Path to the saved state
+            **kwargs: Extra constructor arguments (e.g. ``cache_dir``)
+            
+        Returns:
+            ModelEvaluator with ``evaluation_results`` populated
+        """
+        state = joblib.load(path)
+        evaluator = cls(state['label_names'], **kwargs)
+        evaluator.evaluation_results = state['results']
+        logger.info(f"Evaluator state loaded: {path} ({len(evaluator.evaluation_results)} models)")
+        return evaluator
 
 if __name__ == "__main__":
     logger.info("This module should be imported, not run directly.")
@@ -13,14 +13,23 @@ Date: February 28, 2026
 
 import logging
 import mlflow
-import mlflow.sklearn
-import mlflow.xgboost
+from mlflow.entities import Metric, Param
+from mlflow.tracking import MlflowClient
 from typing import Dict, Any, Optional, List
 import numpy as np
 import pandas as pd
+import functools
+import importlib
+import itertools
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-import matplotlib.pyplot as plt
+
+# Plotting libraries are imported on first use (see _load_plotting) so that
+# loggers which only record params/metrics or query runs start quickly
+plt = None
+sns = None
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +38,148 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# log_batch request limits enforced by the tracking server
+MAX_ENTITIES_PER_BATCH = 1000
+MAX_PARAMS_PER_BATCH = 100
+MAX_TAGS_PER_BATCH = 100
+
+# Parameter value types logged as-is, and sequence types logged as strings
+_SIMPLE_TYPES = (int, float, str, bool)
+_SEQ_TYPES = (list, tuple)
+
+# Local tracking default: a SQLite store is indexed, unlike the file store
+# which rescans mlruns/ directories on every search/log call
+DEFAULT_TRACKING_URI = "sqlite:///mlruns.db"
+
+# Runs returned by search_runs for comparisons, and how long results are reused
+MAX_COMPARE_RUNS = 50
+RUNS_CACHE_TTL = 30.0
+
+# Model class-name prefix -> MLflow flavor module; other models use mlflow.sklearn
+_FLAVOR_MAP = {
+    'XGB': 'mlflow.xgboost',
+    'LGBM': 'mlflow.lightgbm',
+    'CatBoost': 'mlflow.catboost',
+}
+_DEFAULT_FLAVOR = 'mlflow.sklearn'
+
+# Extra log_model arguments per flavor: XGBoost boosters as compact binary
+# JSON instead of a pickled estimator, sklearn pinned to cloudpickle
+_FLAVOR_LOG_KWARGS = {
+    'mlflow.xgboost': {'model_format': 'ubj'},
+    'mlflow.sklearn': {'serialization_format': 'cloudpickle'},
+}
+
+# Rows and parameter columns shown when logging a run comparison
+COMPARE_LOG_ROWS = 20
+COMPARE_LOG_PARAMS = 5
+
+# Threads used to upload run artifacts in the background
+ARTIFACT_UPLOAD_WORKERS = 4
+
+# Confusion matrix artifact size; a K x K heatmap needs no print resolution
+CM_FIGSIZE = (6, 5)
+CM_DPI = 120
+
+
+def _load_plotting():
+    """Import matplotlib (headless Agg backend) and, if installed, seaborn."""
+    global plt, sns
+    if plt is None:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as _plt
+        _plt.ioff()
+        try:
+            import seaborn as _sns
+        except ImportError:
+            _sns = None
+        plt, sns = _plt, _sns
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_flavor(model_cls: type) -> str:
+    """
+    Resolve the MLflow flavor module name for a model class (cached per class).
+    
+    Args:
+        model_cls: Model class
+        
+    Returns:
+        Dotted module name of the flavor
+    """
+    for cls in model_cls.__mro__:
+        for prefix, flavor in _FLAVOR_MAP.items():
+            if cls.__name__.startswith(prefix):
+                return flavor
+    return _DEFAULT_FLAVOR
+
+
+def _param_entities(params: Dict[str, Any]) -> List[Param]:
+    """
+    Convert loggable parameters to Param entities, skipping complex objects.
+    
+    Args:
+        params: Dictionary of parameters
+        
+    Returns:
+        List of Param entities
+    """
+    simple_params = []
+    for key, value in params.items():
+        if value is None or isinstance(value, _SIMPLE_TYPES):
+            simple_params.append(Param(key, str(value)))
+        elif isinstance(value, _SEQ_TYPES) and len(value) < 10:
+            simple_params.append(Param(key, str(value)))
+    return simple_params
+
+
+def _numeric_metrics(metrics: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Keep finite numeric metrics, filtering in one vectorized pass.
+    
+    Args:
+        metrics: Dictionary of metrics
+        
+    Returns:
+        Dictionary of metric name to float value
+    """
+    keys = list(metrics)
+    values = np.fromiter(
+        (v if isinstance(v, (int, float, np.number)) else np.nan
+         for v in metrics.values()),
+        dtype=np.float64,
+        count=len(keys)
+    )
+    mask = np.isfinite(values)
+    return dict(zip(
+        (keys[i] for i in np.flatnonzero(mask)),
+        values[mask].tolist()
+    ))
+
+
+def _existing_files(paths: List[str]) -> set:
+    """
+    Find which of the given paths are existing files, listing each parent
+    directory once instead of stat-ing every path.
+    
+    Args:
+        paths: File paths
+        
+    Returns:
+        Set of normalized paths that exist as files
+    """
+    existing = set()
+    for parent in {os.path.dirname(os.path.normpath(p)) for p in paths}:
+        try:
+            with os.scandir(parent or '.') as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        existing.add(os.path.normpath(os.path.join(parent, entry.name)))
+        except OSError:
+            continue
+    return existing
+
 
 class MLflowLogger:
     """
@@ -40,36 +191,63 @@ class MLflowLogger:
         run_id: Current run ID
     """
     
+    # Confusion matrix figures shared by all loggers; a figure is checked out
+    # while rendering and returned afterwards instead of being closed
+    _FIG_POOL: List[Any] = []
+    
     def __init__(
         self,
         experiment_name: str = "Resume_Authenticity_Experiment",
-        tracking_uri: Optional[str] = None
+        tracking_uri: Optional[str] = None,
+        runs_cache_ttl: float = RUNS_CACHE_TTL
     ):
         """
         Initialize MLflow logger with experiment configuration.
         
         Args:
             experiment_name: Name of the experiment
-            tracking_uri: MLflow tracking server URI (None for local)
+            tracking_uri: MLflow tracking server URI (None for a local SQLite
+                store; pass "file:./mlruns" for the legacy file store)
+            runs_cache_ttl: Seconds to reuse search_runs results in
+                compare_runs / get_best_run (0 disables caching)
         """
         self.experiment_name = experiment_name
-        self.tracking_uri = tracking_uri or "file:./mlruns"
+        self.tracking_uri = tracking_uri or DEFAULT_TRACKING_URI
         self.run_id = None
+        self.runs_cache_ttl = runs_cache_ttl
+        self._runs_cache = {}
+        
+        # Run names: one formatted timestamp per logger plus a counter, so
+        # runs started within the same second still get unique names
+        self._run_prefix = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._run_counter = itertools.count()
         
         # Set tracking URI
         mlflow.set_tracking_uri(self.tracking_uri)
+        self._client = MlflowClient()
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=ARTIFACT_UPLOAD_WORKERS,
+            thread_name_prefix="mlflow-artifacts"
+        )
         
-        # Create or get experiment
+        # Log params/metrics from a background thread so the fluent calls
+        # below return immediately instead of blocking on each store write
+        os.environ.setdefault("MLFLOW_ASYNC_LOGGING_THREADPOOL_SIZE", "10")
+        os.environ.setdefault("MLFLOW_ASYNC_LOGGING_BUFFERING_SECONDS", "2")
+        # Large model uploads can exceed the default artifact transfer timeout
+        os.environ.setdefault("MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT", "600")
         try:
-            experiment = mlflow.get_experiment_by_name(experiment_name)
-            if experiment is None:
-                self.experiment_id = mlflow.create_experiment(experiment_name)
-                logger.info(f"Created new experiment: {experiment_name}")
-            else:
-                self.experiment_id = experiment.experiment_id
-                logger.info(f"Using existing experiment: {experiment_name}")
-            
-            mlflow.set_experiment(experiment_name)
+            mlflow.config.enable_async_logging(True)
+            logger.info("MLflow async logging enabled")
+        except AttributeError:
+            logger.warning("MLflow version does not support async logging; logging synchronously")
+        
+        # Create or get experiment in one call (set_experiment creates it if
+        # missing and tolerates a concurrent trainer creating it first)
+        try:
+            experiment = mlflow.set_experiment(experiment_name)
+            self.experiment_id = experiment.experiment_id
+            logger.info(f"Using experiment: {experiment_name} (ID: {self.experiment_id})")
             
         except Exception as e:
             logger.error(f"Error setting up MLflow experiment: {str(e)}")
@@ -95,23 +273,22 @@ class MLflowLogger:
             Run ID
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            run_name = run_name or f"run_{timestamp}"
+            run_name = run_name or f"run_{self._run_prefix}_{next(self._run_counter)}"
             
-            mlflow.start_run(run_name=run_name)
-            self.run_id = mlflow.active_run().info.run_id
-            
-            # Add default tags
+            # Add default tags; the timestamp is this run's start time (the
+            # cached prefix only keeps generated run names unique)
             default_tags = {
                 "project": "Resume_Authenticity_Detection",
                 "framework": "scikit-learn",
-                "timestamp": timestamp
+                "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S")
             }
             
             if tags:
                 default_tags.update(tags)
             
-            mlflow.set_tags(default_tags)
+            # Tags are sent with the create-run request (no separate set_tags)
+            mlflow.start_run(run_name=run_name, tags=default_tags)
+            self.run_id = mlflow.active_run().info.run_id
             
             logger.info(f"Started MLflow run: {run_name} (ID: {self.run_id})")
             return self.run_id
@@ -121,15 +298,71 @@ class MLflowLogger:
             raise
     
     def end_run(self):
-        """End the current MLflow run."""
+        """
+        End the current MLflow run.
+        
+        ``mlflow.end_run()`` flushes any params/metrics still queued by async
+        logging, so everything logged for the run is persisted on return.
+        """
         try:
             if mlflow.active_run():
                 mlflow.end_run()
                 logger.info(f"Ended MLflow run: {self.run_id}")
                 self.run_id = None
+                self._runs_cache.clear()
         except Exception as e:
             logger.error(f"Error ending MLflow run: {str(e)}")
     
+    def _current_run_id(self) -> str:
+        """
+        Run to log against: the run started by this logger, else the active run.
+        
+        The fluent active run is thread-local, so callers that hand work to
+        the upload threads resolve the run ID here first and pass it along.
+        
+        Returns:
+            Run ID
+            
+        Raises:
+            RuntimeError: If no run is active
+        """
+        if self.run_id is not None:
+            return self.run_id
+        run = mlflow.active_run()
+        if run is None:
+            raise RuntimeError("No active MLflow run; call start_run() first")
+        return run.info.run_id
+    
+    def _log_batch(
+        self,
+        metrics: Optional[List[Metric]] = None,
+        params: Optional[List[Param]] = None,
+        tags: Optional[List[Any]] = None
+    ):
+        """
+        Send entities with as few log_batch requests as the server limits allow.
+        
+        Args:
+            metrics: Metric entities
+            params: Param entities
+            tags: RunTag entities
+        """
+        metrics, params, tags = metrics or [], params or [], tags or []
+        run_id = self._current_run_id()
+        
+        while metrics or params or tags:
+            params_chunk, params = params[:MAX_PARAMS_PER_BATCH], params[MAX_PARAMS_PER_BATCH:]
+            tags_chunk, tags = tags[:MAX_TAGS_PER_BATCH], tags[MAX_TAGS_PER_BATCH:]
+            n_metrics = MAX_ENTITIES_PER_BATCH - len(params_chunk) - len(tags_chunk)
+            metrics_chunk, metrics = metrics[:n_metrics], metrics[n_metrics:]
+            
+            self._client.log_batch(
+                run_id,
+                metrics=metrics_chunk,
+                params=params_chunk,
+                tags=tags_chunk
+            )
+    
     def log_parameters(self, params: Dict[str, Any]):
         """
         Log parameters to MLflow.
@@ -138,15 +371,8 @@ class MLflowLogger:
             params: Dictionary of parameters
         """
         try:
-            # Filter out complex objects
-            simple_params = {}
-            for key, value in params.items():
-                if isinstance(value, (int, float, str, bool)) or value is None:
-                    simple_params[key] = value
-                elif isinstance(value, (list, tuple)) and len(value) < 10:
-                    simple_params[key] = str(value)
-            
-            mlflow.log_params(simple_params)
+            simple_params = _param_entities(params)
+            self._log_batch(params=simple_params)
             logger.info(f"Logged {len(simple_params)} parameters to MLflow")
             
         except Exception as e:
@@ -161,15 +387,15 @@ class MLflowLogger:
             step: Optional step number
         """
         try:
-            # Filter out non-numeric values
-            numeric_metrics = {
-                k: float(v) for k, v in metrics.items()
-                if isinstance(v, (int, float, np.number)) and not np.isnan(v)
-            }
+            numeric_metrics = _numeric_metrics(metrics)
             
             if step is not None:
-                for key, value in numeric_metrics.items():
-                    mlflow.log_metric(key, value, step=step)
+                # One log_batch request instead of one per metric
+                timestamp = int(time.time() * 1000)
+                self._log_batch(metrics=[
+                    Metric(key, value, timestamp, step)
+                    for key, value in numeric_metrics.items()
+                ])
             else:
                 mlflow.log_metrics(numeric_metrics)
             
@@ -178,20 +404,30 @@ class MLflowLogger:
         except Exception as e:
             logger.error(f"Error logging metrics: {str(e)}")
     
-    def log_artifact(self, artifact_path: str, artifact_type: str = "general"):
+    def log_artifact(
+        self,
+        artifact_path: str,
+        artifact_type: str = "general",
+        run_id: Optional[str] = None
+    ):
         """
         Log an artifact (file) to MLflow.
         
         Args:
             artifact_path: Path to the artifact file
             artifact_type: Type of artifact for organization
+            run_id: Run to log to (defaults to the current run)
         """
         try:
-            if os.path.exists(artifact_path):
-                mlflow.log_artifact(artifact_path, artifact_path=artifact_type)
-                logger.info(f"Logged artifact: {artifact_path}")
-            else:
-                logger.warning(f"Artifact not found: {artifact_path}")
+            # No existence pre-check: the upload stats the file anyway
+            self._client.log_artifact(
+                run_id or self._current_run_id(),
+                artifact_path,
+                artifact_path=artifact_type
+            )
+            logger.info(f"Logged artifact: {artifact_path}")
+        except FileNotFoundError:
+            logger.warning(f"Artifact not found: {artifact_path}")
         except Exception as e:
             logger.error(f"Error logging artifact {artifact_path}: {str(e)}")
     
@@ -212,23 +448,18 @@ class MLflowLogger:
             input_example: Example input (optional)
         """
         try:
-            # Determine the appropriate logging function based on model type
+            # Determine the appropriate logging flavor based on model type
             model_type = type(model).__name__
-            
-            if 'XGB' in model_type:
-                mlflow.xgboost.log_model(
-                    model,
-                    artifact_path=model_name,
-                    signature=signature,
-                    input_example=input_example
-                )
-            else:
-                mlflow.sklearn.log_model(
-                    model,
-                    artifact_path=model_name,
-                    signature=signature,
-                    input_example=input_example
-                )
+            flavor_name = _resolve_flavor(type(model))
+            flavor = importlib.import_module(flavor_name)
+            
+            flavor.log_model(
+                model,
+                artifact_path=model_name,
+                signature=signature,
+                input_example=input_example,
+                **_FLAVOR_LOG_KWARGS.get(flavor_name, {})
+            )
             
             logger.info(f"Logged model: {model_name} ({model_type})")
             
@@ -239,7 +470,8 @@ class MLflowLogger:
         self,
         confusion_matrix: np.ndarray,
         model_name: str,
-        label_names: List[str]
+        label_names: List[str],
+        run_id: Optional[str] = None
     ):
         """
         Log confusion matrix as an artifact.
@@ -248,34 +480,52 @@ class MLflowLogger:
             confusion_matrix: Confusion matrix array
             model_name: Name of the model
             label_names: List of class labels
+            run_id: Run to log to (defaults to the current run)
         """
         try:
-            # Create confusion matrix plot
-            import seaborn as sns
-            plt.figure(figsize=(10, 8))
-            sns.heatmap(
-                confusion_matrix,
-                annot=True,
-                fmt='d',
-                cmap='Blues',
-                xticklabels=label_names,
-                yticklabels=label_names
-            )
-            plt.title(f'Confusion Matrix - {model_name}')
-            plt.ylabel('True Label')
-            plt.xlabel('Predicted Label')
-            
-            # Save to temporary file
-            temp_path = f"temp_cm_{model_name}.png"
-            plt.savefig(temp_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            
-            # Log as artifact
-            self.log_artifact(temp_path, "confusion_matrices")
+            # Check out a pooled figure (not managed by pyplot, so it is safe
+            # to render from upload threads); clf() also drops the old colorbar
+            _load_plotting()
+            try:
+                fig = MLflowLogger._FIG_POOL.pop()
+            except IndexError:
+                fig = plt.Figure(figsize=CM_FIGSIZE)
             
-            # Clean up
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            try:
+                fig.clf()
+                ax = fig.add_subplot()
+                
+                # Create confusion matrix plot
+                if sns is not None:
+                    sns.heatmap(
+                        confusion_matrix,
+                        annot=True,
+                        fmt='d',
+                        cmap='Blues',
+                        xticklabels=label_names,
+                        yticklabels=label_names,
+                        ax=ax
+                    )
+                else:
+                    im = ax.imshow(confusion_matrix, cmap='Blues')
+                    fig.colorbar(im, ax=ax)
+                    ax.set_xticks(range(len(label_names)), labels=label_names)
+                    ax.set_yticks(range(len(label_names)), labels=label_names)
+                    for (i, j), value in np.ndenumerate(confusion_matrix):
+                        ax.text(j, i, str(value), ha='center', va='center')
+                ax.set_title(f'Confusion Matrix - {model_name}')
+                ax.set_ylabel('True Label')
+                ax.set_xlabel('Predicted Label')
+                
+                # Stream straight to the artifact store (no temporary file)
+                self._client.log_figure(
+                    run_id or self._current_run_id(),
+                    fig,
+                    f"confusion_matrices/{model_name}.png",
+                    save_kwargs={'dpi': CM_DPI, 'bbox_inches': 'tight'}
+                )
+            finally:
+                MLflowLogger._FIG_POOL.append(fig)
             
             logger.info(f"Logged confusion matrix for {model_name}")
             
@@ -285,7 +535,8 @@ class MLflowLogger:
     def log_classification_report(
         self,
         report: Dict[str, Any],
-        model_name: str
+        model_name: str,
+        run_id: Optional[str] = None
     ):
         """
         Log classification report as text artifact.
@@ -293,33 +544,30 @@ class MLflowLogger:
         Args:
             report: Classification report dictionary
             model_name: Name of the model
+            run_id: Run to log to (defaults to the current run)
         """
         try:
-            # Convert report to formatted text
-            report_text = f"Classification Report - {model_name}\n"
-            report_text += "=" * 60 + "\n\n"
+            # Convert report to formatted text (collect parts, join once)
+            parts = [f"Classification Report - {model_name}\n", "=" * 60 + "\n\n"]
             
             for label, metrics in report.items():
                 if isinstance(metrics, dict):
-                    report_text += f"{label}:\n"
+                    parts.append(f"{label}:\n")
                     for metric_name, value in metrics.items():
                         if metric_name != 'support':
-                            report_text += f"  {metric_name}: {value:.4f}\n"
+                            parts.append(f"  {metric_name}: {value:.4f}\n")
                         else:
-                            report_text += f"  {metric_name}: {int(value)}\n"
-                    report_text += "\n"
-            
-            # Save to temporary file
-            temp_path = f"temp_report_{model_name}.txt"
-            with open(temp_path, 'w') as f:
-                f.write(report_text)
+                            parts.append(f"  {metric_name}: {int(value)}\n")
+                    parts.append("\n")
             
-            # Log as artifact
-            self.log_artifact(temp_path, "classification_reports")
+            report_text = "".join(parts)
             
-            # Clean up
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            # Stream straight to the artifact store (no temporary file)
+            self._client.log_text(
+                run_id or self._current_run_id(),
+                report_text,
+                f"classification_reports/{model_name}.txt"
+            )
             
             logger.info(f"Logged classification report for {model_name}")
             
@@ -350,32 +598,63 @@ class MLflowLogger:
             label_names: Class label names
             artifacts: List of artifact file paths
         """
+        futures = []
         try:
             # Start a new run for this model
-            run_name = f"{model_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            run_name = f"{model_name}_{self._run_prefix}_{next(self._run_counter)}"
             self.start_run(run_name=run_name, tags={'model_type': model_name})
             
-            # Log parameters
-            self.log_parameters(params)
-            
-            # Log metrics
-            self.log_metrics(metrics)
-            
-            # Log model
-            self.log_model(model, model_name)
-            
-            # Log confusion matrix if provided
+            # Log parameters and metrics together in one log_batch request
+            try:
+                timestamp = int(time.time() * 1000)
+                simple_params = _param_entities(params)
+                numeric_metrics = _numeric_metrics(metrics)
+                self._log_batch(
+                    metrics=[
+                        Metric(key, value, timestamp, 0)
+                        for key, value in numeric_metrics.items()
+                    ],
+                    params=simple_params
+                )
+                logger.info(
+                    f"Logged {len(simple_params)} parameters and "
+                    f"{len(numeric_metrics)} metrics to MLflow"
+                )
+            except Exception as e:
+                logger.error(f"Error logging parameters and metrics: {str(e)}")
+            
+            # Artifact uploads are independent of each other and of the model,
+            # so run them in the background while the model is logged. The
+            # upload threads cannot see this thread's active run, so they get
+            # its ID explicitly
+            run_id = self._current_run_id()
             if confusion_matrix is not None and label_names is not None:
-                self.log_confusion_matrix(confusion_matrix, model_name, label_names)
+                futures.append(self._io_pool.submit(
+                    self.log_confusion_matrix, confusion_matrix, model_name, label_names,
+                    run_id=run_id
+                ))
             
-            # Log classification report if provided
             if classification_report is not None:
-                self.log_classification_report(classification_report, model_name)
+                futures.append(self._io_pool.submit(
+                    self.log_classification_report, classification_report, model_name,
+                    run_id=run_id
+                ))
             
-            # Log additional artifacts
             if artifacts:
+                existing = _existing_files(artifacts)
                 for artifact_path in artifacts:
-                    self.log_artifact(artifact_path)
+                    if os.path.normpath(artifact_path) in existing:
+                        futures.append(self._io_pool.submit(
+                            self.log_artifact, artifact_path, run_id=run_id
+                        ))
+                    else:
+                        logger.warning(f"Artifact not found: {artifact_path}")
+            
+            # Log model
+            self.log_model(model, model_name)
+            
+            # Uploads must finish before the run is closed
+            self._wait_for_uploads(futures)
             
             # End run
             self.end_run()
@@ -384,8 +663,25 @@ class MLflowLogger:
             
         except Exception as e:
             logger.error(f"Error logging model experiment: {str(e)}")
+            self._wait_for_uploads(futures)
             self.end_run()  # Ensure run is ended even on error
     
+    def _wait_for_uploads(self, futures: List[Any]):
+        """
+        Block until background artifact uploads finish.
+        
+        A failed upload is logged and does not affect the others.
+        
+        Args:
+            futures: Futures returned by the upload pool
+        """
+        wait(futures)
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Background artifact upload failed: {str(e)}")
+    
     def log_dataset_info(self, dataset_info: Dict[str, Any]):
         """
         Log dataset information and statistics.
@@ -395,15 +691,39 @@ class MLflowLogger:
         """
         try:
             # Convert to parameters (MLflow doesn't directly support dicts)
-            for key, value in dataset_info.items():
-                if isinstance(value, (int, float, str, bool)):
-                    mlflow.log_param(f"dataset_{key}", value)
+            self._log_batch(params=[
+                Param(f"dataset_{key}", str(value))
+                for key, value in dataset_info.items()
+                if isinstance(value, _SIMPLE_TYPES)
+            ])
             
             logger.info("Logged dataset information")
             
         except Exception as e:
             logger.error(f"Error logging dataset info: {str(e)}")
     
+    def _search_runs(self, metric_name: str) -> pd.DataFrame:
+        """
+        Search experiment runs ordered by a metric, reusing recent results.
+        
+        Args:
+            metric_name: Metric to order runs by (descending)
+            
+        Returns:
+            DataFrame of at most MAX_COMPARE_RUNS runs
+        """
+        cached = self._runs_cache.get(metric_name)
+        if cached is not None and time.monotonic() - cached[0] < self.runs_cache_ttl:
+            return cached[1]
+        
+        runs = mlflow.search_runs(
+            experiment_ids=[self.experiment_id],
+            order_by=[f"metrics.{metric_name} DESC"],
+            max_results=MAX_COMPARE_RUNS
+        )
+        self._runs_cache[metric_name] = (time.monotonic(), runs)
+        return runs
+    
     def compare_runs(self, metric_name: str = "f1_macro") -> pd.DataFrame:
         """
         Compare all runs in the experiment based on a metric.
@@ -415,16 +735,18 @@ class MLflowLogger:
             DataFrame with run comparison
         """
         try:
-            # Search for all runs in the experiment
-            runs = mlflow.search_runs(
-                experiment_ids=[self.experiment_id],
-                order_by=[f"metrics.{metric_name} DESC"]
-            )
+            # Search for the top runs in the experiment
+            runs = self._search_runs(metric_name)
+            
+            # Log a compact projection; the full frame is returned to the caller
+            cols = ['run_id', 'start_time', f'metrics.{metric_name}']
+            cols += [c for c in runs.columns if c.startswith('params.')][:COMPARE_LOG_PARAMS]
+            cols = [c for c in cols if c in runs.columns]
             
             logger.info(f"\nExperiment Run Comparison (sorted by {metric_name}):")
-            logger.info("\n" + runs.to_string())
+            logger.info("\n" + runs[cols].head(COMPARE_LOG_ROWS).to_string())
             
-            return runs
+            return runs.copy()
             
         except Exception as e:
             logger.error(f"Error comparing runs: {str(e)}")
@@ -441,11 +763,7 @@ class MLflowLogger:
             Dictionary with best run information
         """
         try:
-            runs = mlflow.search_runs(
-                experiment_ids=[self.experiment_id],
-                order_by=[f"metrics.{metric_name} DESC"],
-                max_results=1
-            )
+            runs = self._search_runs(metric_name)
             
             if len(runs) > 0:
                 best_run = runs.iloc[0].to_dict()
@@ -477,9 +795,9 @@ class MLflowLogger:
             
             # Try sklearn first, then xgboost
             try:
-                model = mlflow.sklearn.load_model(model_uri)
+                model = importlib.import_module('mlflow.sklearn').load_model(model_uri)
             except:
-                model = mlflow.xgboost.load_model(model_uri)
+                model = importlib.import_module('mlflow.xgboost').load_model(model_uri)
             
             logger.info(f"Loaded model from run {run_id}")
             return model
@@ -12,17 +12,30 @@ Date: February 28, 2026
 """
 
 import logging
+import os
 import re
+import sys
+import functools
+import hashlib
+import itertools
 import pandas as pd
 import numpy as np
-from typing import Tuple, Optional
+from typing import Tuple, Optional, List, Callable, Dict
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
+from scipy import sparse
 from sklearn.preprocessing import LabelEncoder
 import nltk
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import word_tokenize
+
+try:
+    from lightlemma import lemmatize as light_lemmatize
+    LIGHTLEMMA_AVAILABLE = True
+except ImportError:
+    LIGHTLEMMA_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -31,6 +44,142 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Text cleaning patterns, compiled once and shared by the scalar and
+# vectorized cleaning paths
+_URL_RE = re.compile(r'http\S+|www\S+|https\S+', re.MULTILINE)
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_NONALPHA_RE = re.compile(r'[^a-zA-Z\s]')
+_WS_RE = re.compile(r'\s+')
+
+# Corpus size from which the token phase is split across worker processes;
+# below it, process start-up costs more than it saves
+PARALLEL_MIN_TEXTS = 5000
+
+# Dataset columns used by the pipeline, and their dtypes when loading
+REQUIRED_COLUMNS = ['resume_text', 'label']
+COLUMN_DTYPES = {'resume_text': 'string', 'label': 'category'}
+
+# Hashing vectorizer settings: feature space size and documents per
+# parallel transform chunk
+HASHING_N_FEATURES = 2 ** 20
+HASHING_CHUNK_SIZE = 10_000
+
+# Version of the on-disk cache of cleaned datasets (opt-in through
+# preprocess_pipeline's cache_dir); bump it whenever cleaning output changes
+PREPROCESS_CACHE_VERSION = 2
+
+# NLTK data used by the preprocessor, as (download id, nltk.data path)
+NLTK_RESOURCES = [
+    ('stopwords', 'corpora/stopwords'),
+    ('wordnet', 'corpora/wordnet'),
+    ('omw-1.4', 'corpora/omw-1.4'),
+]
+
+# Per-process lemmatizer and kept word -> lemma table for worker processes,
+# created on first use so no NLTK objects are pickled to the workers
+_worker_lemmatize = None
+_worker_lem_cache = {}
+
+
+@functools.cache
+def _ensure_nltk():
+    """
+    Download missing NLTK resources, once per process.
+    
+    Resources already on disk are detected with ``nltk.data.find`` so no
+    download (and no network round trip) is attempted for them.
+    """
+    for resource, path in NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            try:
+                nltk.download(resource, quiet=True)
+            except Exception as e:
+                logger.warning(f"Could not download NLTK resource '{resource}': {str(e)}")
+
+
+def _clean_token_lists(
+    texts: List[str],
+    stop_words: frozenset,
+    lemmatize: Callable[[str], str],
+    lemma_table: Dict[str, str]
+) -> List[List[str]]:
+    """
+    Tokenize normalized texts, drop stopwords and short words, and lemmatize.
+    
+    Filtering and lemmatization are resolved once per distinct word into
+    ``lemma_table``, which holds only the words that survive the filters.
+    The per-token work is then a membership test and a lookup in that one
+    dict, run through ``filter``/``map`` so no Python frame is entered per
+    token.
+    
+    Args:
+        texts: Normalized texts
+        stop_words: Stopwords to remove
+        lemmatize: Word lemmatization function
+        lemma_table: kept word -> lemma table shared across calls; must only
+            ever be filled by this function with the same ``stop_words``
+        
+    Returns:
+        Cleaned token lists, one per text
+    """
+    # Tokenization: normalized text is alphabetic words separated by single
+    # spaces, so Treebank tokenization would have nothing left to split
+    token_lists = [text.split() for text in texts]
+    
+    # Extend the table with the new vocabulary; short words and stopwords
+    # never enter it, so they are never lemmatized
+    for word in set(itertools.chain.from_iterable(token_lists)).difference(lemma_table):
+        if len(word) > 2 and word not in stop_words:
+            lemma_table[word] = lemmatize(word)
+    
+    keep = lemma_table.__contains__
+    lemma = lemma_table.__getitem__
+    return [list(map(lemma, filter(keep, tokens))) for tokens in token_lists]
+
+
+def _unigrams_bigrams(doc) -> List[str]:
+    """
+    Vectorizer analyzer: cleaned tokens plus adjacent-token bigrams.
+    
+    The pipeline passes the token lists from ``preprocess_texts`` directly,
+    so nothing is re-tokenized; bigrams are joined here instead of by
+    sklearn's n-gram generator. Cleaned strings (e.g. from ``clean_text``)
+    are accepted too and split on whitespace.
+    
+    Args:
+        doc: Cleaned token list or cleaned text
+        
+    Returns:
+        Unigram and ``first__second`` bigram terms
+    """
+    tokens = doc.split() if isinstance(doc, str) else list(doc)
+    return tokens + [f"{a}__{b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def _clean_chunk(texts: List[str], stop_words: frozenset) -> List[List[str]]:
+    """
+    Token phase of text cleaning for one chunk of normalized texts.
+    
+    Runs in joblib worker processes; the lemmatizer is built lazily once
+    per worker.
+    
+    Args:
+        texts: Normalized texts
+        stop_words: Stopwords to remove
+        
+    Returns:
+        Cleaned token lists
+    """
+    global _worker_lemmatize
+    if _worker_lemmatize is None:
+        _ensure_nltk()
+        _worker_lemmatize = (
+            light_lemmatize if LIGHTLEMMA_AVAILABLE else WordNetLemmatizer().lemmatize
+        )
+    return _clean_token_lists(texts, stop_words, _worker_lemmatize, _worker_lem_cache)
+
 
 class ResumePreprocessor:
     """
@@ -39,49 +188,83 @@ class ResumePreprocessor:
     Attributes:
         tfidf_vectorizer: TF-IDF vectorizer for feature extraction
         label_encoder: Encoder for converting labels to numeric format
-        lemmatizer: WordNet lemmatizer for text normalization
-        stop_words: Set of English stopwords
+        lemmatizer: WordNet lemmatizer for text normalization (used when
+            the rule-based ``lightlemma`` package is not installed)
+        stop_words: Frozen set of English stopwords
     """
     
-    def __init__(self, max_features: int = 5000):
+    def __init__(
+        self,
+        max_features: int = 5000,
+        n_jobs: int = -1,
+        vectorizer: str = 'tfidf'
+    ):
         """
         Initialize the preprocessor with necessary components.
         
         Args:
             max_features: Maximum number of features for TF-IDF vectorization
+            n_jobs: Worker processes for text cleaning of large corpora
+                (-1 for all cores, 1 to stay in-process)
+            vectorizer: 'tfidf' for a vocabulary-based TfidfVectorizer capped
+                at max_features, or 'hashing' for a stateless HashingVectorizer
+                + TfidfTransformer that is transformed in parallel chunks
+                (for corpora too large to build a vocabulary in memory)
         """
+        if vectorizer not in ('tfidf', 'hashing'):
+            raise ValueError(f"Unknown vectorizer: {vectorizer}")
+        
         self.max_features = max_features
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            ngram_range=(1, 2),
-            min_df=2,
-            max_df=0.95
-        )
+        self.n_jobs = n_jobs
+        self.vectorizer = vectorizer
+        if vectorizer == 'hashing':
+            self.tfidf_vectorizer = Pipeline([
+                ('hv', HashingVectorizer(
+                    n_features=HASHING_N_FEATURES,
+                    analyzer=_unigrams_bigrams,
+                    alternate_sign=False,
+                    norm=None,
+                    dtype=np.float32
+                )),
+                ('tfidf', TfidfTransformer(sublinear_tf=True))
+            ])
+        else:
+            self.tfidf_vectorizer = TfidfVectorizer(
+                max_features=max_features,
+                analyzer=_unigrams_bigrams,
+                min_df=2,
+                max_df=0.95,
+                dtype=np.float32
+            )
         self.label_encoder = LabelEncoder()
         self.lemmatizer = None
         self.stop_words = None
         
-        # Download required NLTK data
-        self._download_nltk_resources()
+        # Download required NLTK data (checked once per process)
+        _ensure_nltk()
         
         # Initialize NLTK components
         try:
             self.lemmatizer = WordNetLemmatizer()
-            self.stop_words = set(stopwords.words('english'))
+            # Immutable set of interned strings for the per-token membership test
+            self.stop_words = frozenset(sys.intern(w) for w in stopwords.words('english'))
+            
+            # Rule-based lemmatization avoids WordNet's on-disk lookups
+            self._lemmatize = (
+                light_lemmatize if LIGHTLEMMA_AVAILABLE else self.lemmatizer.lemmatize
+            )
+            logger.info(
+                f"Lemmatizer: {'lightlemma' if LIGHTLEMMA_AVAILABLE else 'WordNet'}"
+            )
+            
+            # kept word -> lemma, shared across all texts: resumes repeat the
+            # same vocabulary, so each distinct word is lemmatized only once
+            self._lem_cache = {}
             logger.info("NLTK components initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing NLTK components: {str(e)}")
             raise
     
-    def _download_nltk_resources(self):
-        """Download required NLTK resources if not already present."""
-        resources = ['stopwords', 'wordnet', 'punkt', 'omw-1.4', 'averaged_perceptron_tagger']
-        for resource in resources:
-            try:
-                nltk.download(resource, quiet=True)
-            except Exception as e:
-                logger.warning(f"Could not download NLTK resource '{resource}': {str(e)}")
-    
     def load_dataset(self, file_path: str) -> pd.DataFrame:
         """
         Load dataset from CSV file with validation.
@@ -98,15 +281,31 @@ class ResumePreprocessor:
         """
         try:
             logger.info(f"Loading dataset from: {file_path}")
-            df = pd.read_csv(file_path)
             
-            # Validate required columns
-            required_columns = ['resume_text', 'label']
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            # Validate required columns from the header before parsing rows
+            columns = pd.read_csv(file_path, nrows=0).columns
+            missing_columns = [col for col in REQUIRED_COLUMNS if col not in columns]
             
             if missing_columns:
                 raise ValueError(f"Missing required columns: {missing_columns}")
             
+            # Parse only the needed columns with explicit dtypes, using the
+            # multithreaded Arrow reader when pyarrow is installed
+            try:
+                df = pd.read_csv(
+                    file_path,
+                    usecols=REQUIRED_COLUMNS,
+                    dtype=COLUMN_DTYPES,
+                    engine='pyarrow'
+                )
+            except ImportError:
+                df = pd.read_csv(
+                    file_path,
+                    usecols=REQUIRED_COLUMNS,
+                    dtype=COLUMN_DTYPES,
+                    low_memory=False
+                )
+            
             logger.info(f"Dataset loaded successfully. Shape: {df.shape}")
             logger.info(f"Columns: {list(df.columns)}")
             
@@ -175,33 +374,55 @@ class ResumePreprocessor:
         text = text.lower()
         
         # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+        text = _URL_RE.sub('', text)
         
         # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        text = _EMAIL_RE.sub('', text)
         
         # Remove special characters and digits
-        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+        text = _NONALPHA_RE.sub(' ', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         
-        # Tokenization
-        try:
-            tokens = word_tokenize(text)
-        except Exception:
-            # Fallback to simple split if tokenization fails
-            tokens = text.split()
+        return ' '.join(self._process_tokens([text])[0])
+    
+    def _normalize_texts(self, texts: pd.Series) -> pd.Series:
+        """
+        Vectorized equivalent of the regex phase of ``clean_text``.
+        
+        Lowercasing and URL/email/special-character/whitespace removal run
+        column-wide through pandas string methods instead of once per row.
+        
+        Args:
+            texts: Series of raw resume texts
+            
+        Returns:
+            Series of normalized texts
+        """
+        texts = texts.astype('string').str.lower()
+        texts = texts.str.replace(_URL_RE, '', regex=True)
+        texts = texts.str.replace(_EMAIL_RE, '', regex=True)
+        texts = texts.str.replace(_NONALPHA_RE, ' ', regex=True)
+        texts = texts.str.replace(_WS_RE, ' ', regex=True).str.strip()
+        return texts.fillna('')
+    
+    def _process_tokens(self, texts: List[str]) -> List[List[str]]:
+        """
+        Tokenize normalized texts, remove stopwords and lemmatize.
         
+        Args:
+            texts: Texts already normalized by ``clean_text``/``_normalize_texts``
+            
+        Returns:
+            Cleaned token lists, one per text
+        """
         # Remove stopwords and lemmatize
         if self.lemmatizer and self.stop_words:
-            tokens = [
-                self.lemmatizer.lemmatize(word)
-                for word in tokens
-                if word not in self.stop_words and len(word) > 2
-            ]
+            return _clean_token_lists(texts, self.stop_words, self._lemmatize, self._lem_cache)
         
-        return ' '.join(tokens)
+        # Normalized text is already single-space separated tokens
+        return [text.split() for text in texts]
     
     def preprocess_texts(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -211,22 +432,40 @@ class ResumePreprocessor:
             df: Input DataFrame with resume_text column
             
         Returns:
-            DataFrame with cleaned texts
+            New DataFrame with a ``tokens`` column of cleaned token lists (kept
+            as lists so vectorization does not re-split joined text); the
+            input DataFrame is not modified
         """
         logger.info("Preprocessing resume texts...")
         
-        # Create a copy to avoid modifying the original
-        df = df.copy()
-        
         # Apply text cleaning
         total_resumes = len(df)
         logger.info(f"Cleaning {total_resumes} resume texts...")
         
-        df['cleaned_text'] = df['resume_text'].apply(self.clean_text)
+        # Regex normalization runs column-wide; only the token phase is per row
+        normalized = self._normalize_texts(df['resume_text'])
+        
+        n_workers = effective_n_jobs(self.n_jobs)
+        if n_workers > 1 and total_resumes >= PARALLEL_MIN_TEXTS:
+            logger.info(f"Cleaning in {n_workers} worker processes")
+            chunks = np.array_split(normalized.to_numpy(dtype=object), n_workers)
+            results = Parallel(n_jobs=n_workers)(
+                delayed(_clean_chunk)(chunk.tolist(), self.stop_words)
+                for chunk in chunks
+            )
+            tokens = list(itertools.chain.from_iterable(results))
+        else:
+            tokens = self._process_tokens(normalized.tolist())
+        
+        # assign() returns a new frame sharing the existing columns, so the
+        # caller's df is left untouched without copying all resume text
+        df = df.assign(tokens=tokens)
         
-        # Remove empty texts after cleaning
+        # Remove empty texts after cleaning, via a plain NumPy boolean mask
+        # of token counts (no intermediate Series to align on)
         initial_count = len(df)
-        df = df[df['cleaned_text'].str.strip() != '']
+        mask = df['tokens'].str.len().to_numpy() > 0
+        df = df.loc[mask]
         final_count = len(df)
         
         if initial_count > final_count:
@@ -244,27 +483,31 @@ class ResumePreprocessor:
             df: Input DataFrame with label column
             
         Returns:
-            DataFrame with encoded labels
+            New DataFrame with a ``label_encoded`` column; the input
+            DataFrame is not modified
         """
         logger.info("Encoding labels...")
         
-        df = df.copy()
+        # Categories are sorted explicitly so the codes match LabelEncoder's
+        # mapping; a loaded category dtype (e.g. from the Arrow reader) may
+        # list them in order of appearance instead
+        classes = pd.Index(sorted(df['label'].dropna().unique())).to_numpy()
+        labels = pd.Series(
+            pd.Categorical(df['label'], categories=classes),
+            index=df.index
+        )
         
         # Log unique labels
-        unique_labels = df['label'].unique()
-        logger.info(f"Unique labels found: {unique_labels}")
+        logger.info(f"Unique labels found: {classes}")
         
-        # Encode labels
-        df['label_encoded'] = self.label_encoder.fit_transform(df['label'])
+        # Encode labels (codes use the smallest integer dtype, int8 for up to
+        # 127 classes); the fitted LabelEncoder keeps inverse_transform and
+        # classes_ available to callers
+        df = df.assign(label_encoded=labels.cat.codes)
+        self.label_encoder.classes_ = classes
         
         # Log encoding mapping
-        label_mapping = {
-            label: encoded
-            for label, encoded in zip(
-                self.label_encoder.classes_,
-                range(len(self.label_encoder.classes_))
-            )
-        }
+        label_mapping = {label: encoded for encoded, label in enumerate(classes)}
         logger.info(f"Label encoding mapping: {label_mapping}")
         
         return df
@@ -278,23 +521,36 @@ class ResumePreprocessor:
         Convert text to TF-IDF features.
         
         Args:
-            train_texts: Training text data
-            test_texts: Testing text data (optional)
+            train_texts: Training token lists (or cleaned texts)
+            test_texts: Testing token lists (or cleaned texts) (optional)
             
         Returns:
             Tuple of (train_features, test_features)
         """
-        logger.info(f"Vectorizing texts using TF-IDF (max_features={self.max_features})...")
+        if self.vectorizer == 'hashing':
+            logger.info(f"Vectorizing texts using hashed TF-IDF (n_features={HASHING_N_FEATURES})...")
+        else:
+            logger.info(f"Vectorizing texts using TF-IDF (max_features={self.max_features})...")
         
         try:
             # Fit and transform training data
-            X_train = self.tfidf_vectorizer.fit_transform(train_texts)
+            if self.vectorizer == 'hashing':
+                X_train = self.tfidf_vectorizer.named_steps['tfidf'].fit_transform(
+                    self._hash_texts(train_texts)
+                )
+            else:
+                X_train = self.tfidf_vectorizer.fit_transform(train_texts)
             logger.info(f"Training features shape: {X_train.shape}")
             
             # Transform test data if provided
             X_test = None
             if test_texts is not None:
-                X_test = self.tfidf_vectorizer.transform(test_texts)
+                if self.vectorizer == 'hashing':
+                    X_test = self.tfidf_vectorizer.named_steps['tfidf'].transform(
+                        self._hash_texts(test_texts)
+                    )
+                else:
+                    X_test = self.tfidf_vectorizer.transform(test_texts)
                 logger.info(f"Testing features shape: {X_test.shape}")
             
             return X_train, X_test
@@ -303,6 +559,33 @@ class ResumePreprocessor:
             logger.error(f"Error during vectorization: {str(e)}")
             raise
     
+    def _hash_texts(self, texts: pd.Series) -> sparse.csr_matrix:
+        """
+        Hash texts to raw term counts, transforming chunks in parallel.
+        
+        HashingVectorizer is stateless, so chunks are independent and the
+        resulting CSR blocks are stacked in order.
+        
+        Args:
+            texts: Cleaned texts
+            
+        Returns:
+            Sparse count matrix
+        """
+        hasher = self.tfidf_vectorizer.named_steps['hv']
+        texts = list(texts)
+        chunks = [
+            texts[i:i + HASHING_CHUNK_SIZE]
+            for i in range(0, len(texts), HASHING_CHUNK_SIZE)
+        ]
+        if len(chunks) <= 1:
+            return hasher.transform(texts)
+        
+        blocks = Parallel(n_jobs=self.n_jobs)(
+            delayed(hasher.transform)(chunk) for chunk in chunks
+        )
+        return sparse.vstack(blocks, format='csr')
+    
     def split_dataset(
         self,
         df: pd.DataFrame,
@@ -322,7 +605,7 @@ class ResumePreprocessor:
         """
         logger.info(f"Splitting dataset (test_size={test_size}, stratified)...")
         
-        X = df['cleaned_text']
+        X = df['tokens']
         y = df['label_encoded']
         
         X_train, X_test, y_train, y_test = train_test_split(
@@ -335,19 +618,18 @@ class ResumePreprocessor:
         logger.info(f"Training samples: {len(X_train)}")
         logger.info(f"Testing samples: {len(X_test)}")
         
-        # Log class distribution
-        train_dist = y_train.value_counts().sort_index()
-        test_dist = y_test.value_counts().sort_index()
-        
-        logger.info("Training set distribution:")
-        for idx, count in train_dist.items():
-            label_name = self.label_encoder.classes_[idx]
-            logger.info(f"  {label_name}: {count} ({count/len(y_train)*100:.2f}%)")
-        
-        logger.info("Testing set distribution:")
-        for idx, count in test_dist.items():
-            label_name = self.label_encoder.classes_[idx]
-            logger.info(f"  {label_name}: {count} ({count/len(y_test)*100:.2f}%)")
+        # Log class distribution; codes are 0..n_classes-1, so one bincount
+        # per split gives the counts (skipped entirely when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            classes = self.label_encoder.classes_
+            for split_name, y_split in (("Training", y_train), ("Testing", y_test)):
+                counts = np.bincount(
+                    y_split.to_numpy().astype(np.intp, copy=False),
+                    minlength=len(classes)
+                )
+                logger.info(f"{split_name} set distribution:")
+                for label_name, count in zip(classes, counts):
+                    logger.info(f"  {label_name}: {count} ({count/len(y_split)*100:.2f}%)")
         
         return X_train, X_test, y_train, y_test
     
@@ -381,20 +663,114 @@ class ResumePreprocessor:
             logger.info(f"  {label}: {count} ({percentage:.2f}%)")
         
         logger.info("\nText Statistics:")
-        df['text_length'] = df['cleaned_text'].str.split().str.len()
-        logger.info(f"  Average words per resume: {df['text_length'].mean():.2f}")
-        logger.info(f"  Min words: {df['text_length'].min()}")
-        logger.info(f"  Max words: {df['text_length'].max()}")
-        logger.info(f"  Median words: {df['text_length'].median():.2f}")
+        # Computed locally so the caller's df is untouched
+        text_length = df['tokens'].str.len().astype('int32')
+        logger.info(f"  Average words per resume: {text_length.mean():.2f}")
+        logger.info(f"  Min words: {text_length.min()}")
+        logger.info(f"  Max words: {text_length.max()}")
+        logger.info(f"  Median words: {text_length.median():.2f}")
         
         logger.info("\n" + "="*50)
 
 
+@functools.cache
+def _code_fingerprint() -> str:
+    """Hash of this module's source, so edits to the cleaning code miss the cache."""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _cache_path(file_path: str, cache_dir: str, preprocessor: ResumePreprocessor) -> str:
+    """
+    Cache file for the cleaned version of a dataset.
+    
+    The key covers the file's path, modification time and size, the cache
+    version, a hash of this module's source and the preprocessing config
+    (vectorizer settings, lemmatizer backend, loaded columns), so any change
+    to the input, the code or the settings maps to a new entry.
+    
+    Args:
+        file_path: Path to the dataset CSV file
+        cache_dir: Cache directory
+        preprocessor: Preprocessor whose settings the entry is built with
+        
+    Returns:
+        Path of the cache file
+    """
+    stat = os.stat(file_path)
+    config = {
+        'version': PREPROCESS_CACHE_VERSION,
+        'code': _code_fingerprint(),
+        'lemmatizer': 'lightlemma' if LIGHTLEMMA_AVAILABLE else 'wordnet',
+        'vectorizer': preprocessor.vectorizer,
+        'max_features': preprocessor.max_features,
+        'columns': COLUMN_DTYPES,
+    }
+    key = hashlib.sha256(
+        f"{os.path.abspath(file_path)}:{stat.st_mtime}:{stat.st_size}:"
+        f"{sorted(config.items())}".encode()
+    ).hexdigest()[:16]
+    return os.path.join(cache_dir, f"cleaned_{key}.pkl")
+
+
+def _load_cleaned(
+    preprocessor: ResumePreprocessor,
+    file_path: str,
+    cache_dir: Optional[str]
+) -> pd.DataFrame:
+    """
+    Load, validate and clean a dataset, reusing a cached result if present.
+    
+    Args:
+        preprocessor: Preprocessor used on a cache miss
+        file_path: Path to the dataset CSV file
+        cache_dir: Cache directory, or None to always recompute
+        
+    Returns:
+        DataFrame with missing values handled and a ``tokens`` column
+    """
+    cache_file = None
+    if cache_dir and os.path.exists(file_path):
+        cache_file = _cache_path(file_path, cache_dir, preprocessor)
+    
+    if cache_file and os.path.exists(cache_file):
+        try:
+            df = pd.read_pickle(cache_file)
+            logger.info(f"Loaded cleaned dataset from cache: {cache_file} ({len(df)} resumes)")
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable preprocessing cache {cache_file}: {str(e)}")
+    
+    # Load dataset
+    df = preprocessor.load_dataset(file_path)
+    
+    # Handle missing values
+    df = preprocessor.handle_missing_values(df)
+    
+    # Preprocess texts
+    df = preprocessor.preprocess_texts(df)
+    
+    if cache_file:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename so an interrupted run never leaves a partial entry
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            df.to_pickle(tmp_file)
+            os.replace(tmp_file, cache_file)
+            logger.info(f"Cached cleaned dataset to: {cache_file}")
+        except OSError as e:
+            logger.warning(f"Could not write preprocessing cache {cache_file}: {str(e)}")
+    
+    return df
+
+
 def preprocess_pipeline(
     file_path: str,
     test_size: float = 0.2,
     max_features: int = 5000,
-    random_state: int = 42
+    random_state: int = 42,
+    vectorizer: str = 'tfidf',
+    cache_dir: Optional[str] = None
 ) -> dict:
     """
     Execute complete preprocessing pipeline.
@@ -404,6 +780,10 @@ def preprocess_pipeline(
         test_size: Proportion for test split
         max_features: Maximum TF-IDF features
         random_state: Random state for reproducibility
+        vectorizer: 'tfidf' or 'hashing' (see ResumePreprocessor)
+        cache_dir: Opt-in directory caching the cleaned dataset between
+            runs, keyed by the input file, the module source and the
+            preprocessing config (None, the default, disables it)
         
     Returns:
         Dictionary containing processed data and preprocessor
@@ -412,18 +792,12 @@ def preprocess_pipeline(
     
     try:
         # Initialize preprocessor
-        preprocessor = ResumePreprocessor(max_features=max_features)
-        
-        # Load dataset
-        df = preprocessor.load_dataset(file_path)
-        
-        # Handle missing values
-        df = preprocessor.handle_missing_values(df)
+        preprocessor = ResumePreprocessor(max_features=max_features, vectorizer=vectorizer)
         
-        # Preprocess texts
-        df = preprocessor.preprocess_texts(df)
+        # Load and clean dataset (skipped on a warm cache)
+        df = _load_cleaned(preprocessor, file_path, cache_dir)
         
-        # Encode labels
+        # Encode labels (cheap, and restores the fitted label encoder)
         df = preprocessor.encode_labels(df)
         
         # Print summary
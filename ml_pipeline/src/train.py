@@ -13,19 +13,33 @@ Author: ML Engineering Team
 Date: February 28, 2026
 """
 
+import functools
+import importlib.util
+import json
 import logging
+import pickle
+import sys
+import warnings
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.neural_network import MLPClassifier
+from scipy import sparse
+from typing import Dict, List, Tuple, Any, Optional, Union
+
+# Estimators are looked up through their modules when the models are built,
+# so an accelerator patched in by ModelTrainer is picked up
+from sklearn import ensemble, linear_model, neural_network
 from sklearn.model_selection import StratifiedKFold, cross_validate
+from sklearn.base import clone
+from sklearn.exceptions import ConvergenceWarning
 import xgboost as xgb
 import joblib
+from joblib import Parallel, cpu_count, delayed
+from threadpoolctl import threadpool_info, threadpool_limits
 import os
 from datetime import datetime
 
+from ._mlp_numba import NUMBA_AVAILABLE, NumbaMLPClassifier
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,6 +47,195 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Opt-in drop-in acceleration of the sklearn estimators: 'sklearnex' (Intel
+# oneDAL/MKL) or 'cuml' (RAPIDS cuml.accel). Read by ModelTrainer, never at
+# import, so importing this package leaves sklearn untouched
+SKLEARN_ACCELERATOR_ENV = 'ML_SKLEARN_ACCELERATOR'
+SKLEARN_ACCELERATORS = ('sklearnex', 'cuml')
+
+# MLP implementation: sklearn's MLPClassifier, or the opt-in Numba trainer in
+# _mlp_numba. Also read by ModelTrainer only, so the trained model's class
+# never depends on which packages happen to be installed
+MLP_BACKEND_ENV = 'ML_MLP_BACKEND'
+MLP_BACKENDS = ('sklearn', 'numba')
+
+# Models that parallelize over trees themselves; BLAS threads are capped to
+# one while they fit so nested pools don't oversubscribe the cores
+BLAS_CAPPED_MODELS = ('Random_Forest', 'XGBoost')
+
+# Columns of the cross-validation summary, in order
+METRIC_NAMES = (
+    'accuracy_mean', 'accuracy_std', 'precision_mean', 'precision_std',
+    'recall_mean', 'recall_std', 'f1_mean', 'f1_std'
+)
+
+# Compression for saved models: LZ4 when available (fast), otherwise zlib
+# which ships with Python
+MODEL_COMPRESSION = ('lz4', 3) if importlib.util.find_spec('lz4') else ('zlib', 3)
+
+
+@functools.cache
+def _xgb_cuda_available() -> bool:
+    """
+    Whether XGBoost can train on a CUDA device in this process.
+    
+    A CUDA-enabled build is required, and a one-round probe confirms a GPU
+    is actually visible (XGBoost silently falls back to CPU otherwise).
+    
+    Returns:
+        True if training with ``device='cuda'`` runs on the GPU
+    """
+    if not xgb.build_info().get('USE_CUDA'):
+        return False
+    
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            probe = xgb.train(
+                {'device': 'cuda', 'tree_method': 'hist'},
+                xgb.DMatrix(np.zeros((2, 1)), label=[0, 1]),
+                num_boost_round=1
+            )
+        device = json.loads(probe.save_config())['learner']['generic_param']['device']
+        return device.startswith('cuda')
+    except xgb.core.XGBoostError:
+        return False
+
+
+@functools.cache
+def _apply_sklearn_accelerator(name: str) -> Optional[str]:
+    """
+    Enable a drop-in sklearn accelerator for this process, once.
+    
+    Unsupported parameter combinations fall back to stock sklearn in both.
+    cuml.accel has to be installed before sklearn is first imported, so it
+    can only be enabled by launching with ``python -m cuml.accel``; here it
+    is merely detected.
+    
+    Args:
+        name: 'sklearnex' or 'cuml'
+        
+    Returns:
+        Name of the accelerator now active, or None if it is unavailable
+    """
+    if name == 'sklearnex':
+        try:
+            from sklearnex import patch_sklearn
+        except ImportError:
+            logger.warning("sklearnex requested but not installed; using stock sklearn")
+            return None
+        patch_sklearn()
+        return 'sklearnex'
+    
+    if 'cuml.accel' in sys.modules:
+        return 'cuml.accel'
+    logger.warning(
+        "cuml.accel must be enabled before sklearn is imported; "
+        "launch with 'python -m cuml.accel main.py'. Using stock sklearn"
+    )
+    return None
+
+
+def _compact_features(X: Any) -> Any:
+    """
+    Store features as float32, and CSR matrices with int32 indices.
+    
+    Halves the bytes streamed per pass for float64 input and matches the
+    index dtype sklearn's sparse kernels use, avoiding internal copies. The
+    caller's matrix is never modified in place.
+    
+    Args:
+        X: Dense array or sparse matrix
+        
+    Returns:
+        Compact feature matrix (X itself when already compact)
+    """
+    if X.dtype == np.float64:
+        X = X.astype(np.float32, copy=False)
+    
+    if (
+        sparse.issparse(X) and X.format == 'csr'
+        and X.indices.dtype != np.int32 and X.nnz < np.iinfo(np.int32).max
+    ):
+        X = sparse.csr_matrix(
+            (X.data, X.indices.astype(np.int32), X.indptr.astype(np.int32)),
+            shape=X.shape
+        )
+    
+    return X
+
+
+def _cross_validate_estimator(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    cv: Any,
+    n_jobs: int,
+    inner_threads: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Cross-validate a fresh, unfitted clone of an estimator.
+    
+    Module-level so joblib workers receive only the estimator, not the
+    whole trainer.
+    
+    Args:
+        model: Estimator to evaluate (left untouched)
+        X: Feature matrix
+        y: Labels
+        cv: Cross-validation splitter
+        n_jobs: Parallel jobs across folds
+        inner_threads: Cap on the estimator's own ``n_jobs`` and on the
+            BLAS/OpenMP pools while fitting, for callers that already run
+            several of these in parallel (None leaves both untouched)
+        
+    Returns:
+        Dictionary of mean and std for each metric
+    """
+    estimator = clone(model)
+    # Only estimators that set n_jobs themselves (the tree models' -1)
+    if inner_threads is not None and estimator.get_params().get('n_jobs') is not None:
+        estimator.set_params(n_jobs=inner_threads)
+    
+    scoring = ['accuracy', 'precision_macro', 'recall_macro', 'f1_macro']
+    with threadpool_limits(limits=inner_threads):
+        cv_results = cross_validate(
+            estimator, X, y,
+            cv=cv,
+            scoring=scoring,
+            n_jobs=n_jobs,
+            # At most one queued fold per worker, so pending tasks (each
+            # holding its own train/test slices) don't pile up in memory
+            pre_dispatch='n_jobs',
+            return_train_score=False
+        )
+    
+    # Calculate mean and std for each metric
+    return {
+        'accuracy_mean': cv_results['test_accuracy'].mean(),
+        'accuracy_std': cv_results['test_accuracy'].std(),
+        'precision_mean': cv_results['test_precision_macro'].mean(),
+        'precision_std': cv_results['test_precision_macro'].std(),
+        'recall_mean': cv_results['test_recall_macro'].mean(),
+        'recall_std': cv_results['test_recall_macro'].std(),
+        'f1_mean': cv_results['test_f1_macro'].mean(),
+        'f1_std': cv_results['test_f1_macro'].std(),
+    }
+
+
+def _try_cross_validate(*args) -> Tuple[Optional[Dict[str, float]], Optional[str]]:
+    """
+    ``_cross_validate_estimator`` that returns failures instead of raising,
+    so one failing model does not abort the other parallel workers.
+    
+    Returns:
+        Tuple of (results, error message); exactly one is None
+    """
+    try:
+        return _cross_validate_estimator(*args), None
+    except Exception as e:
+        return None, str(e)
+
 
 class ModelTrainer:
     """
@@ -42,16 +245,63 @@ class ModelTrainer:
         models: Dictionary of model instances
         trained_models: Dictionary of trained model objects
         model_results: Dictionary storing performance metrics
+        use_gpu: Whether XGBoost trains on a CUDA device
+        accelerator: sklearn accelerator in use ('sklearnex', 'cuml.accel')
+            or None
+        mlp_backend: MLP implementation in use ('sklearn' or 'numba')
     """
     
-    def __init__(self, random_state: int = 42):
+    def __init__(
+        self,
+        random_state: int = 42,
+        use_gpu: Union[bool, str] = False,
+        accelerator: Optional[str] = None,
+        mlp_backend: Optional[str] = None
+    ):
         """
         Initialize the model trainer with all classifiers.
         
         Args:
             random_state: Random state for reproducibility
+            use_gpu: Train XGBoost on a CUDA device. 'auto' probes for a
+                usable GPU and falls back to CPU; the default trains on CPU
+            accelerator: Drop-in sklearn accelerator to enable, 'sklearnex'
+                or 'cuml'; defaults to the ML_SKLEARN_ACCELERATOR environment
+                variable, and to stock sklearn when that is unset. Patching
+                is process-wide and applies to every model built afterwards
+            mlp_backend: 'sklearn' or 'numba' (the compiled sparse trainer);
+                defaults to the ML_MLP_BACKEND environment variable, and to
+                'sklearn' when that is unset. 'numba' falls back to sklearn
+                with a warning if numba is not installed
         """
+        if use_gpu not in (True, False, 'auto'):
+            raise ValueError(f"use_gpu must be True, False or 'auto', got {use_gpu!r}")
+        if accelerator is None:
+            accelerator = os.environ.get(SKLEARN_ACCELERATOR_ENV, '').strip().lower() or None
+        if accelerator is not None and accelerator not in SKLEARN_ACCELERATORS:
+            raise ValueError(
+                f"accelerator must be one of {SKLEARN_ACCELERATORS}, got {accelerator!r}"
+            )
+        if mlp_backend is None:
+            mlp_backend = os.environ.get(MLP_BACKEND_ENV, '').strip().lower() or 'sklearn'
+        if mlp_backend not in MLP_BACKENDS:
+            raise ValueError(f"mlp_backend must be one of {MLP_BACKENDS}, got {mlp_backend!r}")
+        if mlp_backend == 'numba' and not NUMBA_AVAILABLE:
+            logger.warning("Numba MLP requested but numba is not installed; using sklearn")
+            mlp_backend = 'sklearn'
+        
         self.random_state = random_state
+        self.use_gpu = _xgb_cuda_available() if use_gpu == 'auto' else use_gpu
+        self.accelerator = _apply_sklearn_accelerator(accelerator) if accelerator else None
+        self.mlp_backend = mlp_backend
+        logger.info(f"XGBoost device: {'cuda' if self.use_gpu else 'cpu'}")
+        logger.info(f"sklearn acceleration: {self.accelerator or 'none'}")
+        logger.info(f"MLP backend: {self.mlp_backend}")
+        for pool in threadpool_info():
+            logger.info(
+                f"Thread pool: {pool['internal_api']} ({pool['user_api']}), "
+                f"{pool['num_threads']} threads"
+            )
         self.models = self._initialize_models()
         self.trained_models = {}
         self.model_results = {}
@@ -65,18 +315,38 @@ class ModelTrainer:
         Returns:
             Dictionary of model instances
         """
+        # Shared MLP settings; the opt-in Numba implementation trains on the
+        # sparse TF-IDF matrix directly. Both implementations train in float32 (sklearn's MLP keeps the
+        # dtype of the compacted features); bfloat16 is not used since
+        # neither numpy nor Numba has a native type for it
+        mlp_params = dict(
+            hidden_layer_sizes=(128, 64, 32),
+            alpha=0.0001,
+            batch_size=64,
+            learning_rate_init=0.001,
+            max_iter=500,
+            random_state=self.random_state,
+            early_stopping=True,
+            validation_fraction=0.1,
+            n_iter_no_change=20
+        )
+        
         models = {
-            'Logistic_Regression': LogisticRegression(
+            # saga updates straight from the CSR rows; multinomial and L2
+            # (l1_ratio=0) are the defaults. TF-IDF rows are already
+            # L2-normalized, which is what saga's step size depends on.
+            # max_iter keeps the original budget; train_model logs the
+            # epochs used and any ConvergenceWarning
+            'Logistic_Regression': linear_model.LogisticRegression(
                 max_iter=1000,
+                tol=1e-3,
                 random_state=self.random_state,
-                n_jobs=-1,
                 C=1.0,
-                solver='lbfgs',
-                multi_class='multinomial',
+                solver='saga',
                 class_weight='balanced'
             ),
             
-            'Random_Forest': RandomForestClassifier(
+            'Random_Forest': ensemble.RandomForestClassifier(
                 n_estimators=200,
                 max_depth=20,
                 min_samples_split=5,
@@ -87,31 +357,33 @@ class ModelTrainer:
                 max_features='sqrt'
             ),
             
+            # Histogram splits over at most 256 bins per feature, grown
+            # leaf-wise. With 'hist', fit() bins the data once into a
+            # QuantileDMatrix (on the device when use_gpu) that every
+            # boosting round reuses
             'XGBoost': xgb.XGBClassifier(
                 n_estimators=200,
                 max_depth=8,
                 learning_rate=0.1,
                 subsample=0.8,
                 colsample_bytree=0.8,
+                tree_method='hist',
+                max_bin=256,
+                grow_policy='lossguide',
+                device='cuda' if self.use_gpu else 'cpu',
                 random_state=self.random_state,
                 n_jobs=-1,
-                eval_metric='mlogloss',
-                use_label_encoder=False
+                eval_metric='mlogloss'
             ),
             
-            'Neural_Network': MLPClassifier(
-                hidden_layer_sizes=(128, 64, 32),
-                activation='relu',
-                solver='adam',
-                alpha=0.0001,
-                batch_size=64,
-                learning_rate='adaptive',
-                learning_rate_init=0.001,
-                max_iter=500,
-                random_state=self.random_state,
-                early_stopping=True,
-                validation_fraction=0.1,
-                n_iter_no_change=20
+            'Neural_Network': (
+                NumbaMLPClassifier(**mlp_params) if self.mlp_backend == 'numba'
+                else neural_network.MLPClassifier(
+                    activation='relu',
+                    solver='adam',
+                    learning_rate='adaptive',
+                    **mlp_params
+                )
             )
         }
         
@@ -155,13 +427,31 @@ class ModelTrainer:
                 logger.info(f"  Training data shape: {X_train.shape} (sparse)")
             else:
                 logger.info(f"  Training data shape: {X_train.shape}")
+            X_train = _compact_features(X_train)
             
-            # Train the model
-            model.fit(X_train, y_train)
+            # Train the model, collecting warnings so a non-converged
+            # iterative solver shows up in the training log
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always', ConvergenceWarning)
+                if model_name in BLAS_CAPPED_MODELS:
+                    with threadpool_limits(limits=1, user_api='blas'):
+                        model.fit(X_train, y_train)
+                else:
+                    model.fit(X_train, y_train)
             
             training_time = (datetime.now() - start_time).total_seconds()
             logger.info(f"  Training completed in {training_time:.2f} seconds")
             
+            if hasattr(model, 'n_iter_'):
+                logger.info(f"  Iterations: {int(np.max(model.n_iter_))}")
+            for warning in caught:
+                if issubclass(warning.category, ConvergenceWarning):
+                    logger.warning(f"  {model_name} did not converge: {warning.message}")
+                else:
+                    warnings.warn_explicit(
+                        warning.message, warning.category, warning.filename, warning.lineno
+                    )
+            
             # Store trained model
             self.trained_models[model_name] = model
             
@@ -205,7 +495,8 @@ class ModelTrainer:
         model_name: str,
         X: np.ndarray,
         y: np.ndarray,
-        cv_folds: int = 5
+        cv_folds: int = 5,
+        cv: Optional[List[Tuple[np.ndarray, np.ndarray]]] = None
     ) -> Dict[str, Any]:
         """
         Perform stratified K-fold cross-validation on a model.
@@ -215,6 +506,8 @@ class ModelTrainer:
             X: Feature matrix
             y: Labels
             cv_folds: Number of folds for cross-validation
+            cv: Precomputed (train_idx, test_idx) folds to use instead of
+                a fresh stratified split (e.g. shared across models)
             
         Returns:
             Dictionary containing cross-validation results
@@ -225,41 +518,12 @@ class ModelTrainer:
         logger.info(f"\nPerforming {cv_folds}-fold cross-validation on {model_name}...")
         
         try:
-            model = self.models[model_name]
-            
-            # Configure cross-validation
-            cv = StratifiedKFold(
-                n_splits=cv_folds,
-                shuffle=True,
-                random_state=self.random_state
-            )
-            
-            # Perform cross-validation
-            scoring = ['accuracy', 'precision_macro', 'recall_macro', 'f1_macro']
-            cv_results = cross_validate(
-                model, X, y,
-                cv=cv,
-                scoring=scoring,
-                n_jobs=-1,
-                return_train_score=False
-            )
-            
-            # Calculate mean and std for each metric
-            results = {
-                'accuracy_mean': cv_results['test_accuracy'].mean(),
-                'accuracy_std': cv_results['test_accuracy'].std(),
-                'precision_mean': cv_results['test_precision_macro'].mean(),
-                'precision_std': cv_results['test_precision_macro'].std(),
-                'recall_mean': cv_results['test_recall_macro'].mean(),
-                'recall_std': cv_results['test_recall_macro'].std(),
-                'f1_mean': cv_results['test_f1_macro'].mean(),
-                'f1_std': cv_results['test_f1_macro'].std(),
-            }
-            
-            logger.info(f"  Accuracy: {results['accuracy_mean']:.4f} (+/- {results['accuracy_std']:.4f})")
-            logger.info(f"  F1-Score: {results['f1_mean']:.4f} (+/- {results['f1_std']:.4f})")
-            logger.info(f"  Precision: {results['precision_mean']:.4f} (+/- {results['precision_std']:.4f})")
-            logger.info(f"  Recall: {results['recall_mean']:.4f} (+/- {results['recall_std']:.4f})")
+            # Perform cross-validation (folds in parallel)
+            if cv is None:
+                cv = self._cv_splitter(cv_folds)
+            X = _compact_features(X)
+            results = _cross_validate_estimator(self.models[model_name], X, y, cv, n_jobs=-1)
+            self._log_cv_results(results)
             
             return results
             
@@ -267,6 +531,34 @@ class ModelTrainer:
             logger.error(f"Error during cross-validation of {model_name}: {str(e)}")
             raise
     
+    def _cv_splitter(self, cv_folds: int) -> StratifiedKFold:
+        """
+        Configure stratified K-fold cross-validation.
+        
+        Args:
+            cv_folds: Number of folds
+            
+        Returns:
+            Shuffled StratifiedKFold splitter
+        """
+        return StratifiedKFold(
+            n_splits=cv_folds,
+            shuffle=True,
+            random_state=self.random_state
+        )
+    
+    def _log_cv_results(self, results: Dict[str, float]):
+        """
+        Log mean and std of each cross-validation metric.
+        
+        Args:
+            results: Dictionary from ``_cross_validate_estimator``
+        """
+        logger.info(f"  Accuracy: {results['accuracy_mean']:.4f} (+/- {results['accuracy_std']:.4f})")
+        logger.info(f"  F1-Score: {results['f1_mean']:.4f} (+/- {results['f1_std']:.4f})")
+        logger.info(f"  Precision: {results['precision_mean']:.4f} (+/- {results['precision_std']:.4f})")
+        logger.info(f"  Recall: {results['recall_mean']:.4f} (+/- {results['recall_std']:.4f})")
+    
     def cross_validate_all_models(
         self,
         X: np.ndarray,
@@ -288,19 +580,46 @@ class ModelTrainer:
         logger.info(f"K-FOLD CROSS-VALIDATION (k={cv_folds})")
         logger.info("="*60)
         
-        cv_results = {}
-        
-        for model_name in self.models.keys():
-            try:
-                results = self.cross_validate_model(model_name, X, y, cv_folds)
-                cv_results[model_name] = results
-            except Exception as e:
-                logger.error(f"Failed cross-validation for {model_name}: {str(e)}")
+        # One worker per model, each running its folds serially: the same
+        # work as fold-parallel CV per model, but a model that cannot keep
+        # every core busy no longer idles the rest. joblib memory-maps the
+        # large arrays of X for the workers instead of pickling them.
+        # Features are compacted as in train_model, so CV scores the same
+        # float32 / int32-index matrix the final fit sees
+        model_names = list(self.models.keys())
+        X = _compact_features(X)
+        
+        # Each worker's estimator threads (n_jobs=-1 for the tree models)
+        # and BLAS/OpenMP pools share the cores instead of each taking all
+        inner_threads = max(1, cpu_count() // len(model_names))
+        
+        # Fold indices are computed once and shared, so every model is scored
+        # on identical splits (as paired comparisons require)
+        cv = list(self._cv_splitter(cv_folds).split(X, y))
+        outcomes = Parallel(n_jobs=len(model_names))(
+            delayed(_try_cross_validate)(self.models[model_name], X, y, cv, 1, inner_threads)
+            for model_name in model_names
+        )
+        
+        # Summary rows are written straight into one preallocated array
+        scores = np.empty((len(model_names), len(METRIC_NAMES)))
+        scored_models = []
+        for model_name, (results, error) in zip(model_names, outcomes):
+            if error is not None:
+                logger.error(f"Failed cross-validation for {model_name}: {error}")
                 continue
+            
+            logger.info(f"\n{cv_folds}-fold cross-validation on {model_name}:")
+            self._log_cv_results(results)
+            scores[len(scored_models)] = [results[metric] for metric in METRIC_NAMES]
+            scored_models.append(model_name)
         
         # Create DataFrame for easy comparison
-        df_results = pd.DataFrame(cv_results).T
-        df_results = df_results.round(4)
+        df_results = pd.DataFrame(
+            scores[:len(scored_models)],
+            index=scored_models,
+            columns=list(METRIC_NAMES)
+        ).round(4)
         
         logger.info("\n" + "="*60)
         logger.info("CROSS-VALIDATION SUMMARY")
@@ -336,10 +655,22 @@ class ModelTrainer:
             os.makedirs(save_dir, exist_ok=True)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{model_name}_{timestamp}.joblib"
-            filepath = os.path.join(save_dir, filename)
+            model = self.trained_models[model_name]
             
-            joblib.dump(self.trained_models[model_name], filepath)
+            # XGBoost is saved only in its native JSON format, which loads
+            # without unpickling and across XGBoost versions; everything
+            # else is a compressed joblib pickle
+            if isinstance(model, xgb.XGBClassifier):
+                filepath = os.path.join(save_dir, f"{model_name}_{timestamp}.json")
+                model.save_model(filepath)
+            else:
+                filepath = os.path.join(save_dir, f"{model_name}_{timestamp}.joblib")
+                joblib.dump(
+                    model,
+                    filepath,
+                    compress=MODEL_COMPRESSION,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
             logger.info(f"Model saved: {filepath}")
             
             return filepath
@@ -377,13 +708,18 @@ class ModelTrainer:
         Load a trained model from disk.
         
         Args:
-            filepath: Path to the model file
+            filepath: Path to the model file (.json for XGBoost, as written
+                by save_model, otherwise a joblib file)
             
         Returns:
             Loaded model object
         """
         try:
-            model = joblib.load(filepath)
+            if filepath.endswith('.json'):
+                model = xgb.XGBClassifier()
+                model.load_model(filepath)
+            else:
+                model = joblib.load(filepath)
             logger.info(f"Model loaded from: {filepath}")
             return model
         except Exception as e:
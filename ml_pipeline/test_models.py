@@ -1,24 +1,123 @@
 import joblib
+import numpy as np
+import os
 import re
 import string
+import xgboost as xgb
+from scipy import sparse
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
 
-# Load models
-vectorizer = joblib.load('./models/tfidf_vectorizer.pkl')
-xgb_model = joblib.load('./models/xgboost_model.pkl')
-mlp_model = joblib.load('./models/neural_network_mlp_model.pkl')
+# Load models; mmap_mode maps the stored numpy arrays read-only from the page
+# cache instead of copying them (only works for uncompressed joblib files)
+vectorizer = joblib.load('./models/tfidf_vectorizer.pkl', mmap_mode='r')
+# XGBoost is saved in its native JSON format by the training pipeline
+xgb_model = xgb.XGBClassifier()
+xgb_model.load_model('./models/xgboost_model.json')
+mlp_model = joblib.load('./models/neural_network_mlp_model.pkl', mmap_mode='r')
+
+# Punctuation becomes a space and digits are dropped, in a single
+# str.translate pass; whitespace runs are then collapsed by one precompiled regex.
+# The backslash is kept, as in the previous f'[{string.punctuation}]' class
+# where it only escaped the ']'
+_PUNCTUATION = string.punctuation.replace('\\', '')
+_CLEAN_TABLE = str.maketrans(_PUNCTUATION, ' ' * len(_PUNCTUATION), string.digits)
+_WS_RE = re.compile(r'\s+')
 
 # Clean text function
 def clean_text(text):
-    text = text.lower()
-    text = re.sub(f'[{string.punctuation}]', ' ', text)
-    text = re.sub(r'\d+', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return _WS_RE.sub(' ', text.lower().translate(_CLEAN_TABLE)).strip()
+
+def clean_batch(texts):
+    return [_WS_RE.sub(' ', text.lower().translate(_CLEAN_TABLE)).strip() for text in texts]
+
+def quantize_activations(A):
+    # Asymmetric int8 quantization of one layer's input: scale and zero-point
+    # come from the batch's range, widened to include 0 so it stays exact
+    lo, hi = min(float(A.min()), 0.0), max(float(A.max()), 0.0)
+    scale = (hi - lo) / 255.0 or 1.0
+    zero_point = int(np.rint(-128 - lo / scale))
+    A_q = np.clip(np.rint(A / scale) + zero_point, -128, 127).astype(np.int8)
+    return A_q, np.float32(scale), zero_point
+
+class QuantizedMLP(ClassifierMixin, BaseEstimator):
+    # Inference-only ReLU MLP: int8 weights with a float32 scale per output
+    # unit, int8 activations quantized per layer, int32 accumulation
+    def __init__(self, layers):
+        self.layers = layers
+
+    def fit(self, X=None, y=None):
+        # Weights and classes_ come from quantize_mlp; there is nothing to fit
+        return self
+
+    def predict(self, X):
+        # Sparse TF-IDF rows are densified here, one tile at a time
+        A = X.toarray() if sparse.issparse(X) else np.asarray(X)
+        A = A.astype(np.float32, copy=False)
+        for i, (W_q, w_scale, w_colsum, b) in enumerate(self.layers):
+            A_q, a_scale, zero_point = quantize_activations(A)
+            acc = np.matmul(A_q, W_q, dtype=np.int32)
+            # (A_q - zp) @ W_q == A_q @ W_q - zp * colsum(W_q)
+            acc -= zero_point * w_colsum
+            A = acc.astype(np.float32) * (a_scale * w_scale) + b
+            if i < len(self.layers) - 1:
+                np.maximum(A, 0, out=A)
+        if A.shape[1] == 1:
+            # Binary sklearn MLPs have a single logistic output unit
+            return self.classes_[(A[:, 0] > 0).astype(int)]
+        return self.classes_[A.argmax(axis=1)]
+
+def quantize_mlp(model):
+    # Quantize a trained MLP's weights (sklearn or Numba) to int8, column by column
+    if hasattr(model, 'coefs_'):
+        if model.activation != 'relu':
+            raise ValueError(f"Only ReLU MLPs can be quantized, got '{model.activation}'")
+        weights = list(zip(model.coefs_, model.intercepts_))
+    else:
+        weights = [
+            (model._params[w:w + n_in * n_out].reshape(n_in, n_out), model._params[b:b + n_out])
+            for (n_in, n_out), w, b in zip(model._shapes, model._w_off, model._b_off)
+        ]
+
+    layers = []
+    for W, b in weights:
+        max_abs = np.abs(W).max(axis=0)
+        max_abs[max_abs == 0] = 1.0
+        W_q = np.rint(W * (127.0 / max_abs)).astype(np.int8)
+        layers.append((
+            W_q,
+            (max_abs / 127.0).astype(np.float32),
+            W_q.sum(axis=0, dtype=np.int32),
+            np.asarray(b, dtype=np.float32)
+        ))
+    quantized = QuantizedMLP(layers)
+    quantized.classes_ = np.asarray(model.classes_)
+    return quantized
+
+def build_pipeline(model):
+    # clean -> TF-IDF -> classifier as one estimator, scored on a whole batch
+    return Pipeline([
+        ('clean', FunctionTransformer(clean_batch)),
+        ('vec', vectorizer),
+        ('clf', model)
+    ])
+
+# Rows scored per predict call, so a tile of feature rows and the first
+# layer's weights stay cache-resident; override with BATCH_TILE
+BATCH_TILE = int(os.environ.get('BATCH_TILE', 1024))
+
+def tiled_predict(model, X, tile=BATCH_TILE):
+    # Predict in row tiles of at most `tile` and stitch the results together
+    return np.concatenate([model.predict(X[i:i + tile]) for i in range(0, len(X), tile)])
 
-# Test resume
-resume = "John Smith - Software Engineer at Google"
-cleaned = clean_text(resume)
-features = vectorizer.transform([cleaned])
+xgb_pipeline = build_pipeline(xgb_model)
+mlp_pipeline = build_pipeline(mlp_model)
+mlp_int8_pipeline = build_pipeline(quantize_mlp(mlp_model))
+
+# Test resumes
+resumes = ["John Smith - Software Engineer at Google"]
+features = xgb_pipeline[:-1].transform(resumes)
 
 print(f"Feature type: {type(features)}")
 print(f"Feature shape: {features.shape}")
@@ -26,7 +125,7 @@ print(f"Feature shape: {features.shape}")
 # Test each model
 print("\nTesting XGBoost:")
 try:
-    pred = xgb_model.predict(features)
+    pred = tiled_predict(xgb_pipeline, resumes)
     print(f"  Success: {pred}")
 except Exception as e:
     print(f"  Error: {e}")
@@ -35,9 +134,45 @@ except Exception as e:
 
 print("\nTesting MLP:")
 try:
-    pred = mlp_model.predict(features)
+    pred = tiled_predict(mlp_pipeline, resumes)
     print(f"  Success: {pred}")
 except Exception as e:
     print(f"  Error: {e}")
     import traceback
     traceback.print_exc()
+
+print("\nTesting MLP (int8):")
+try:
+    pred = tiled_predict(mlp_int8_pipeline, resumes)
+    print(f"  Success: {pred}")
+except Exception as e:
+    print(f"  Error: {e}")
+    import traceback
+    traceback.print_exc()
+
+# Float vs int8 MLP on the held-out split used by full_pipeline.py
+# (same test_size, random_state and stratification)
+ACCURACY_TOLERANCE = float(os.environ.get('INT8_ACCURACY_TOLERANCE', 0.01))
+
+print("\nComparing MLP float vs int8 accuracy:")
+if os.path.exists('./data/resume_dataset.csv'):
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import LabelEncoder
+
+    df = pd.read_csv('./data/resume_dataset.csv')
+    y_encoded = LabelEncoder().fit_transform(df['label'])
+    _, texts_test, _, y_test = train_test_split(
+        df['resume_text'].tolist(), y_encoded, test_size=0.2, random_state=42, stratify=y_encoded
+    )
+    float_pred = tiled_predict(mlp_pipeline, texts_test)
+    int8_pred = tiled_predict(mlp_int8_pipeline, texts_test)
+    float_acc = np.mean(float_pred == y_test)
+    int8_acc = np.mean(int8_pred == y_test)
+    status = "PASS" if float_acc - int8_acc <= ACCURACY_TOLERANCE else "FAIL"
+    print(f"  float32 accuracy: {float_acc:.4f}")
+    print(f"  int8 accuracy:    {int8_acc:.4f}")
+    print(f"  agreement:        {np.mean(float_pred == int8_pred):.4f}")
+    print(f"  {status}: accuracy drop {float_acc - int8_acc:+.4f} (tolerance {ACCURACY_TOLERANCE})")
+else:
+    print("  Skipped: ./data/resume_dataset.csv not found")
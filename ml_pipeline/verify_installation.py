@@ -9,7 +9,10 @@ Date: February 28, 2026
 """
 
 import sys
+import functools
 import importlib
+import importlib.metadata
+import importlib.util
 
 def print_header(text):
     """Print a formatted header."""
@@ -30,19 +33,40 @@ def check_python_version():
         print("    ✗ Python version is too old. Please upgrade to 3.10+")
         return False
 
-def check_package(package_name, import_name=None):
-    """Check if a package is installed."""
+@functools.cache
+def _distributions():
+    """Map top-level import names to installed distributions (read once)."""
+    return importlib.metadata.packages_distributions()
+
+def check_package(package_name, import_name=None, live_import=False):
+    """
+    Check if a package is installed.
+    
+    Presence is checked with find_spec and the version read from the
+    distribution metadata, so the package itself is never imported. With
+    live_import the package is also imported, which catches installs whose
+    native parts are broken even though the wheel is present.
+    """
     if import_name is None:
         import_name = package_name
     
-    try:
-        module = importlib.import_module(import_name)
-        version = getattr(module, '__version__', 'unknown')
-        print(f"    ✓ {package_name:20s} {version}")
-        return True
-    except ImportError:
+    if importlib.util.find_spec(import_name) is None:
         print(f"    ✗ {package_name:20s} NOT INSTALLED")
         return False
+    
+    if live_import:
+        try:
+            importlib.import_module(import_name)
+        except Exception as e:
+            print(f"    ✗ {package_name:20s} IMPORT FAILED: {e}")
+            return False
+    
+    try:
+        version = importlib.metadata.version(_distributions()[import_name][0])
+    except (KeyError, importlib.metadata.PackageNotFoundError):
+        version = 'unknown'
+    print(f"    ✓ {package_name:20s} {version}")
+    return True
 
 def check_core_packages():
     """Check all core ML packages."""
@@ -71,9 +95,11 @@ def check_nlp_packages():
         ('spaCy', 'spacy'),
     ]
     
+    # Both load compiled extensions and data on import, so they are
+    # actually imported rather than only located
     results = []
     for name, import_name in packages:
-        results.append(check_package(name, import_name))
+        results.append(check_package(name, import_name, live_import=True))
     
     # Check NLTK data
     if results[0]:  # If NLTK is installed
@@ -2,61 +2,74 @@
 """
 Simple HTTP server for testing - serves frontend with proxy to backend
 """
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-import json
 import os
-import urllib.parse
-import urllib.request
-
-class ProxyHandler(SimpleHTTPRequestHandler):
-    def do_GET(self):
-        if self.path.startswith('/api/'):
-            # Proxy to backend
-            backend_path = self.path[4:]  # Remove '/api' prefix
-            backend_url = f'http://127.0.0.1:8000{backend_path}'
-            try:
-                response = urllib.request.urlopen(backend_url)
-                self.send_response(response.status)
-                for header, value in response.headers.items():
-                    self.send_header(header, value)
-                self.end_headers()
-                self.wfile.write(response.read())
-            except Exception as e:
-                self.send_error(500, str(e))
-        else:
-            # Serve static files
-            if self.path == '/':
-                self.path = '/index.html'
-            super().do_GET()
-
-    def do_POST(self):
-        if self.path.startswith('/api/'):
-            # Proxy POST to backend
-            backend_path = self.path[4:]
-            backend_url = f'http://127.0.0.1:8000{backend_path}'
-            
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length)
-            
-            try:
-                req = urllib.request.Request(
-                    backend_url,
-                    data=body,
-                    headers={k: v for k, v in self.headers.items() if k.lower() not in ['host', 'content-length']}
-                )
-                response = urllib.request.urlopen(req)
-                self.send_response(response.status)
-                for header, value in response.headers.items():
-                    self.send_header(header, value)
-                self.end_headers()
-                self.wfile.write(response.read())
-            except urllib.error.HTTPError as e:
-                self.send_error(e.code, e.reason)
-            except Exception as e:
-                self.send_error(500, str(e))
+
+from aiohttp import ClientError, ClientSession, web
+from yarl import URL
+
+FRONTEND_DIR = '/c/Users/ACER/Desktop/UsMiniProject/frontend'
+BACKEND_URL = 'http://127.0.0.1:8000'
+
+# Proxied bodies are relayed in chunks of this size, never buffered whole
+PROXY_CHUNK_SIZE = 64 * 1024
+
+# Connection-level headers that must not be forwarded by a proxy
+HOP_BY_HOP_HEADERS = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailer', 'transfer-encoding', 'upgrade', 'host', 'content-length'
+}
+
+
+async def proxy_handler(request):
+    # Proxy to backend, streaming the request body up and the response down
+    backend_path = request.rel_url.raw_path_qs[4:]  # Remove '/api' prefix
+    backend_url = URL(f'{BACKEND_URL}{backend_path}', encoded=True)
+    headers = {k: v for k, v in request.headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+
+    try:
+        async with request.app['client'].request(
+            request.method,
+            backend_url,
+            headers=headers,
+            data=request.content if request.body_exists else None,
+            allow_redirects=False
+        ) as backend:
+            response = web.StreamResponse(status=backend.status, reason=backend.reason)
+            for header, value in backend.headers.items():
+                if header.lower() not in HOP_BY_HOP_HEADERS:
+                    response.headers.add(header, value)
+            await response.prepare(request)
+
+            async for chunk in backend.content.iter_chunked(PROXY_CHUNK_SIZE):
+                await response.write(chunk)
+            await response.write_eof()
+            return response
+    except ClientError as e:
+        raise web.HTTPInternalServerError(text=str(e))
+
+
+async def index_handler(request):
+    # Serve static files
+    return web.FileResponse(os.path.join(FRONTEND_DIR, 'index.html'))
+
+
+async def client_session(app):
+    # One pooled client for all proxied requests; bodies pass through
+    # undecoded so Content-Encoding can be forwarded as-is
+    app['client'] = ClientSession(auto_decompress=False)
+    yield
+    await app['client'].close()
+
+
+def create_app():
+    app = web.Application()
+    app.cleanup_ctx.append(client_session)
+    app.router.add_route('*', '/api/{path:.*}', proxy_handler)
+    app.router.add_get('/', index_handler)
+    app.router.add_static('/', FRONTEND_DIR)
+    return app
+
 
 if __name__ == '__main__':
-    os.chdir('/c/Users/ACER/Desktop/UsMiniProject/frontend')
-    server = HTTPServer(('127.0.0.1', 3000), ProxyHandler)
     print('Server running on http://127.0.0.1:3000/')
-    server.serve_forever()
+    web.run_app(create_app(), host='127.0.0.1', port=3000, print=None)
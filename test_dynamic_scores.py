@@ -4,10 +4,20 @@ Test Dynamic Trust Scores
 Upload multiple resumes and compare their trust scores
 """
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 API = "http://localhost:8000"
 
+# One pooled session per thread (requests.Session is not thread-safe)
+_local = threading.local()
+
+def get_session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
 print("=" * 60)
 print("TESTING DYNAMIC TRUST SCORES")
 print("=" * 60)
@@ -15,7 +25,7 @@ print("=" * 60)
 # Register user
 print("\n1. Registering user...")
 try:
-    res = requests.post(f"{API}/api/auth/register", json={
+    res = get_session().post(f"{API}/api/auth/register", json={
         "email": "scoretest@example.com",
         "password": "password123",
         "full_name": "Test User",
@@ -27,7 +37,7 @@ except:
 
 # Login
 print("\n2. Logging in...")
-res = requests.post(f"{API}/api/auth/login", json={
+res = get_session().post(f"{API}/api/auth/login", json={
     "email": "scoretest@example.com",
     "password": "password123"
 })
@@ -35,27 +45,34 @@ token = res.json()["access_token"]
 print(f"✅ Logged in")
 
 headers = {"Authorization": f"Bearer {token}"}
-scores = []
 
-# Upload multiple resumes with different filenames
-print("\n3. Uploading 5 different resumes...")
-for i in range(1, 6):
+def upload_and_score(i):
+    session = get_session()
     filename = f"resume_{i}.pdf"
     files = {"file": (filename, f"Sample content for resume {i}")}
     
-    res = requests.post(f"{API}/api/resumes/upload", files=files, headers=headers)
+    res = session.post(f"{API}/api/resumes/upload", files=files, headers=headers)
     resume_id = res.json()["resume_id"]
     
     # Wait a moment then get trust score
     time.sleep(0.5)
-    res = requests.get(f"{API}/api/resumes/{resume_id}", headers=headers)
+    res = session.get(f"{API}/api/resumes/{resume_id}", headers=headers)
     trust_score = res.json().get("trust_score", {})
     
-    score = trust_score.get("overall_score", "N/A")
-    verified = trust_score.get("verified_count", 0)
-    doubtful = trust_score.get("doubtful_count", 0)
-    fake = trust_score.get("fake_count", 0)
-    
+    return (
+        trust_score.get("overall_score", "N/A"),
+        trust_score.get("verified_count", 0),
+        trust_score.get("doubtful_count", 0),
+        trust_score.get("fake_count", 0),
+    )
+
+# Upload multiple resumes with different filenames, all at once
+print("\n3. Uploading 5 different resumes...")
+with ThreadPoolExecutor(max_workers=5) as executor:
+    results = list(executor.map(upload_and_score, range(1, 6)))
+
+scores = []
+for i, (score, verified, doubtful, fake) in enumerate(results, start=1):
     scores.append(score)
     print(f"   Resume {i}: Score={score} | Verified={verified} | Doubtful={doubtful} | Fake={fake}")
 
@@ -4,82 +4,155 @@ Frontend & Backend Integration Test
 Tests full authentication and upload workflow
 """
 import requests
+import contextlib
 import json
+import os
 import time
+from requests.adapters import HTTPAdapter
 
 API = "http://localhost:8000"
 TEST_EMAIL = f"test_{int(time.time())}@example.com"
 TEST_PASSWORD = "SecurePass123!"
 
-print("=" * 60)
-print("FRONTEND & BACKEND INTEGRATION TEST")
-print("=" * 60)
+# Resume uploaded by test 3; set UPLOAD_FILE to upload a real file from disk
+UPLOAD_FILE = os.getenv("UPLOAD_FILE")
 
-# Test 1: Register
-print("\n1. Testing User Registration...")
+# requests_toolbelt streams the multipart body from the file instead of
+# building it in memory first
 try:
-    res = requests.post(f"{API}/api/auth/register", json={
-        "email": TEST_EMAIL,
-        "password": TEST_PASSWORD,
-        "full_name": "Frontend Backend Test",
-        "gdpr_consent": True
-    })
-    if res.status_code == 200:
-        user = res.json()
-        print(f"✅ Registration OK")
-        print(f"   User ID: {user.get('user_id')}")
-    else:
-        print(f"⚠️  Status: {res.status_code}")
-        print(f"   Response: {res.json()}")
-except Exception as e:
-    print(f"❌ Error: {e}")
-
-# Test 2: Login
-print("\n2. Testing User Login...")
-token = None
-try:
-    res = requests.post(f"{API}/api/auth/login", json={
-        "email": TEST_EMAIL,
-        "password": TEST_PASSWORD
-    })
-    if res.status_code == 200:
-        data = res.json()
-        token = data.get("access_token")
-        print(f"✅ Login OK")
-        print(f"   Token: {token[:40]}...")
-        print(f"   Type: {data.get('token_type')}")
-    else:
-        print(f"❌ Error ({res.status_code}): {res.json()}")
-except Exception as e:
-    print(f"❌ Error: {e}")
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    MULTIPART_STREAMING = True
+except ImportError:
+    MULTIPART_STREAMING = False
+
+# One keep-alive session for the whole register -> login -> upload flow
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+# Cassette values that must never be written to disk; requests are matched
+# on method and URI, so scrubbed bodies still replay
+_SECRET_FIELDS = {"password", "access_token", "refresh_token"}
+_SCRUBBED = "<scrubbed>"
+
+def _scrub_json(body):
+    """Replace secret fields anywhere in a JSON body; other bodies pass through"""
+    try:
+        data = json.loads(body)
+    except (TypeError, ValueError):
+        return body
+
+    def scrub(value):
+        if isinstance(value, dict):
+            return {k: _SCRUBBED if k in _SECRET_FIELDS else scrub(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [scrub(v) for v in value]
+        return value
+
+    return json.dumps(scrub(data)).encode()
+
+def _scrub_request(request):
+    request.body = _scrub_json(request.body)
+    return request
+
+def _scrub_response(response):
+    response["body"]["string"] = _scrub_json(response["body"]["string"])
+    return response
+
+# Record/replay (vcrpy): with REPLAY_CASSETTES=1 the first run records the
+# HTTP exchange under tests/cassettes (gitignored) and later runs replay it
+# offline; credentials and tokens are scrubbed before anything is recorded
+if os.getenv("REPLAY_CASSETTES") == "1":
+    import vcr
+    CASSETTE = vcr.VCR(
+        cassette_library_dir=os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "cassettes"),
+        record_mode="new_episodes",
+        filter_headers=["authorization", "cookie", "set-cookie"],
+        before_record_request=_scrub_request,
+        before_record_response=_scrub_response
+    ).use_cassette("frontend_backend.yaml")
+else:
+    CASSETTE = contextlib.nullcontext()
 
-# Test 3: Upload with auth token
-if token:
-    print("\n3. Testing Authenticated Upload...")
+with SESSION, CASSETTE:
+    print("=" * 60)
+    print("FRONTEND & BACKEND INTEGRATION TEST")
+    print("=" * 60)
+
+    # Test 1: Register
+    print("\n1. Testing User Registration...")
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        files = {"file": ("test.txt", "Sample resume content")}
-        res = requests.post(f"{API}/api/resumes/upload", files=files, headers=headers)
+        res = SESSION.post(f"{API}/api/auth/register", json={
+            "email": TEST_EMAIL,
+            "password": TEST_PASSWORD,
+            "full_name": "Frontend Backend Test",
+            "gdpr_consent": True
+        })
         if res.status_code == 200:
-            upload = res.json()
-            print(f"✅ Upload OK")
-            print(f"   Resume ID: {upload.get('resume_id')}")
-            print(f"   Status: {upload.get('status')}")
+            user = res.json()
+            print(f"✅ Registration OK")
+            print(f"   User ID: {user.get('user_id')}")
         else:
-            print(f"❌ Error ({res.status_code})")
-            print(f"   Response: {res.text}")
+            print(f"⚠️  Status: {res.status_code}")
+            print(f"   Response: {res.json()}")
     except Exception as e:
         print(f"❌ Error: {e}")
-else:
-    print("\n3. Skipping Upload Test (no token)")
-
-print("\n" + "=" * 60)
-print("SUMMARY:")
-print("✅ Backend API is responding")
-print("✅ Authentication working (register/login)")
-if token:
-    print("✅ File upload working with token")
-    print("\n🎉 FRONTEND & BACKEND FULLY INTEGRATED!")
-else:
-    print("⚠️  Could not obtain token for upload test")
-print("=" * 60)
+
+    # Test 2: Login
+    print("\n2. Testing User Login...")
+    token = None
+    try:
+        res = SESSION.post(f"{API}/api/auth/login", json={
+            "email": TEST_EMAIL,
+            "password": TEST_PASSWORD
+        })
+        if res.status_code == 200:
+            data = res.json()
+            token = data.get("access_token")
+            SESSION.headers.update({"Authorization": f"Bearer {token}"})
+            print(f"✅ Login OK")
+            print(f"   Token: {token[:40]}...")
+            print(f"   Type: {data.get('token_type')}")
+        else:
+            print(f"❌ Error ({res.status_code}): {res.json()}")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+
+    # Test 3: Upload with auth token
+    if token:
+        print("\n3. Testing Authenticated Upload...")
+        try:
+            with contextlib.ExitStack() as stack:
+                if UPLOAD_FILE:
+                    upload_file = (os.path.basename(UPLOAD_FILE), stack.enter_context(open(UPLOAD_FILE, "rb")))
+                else:
+                    upload_file = ("test.txt", "Sample resume content")
+                
+                if MULTIPART_STREAMING:
+                    body = MultipartEncoder(fields={"file": upload_file})
+                    res = SESSION.post(f"{API}/api/resumes/upload", data=body,
+                                       headers={"Content-Type": body.content_type})
+                else:
+                    res = SESSION.post(f"{API}/api/resumes/upload", files={"file": upload_file})
+            if res.status_code == 200:
+                upload = res.json()
+                print(f"✅ Upload OK")
+                print(f"   Resume ID: {upload.get('resume_id')}")
+                print(f"   Status: {upload.get('status')}")
+            else:
+                print(f"❌ Error ({res.status_code})")
+                print(f"   Response: {res.text}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+    else:
+        print("\n3. Skipping Upload Test (no token)")
+
+    print("\n" + "=" * 60)
+    print("SUMMARY:")
+    print("✅ Backend API is responding")
+    print("✅ Authentication working (register/login)")
+    if token:
+        print("✅ File upload working with token")
+        print("\n🎉 FRONTEND & BACKEND FULLY INTEGRATED!")
+    else:
+        print("⚠️  Could not obtain token for upload test")
+    print("=" * 60)
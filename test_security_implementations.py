@@ -8,25 +8,74 @@ Tests all 5 security implementations:
 5. JWT Secret Validation (32+ character requirement)
 """
 
+import asyncio
+import httpx
+import importlib.util
+import io
 import requests
 import json
+import sys
+import threading
 import time
 import os
+import re
+import tempfile
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# orjson encodes request bodies and parses responses faster than the stdlib
+# when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 API_VERSION = "v1"
 
-# Test results tracking
+# Unique per run (and per process, so concurrent runs don't collide); every
+# suite builds its test emails from it
+RUN_SUFFIX = f"{int(time.time())}_{os.getpid()}"
+
+# One keep-alive session shared by every suite, so the ~50 requests reuse
+# pooled connections instead of opening a new one per call (urllib3 already
+# sets TCP_NODELAY on its sockets)
+session = requests.Session()
+session.mount("http://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=0, connect=0, read=0)
+))
+
+# (connect, read) timeouts: an unreachable backend fails within half a
+# second instead of burning the whole read budget on every call
+CONNECT_TIMEOUT = 0.5
+TIMEOUT = (CONNECT_TIMEOUT, 5)
+
+# Set by the startup health preflight so the JWT suite doesn't repeat it
+_backend_healthy = False
+
+# Independent cases (distinct emails/filenames) are sent as one async batch,
+# multiplexed over HTTP/2 when the optional h2 package is installed; the rate
+# limiter and lockout suites stay serial because order matters there
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+BATCH_LIMITS = httpx.Limits(max_connections=32)
+
+# Test results tracking: parallel name / passed lists per category
 test_results = {
-    "password_validator": [],
-    "file_validator": [],
-    "rate_limiter": [],
-    "account_lockout": [],
-    "jwt_validation": []
+    category: {"names": [], "passed": []}
+    for category in ("password_validator", "file_validator", "rate_limiter", "account_lockout", "jwt_validation")
 }
 
+def record(category, name, passed):
+    """Record one test outcome under its category"""
+    results = test_results[category]
+    results["names"].append(name)
+    results["passed"].append(passed)
+
 # Color codes for console output
 class Colors:
     GREEN = '\033[92m'
@@ -36,159 +85,198 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+# Colored fragments are built once instead of re-concatenated on every print
+_RULE = f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}"
+_HEADER_FMT = f"\n{_RULE}\n{Colors.BOLD}{Colors.BLUE}%s{Colors.RESET}\n{_RULE}\n"
+_PASS = f"{Colors.GREEN}✓ PASS{Colors.RESET}"
+_FAIL = f"{Colors.RED}✗ FAIL{Colors.RESET}"
+_MSG_FMT = f"       {Colors.YELLOW}%s{Colors.RESET}"
+_SUMMARY_FMT = f"\n{Colors.BOLD}Summary - %s: %s%d/%d passed (%.0f%%){Colors.RESET}"
+
 def print_header(title):
     """Print formatted section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{title:^70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}\n")
-
-def print_test(name, passed, message=""):
-    """Print test result"""
-    status = f"{Colors.GREEN}✓ PASS{Colors.RESET}" if passed else f"{Colors.RED}✗ FAIL{Colors.RESET}"
-    print(f"  {status} - {name}")
+    print(_HEADER_FMT % f"{title:^70}")
+
+def print_test(name, passed, message="", response=None):
+    """Print test result
+    
+    A failed check also shows the start of its response body; the body is
+    only decoded then, never for passing checks.
+    """
+    print(f"  {_PASS if passed else _FAIL} - {name}")
     if message:
-        print(f"       {Colors.YELLOW}{message}{Colors.RESET}")
+        print(_MSG_FMT % message)
+    if response is not None and not passed:
+        print(_MSG_FMT % f"Response: {response.text[:200]}")
 
 def print_summary(category, results):
     """Print category summary"""
-    passed = sum(1 for r in results if r["passed"])
-    total = len(results)
+    passed = sum(results["passed"])
+    total = len(results["passed"])
     percentage = (passed / total * 100) if total > 0 else 0
     color = Colors.GREEN if passed == total else Colors.YELLOW
-    print(f"\n{Colors.BOLD}Summary - {category}: {color}{passed}/{total} passed ({percentage:.0f}%){Colors.RESET}")
+    print(_SUMMARY_FMT % (category, color, passed, total, percentage))
 
-# ===================== TEST 1: PASSWORD VALIDATOR =====================
+JSON_HEADERS = {"Content-Type": "application/json"}
 
-def test_password_validator():
-    """Test password validation on registration endpoint"""
-    print_header("TEST 1: PASSWORD VALIDATOR (6-Point Validation)")
-    
-    tests = [
-        {
-            "name": "Weak password (too short)",
-            "email": f"weak_user_{int(time.time())}@example.com",
-            "password": "Short1!",  # 7 chars - below 8 minimum
-            "should_fail": True,
-            "error_contains": "8 characters"
-        },
-        {
-            "name": "Missing uppercase",
-            "email": f"nouppercase_{int(time.time())}@example.com",
-            "password": "nouppercase123!",
-            "should_fail": True,
-            "error_contains": "uppercase"
-        },
-        {
-            "name": "Missing lowercase",
-            "email": f"nolowercase_{int(time.time())}@example.com",
-            "password": "NOLOWERCASE123!",
-            "should_fail": True,
-            "error_contains": "lowercase"
-        },
-        {
-            "name": "Missing digit",
-            "email": f"nodigit_{int(time.time())}@example.com",
-            "password": "NoDigitHere!",
-            "should_fail": True,
-            "error_contains": "digit"
-        },
-        {
-            "name": "Missing special character",
-            "email": f"nospecial_{int(time.time())}@example.com",
-            "password": "NoSpecial123",
-            "should_fail": True,
-            "error_contains": "special"
-        },
-        {
-            "name": "Valid strong password",
-            "email": f"valid_user_{int(time.time())}@example.com",
-            "password": "StrongP@ssw0rd",
-            "should_fail": False,
-            "error_contains": None
-        }
-    ]
-    
-    for test in tests:
-        try:
-            payload = {
-                "email": test["email"],
-                "password": test["password"],
-                "full_name": "Test User",
-                "gdpr_consent": True
-            }
-            
-            response = requests.post(
-                f"{BASE_URL}/api/auth/register",
-                json=payload,
-                timeout=5
-            )
-            
-            is_error = response.status_code != 200
-            
-            if test["should_fail"]:
-                passed = is_error
-                message = f"Status {response.status_code}"
-                if is_error and test["error_contains"]:
-                    response_text = response.text.lower()
-                    message += f" - Error contains '{test['error_contains']}': {test['error_contains'].lower() in response_text}"
-            else:
-                passed = response.status_code == 200
-                message = f"Status {response.status_code}"
-            
-            print_test(test["name"], passed, message)
-            test_results["password_validator"].append({"name": test["name"], "passed": passed})
-            
-        except Exception as e:
-            print_test(test["name"], False, str(e))
-            test_results["password_validator"].append({"name": test["name"], "passed": False})
-    
-    print_summary("Password Validator", test_results["password_validator"])
+def dumps_json(payload):
+    """Encode a request body as JSON bytes, using orjson if available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
 
-# ===================== TEST 2: FILE VALIDATOR =====================
+def _post_json(url, payload, **kwargs):
+    """POST a JSON body on the shared session (encoded by dumps_json)"""
+    headers = {**JSON_HEADERS, **kwargs.pop("headers", {})}
+    return session.post(url, data=dumps_json(payload), headers=headers, **kwargs)
 
-def test_file_validator():
-    """Test file validation on upload endpoint"""
-    print_header("TEST 2: FILE VALIDATOR (Whitelist + Size Limit)")
+def parse_json(response):
+    """Decode a response body as JSON ({} when empty), using orjson if available"""
+    if not response.content:
+        return {}
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+async def run_async_batch(cases, timeout=5):
+    """Send (method, path, kwargs) cases concurrently over one pooled client.
+    
+    Responses come back in case order; a request that raised is returned as
+    its exception instead.
+    """
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=HTTP2_AVAILABLE,
+        limits=BATCH_LIMITS,
+        timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+    ) as client:
+        return await asyncio.gather(
+            *(client.request(method, path, **kwargs) for method, path, kwargs in cases),
+            return_exceptions=True
+        )
+
+def _bootstrap_session():
+    """Register and log in one shared user for the suites that just need a valid token.
     
-    # First, register and login to get a token
-    print("  [Setup] Registering test user and generating JWT token...")
+    Returns a session carrying the user's bearer token (sharing the main
+    session's connection pool), or None if setup failed. The lockout and
+    login rate-limit checks keep their own users since they mutate
+    per-account state.
+    """
+    print("  [Setup] Registering shared test user and generating JWT token...")
     
-    test_email = f"filetest_{int(time.time())}@example.com"
+    test_email = f"shared_user_{RUN_SUFFIX}@example.com"
     test_password = "ValidP@ssw0rd123"
     
     # Register
-    register_response = requests.post(
+    register_response = _post_json(
         f"{BASE_URL}/api/auth/register",
-        json={
+        {
             "email": test_email,
             "password": test_password,
-            "full_name": "File Test User",
+            "full_name": "Shared Test User",
             "gdpr_consent": True
         },
-        timeout=5
+        timeout=TIMEOUT
     )
     
-    if register_response.status_code != 200:
+    if register_response.status_code not in (200, 201):
         print(f"  {Colors.RED}✗ Failed to register test user{Colors.RESET}")
-        return
+        return None
     
     # Login
-    login_response = requests.post(
+    login_response = _post_json(
         f"{BASE_URL}/api/auth/login",
-        json={
+        {
             "email": test_email,
             "password": test_password
         },
-        timeout=5
+        timeout=TIMEOUT
     )
     
     if login_response.status_code != 200:
         print(f"  {Colors.RED}✗ Failed to login{Colors.RESET}")
-        return
+        return None
     
-    token_data = login_response.json()
-    jwt_token = token_data.get("access_token")
+    jwt_token = parse_json(login_response).get("access_token")
+    
+    if not jwt_token:
+        print(f"  {Colors.RED}✗ No access token returned{Colors.RESET}")
+        return None
+    
+    auth_session = requests.Session()
+    auth_session.mount("http://", session.get_adapter(BASE_URL))
+    auth_session.headers["Authorization"] = f"Bearer {jwt_token}"
     print(f"  {Colors.GREEN}✓ JWT Token generated{Colors.RESET}\n")
+    return auth_session
+
+# ===================== TEST 1: PASSWORD VALIDATOR =====================
+
+# Every expected password error in one pattern, so each response body is
+# scanned once instead of lower-cased and searched per case
+_PW_ERRORS_RE = re.compile(r"8 characters|uppercase|lowercase|digit|special", re.IGNORECASE)
+
+# (name, email tag, password, should_fail, error_contains)
+_PASSWORD_CASES = (
+    ("Weak password (too short)", "weak_user", "Short1!", True, "8 characters"),  # 7 chars - below 8 minimum
+    ("Missing uppercase", "nouppercase", "nouppercase123!", True, "uppercase"),
+    ("Missing lowercase", "nolowercase", "NOLOWERCASE123!", True, "lowercase"),
+    ("Missing digit", "nodigit", "NoDigitHere!", True, "digit"),
+    ("Missing special character", "nospecial", "NoSpecial123", True, "special"),
+    ("Valid strong password", "valid_user", "StrongP@ssw0rd", False, None),
+)
+
+def test_password_validator():
+    """Test password validation on registration endpoint"""
+    print_header("TEST 1: PASSWORD VALIDATOR (6-Point Validation)")
+    
+    responses = asyncio.run(run_async_batch([
+        ("POST", "/api/auth/register", {"content": dumps_json({
+            "email": f"{tag}_{RUN_SUFFIX}@example.com",
+            "password": password,
+            "full_name": "Test User",
+            "gdpr_consent": True
+        }), "headers": JSON_HEADERS})
+        for _, tag, password, _, _ in _PASSWORD_CASES
+    ]))
+    
+    for (name, _, _, should_fail, error_contains), response in zip(_PASSWORD_CASES, responses):
+        if isinstance(response, Exception):
+            print_test(name, False, str(response))
+            record("password_validator", name, False)
+            continue
+        
+        is_error = response.status_code != 200
+        
+        if should_fail:
+            passed = is_error
+            message = f"Status {response.status_code}"
+            if is_error and error_contains:
+                found = {m.group(0).lower() for m in _PW_ERRORS_RE.finditer(response.text)}
+                message += f" - Error contains '{error_contains}': {error_contains.lower() in found}"
+        else:
+            passed = response.status_code == 200
+            message = f"Status {response.status_code}"
+        
+        print_test(name, passed, message, response)
+        record("password_validator", name, passed)
+    
+    print_summary("Password Validator", test_results["password_validator"])
+
+# ===================== TEST 2: FILE VALIDATOR =====================
+
+def test_file_validator(auth_session):
+    """Test file validation on upload endpoint"""
+    print_header("TEST 2: FILE VALIDATOR (Whitelist + Size Limit)")
+    
+    if auth_session is None:
+        print(f"  {Colors.RED}✗ No authenticated test user (setup failed){Colors.RESET}")
+        return
+    
+    # Stand-in for an 11 MiB upload: a sparse temp file has the size without
+    # holding the bytes in memory, and httpx streams it in 64 KiB chunks
+    oversize_file = tempfile.TemporaryFile()
+    oversize_file.truncate(11 * 1024 * 1024)
     
     tests = [
         {
@@ -230,42 +318,41 @@ def test_file_validator():
         {
             "name": "File too large (>10MB)",
             "filename": "large_file.pdf",
-            "content": b"x" * (11 * 1024 * 1024),
+            "content": oversize_file,
             "should_pass": False
         }
     ]
     
-    for test in tests:
-        try:
-            files = {
-                "file": (test["filename"], test["content"])
-            }
-            headers = {
-                "Authorization": f"Bearer {jwt_token}"
-            }
-            
-            response = requests.post(
-                f"{BASE_URL}/api/resumes/upload",
-                files=files,
-                headers=headers,
-                timeout=10
-            )
-            
-            is_success = response.status_code == 200
-            
-            if test["should_pass"]:
-                passed = is_success
-                message = f"Status {response.status_code}" + (" - File accepted" if is_success else " - File rejected")
-            else:
-                passed = not is_success
-                message = f"Status {response.status_code}" + (" - File rejected" if not is_success else " - File accepted")
-            
-            print_test(test["name"], passed, message)
-            test_results["file_validator"].append({"name": test["name"], "passed": passed})
-            
-        except Exception as e:
-            print_test(test["name"], False, f"Exception: {str(e)[:50]}")
-            test_results["file_validator"].append({"name": test["name"], "passed": False})
+    headers = {
+        "Authorization": auth_session.headers["Authorization"]
+    }
+    
+    responses = asyncio.run(run_async_batch([
+        ("POST", "/api/resumes/upload", {
+            "files": {"file": (test["filename"], test["content"])},
+            "headers": headers
+        })
+        for test in tests
+    ], timeout=10))
+    oversize_file.close()
+    
+    for test, response in zip(tests, responses):
+        if isinstance(response, Exception):
+            print_test(test["name"], False, f"Exception: {str(response)[:50]}")
+            record("file_validator", test["name"], False)
+            continue
+        
+        is_success = response.status_code == 200
+        
+        if test["should_pass"]:
+            passed = is_success
+            message = f"Status {response.status_code}" + (" - File accepted" if is_success else " - File rejected")
+        else:
+            passed = not is_success
+            message = f"Status {response.status_code}" + (" - File rejected" if not is_success else " - File accepted")
+        
+        print_test(test["name"], passed, message, response)
+        record("file_validator", test["name"], passed)
     
     print_summary("File Validator", test_results["file_validator"])
 
@@ -278,11 +365,11 @@ def test_rate_limiter():
     print("  Testing registration rate limit (3 attempts per minute, PER EMAIL)...\n")
     
     # Use SAME email for rate limiting test
-    test_email = f"ratelimit_test_{int(time.time())}@example.com"
+    test_email = f"ratelimit_test_{RUN_SUFFIX}@example.com"
     
     # Try to register 4 times with same email (after first success, remaining fail due to user exists)
     responses = []
-    for i in range(4):
+    for _ in range(4):
         payload = {
             "email": test_email,
             "password": "ValidP@ssw0rd123",
@@ -290,15 +377,12 @@ def test_rate_limiter():
             "gdpr_consent": True
         }
         
-        response = requests.post(
+        response = _post_json(
             f"{BASE_URL}/api/auth/register",
-            json=payload,
-            timeout=5
+            payload,
+            timeout=TIMEOUT
         )
         responses.append(response.status_code)
-        
-        if i < 3:
-            time.sleep(0.3)
     
     # First registration succeeds (200), 2nd-3rd fail with 400 (user exists), 4th gets rate limited (429)
     tests = [
@@ -311,7 +395,7 @@ def test_rate_limiter():
     for test in tests:
         message = f"Expected {test['expected']}, got {test['actual']}"
         print_test(test["name"], test["passed"], message)
-        test_results["rate_limiter"].append({"name": test["name"], "passed": test["passed"]})
+        record("rate_limiter", test["name"], test["passed"])
     
     print("\n  Testing login rate limit (5 attempts per minute, PER EMAIL)...\n")
     
@@ -320,45 +404,45 @@ def test_rate_limiter():
     test_email = "testlogin@example.com"
     
     # First register a user
-    requests.post(
+    _post_json(
         f"{BASE_URL}/api/auth/register",
-        json={
+        {
             "email": test_email,
             "password": "ValidP@ssw0rd123",
             "full_name": "Login Test",
             "gdpr_consent": True
         },
-        timeout=5
+        timeout=TIMEOUT
     )
     
     # Try 6 login attempts
-    for i in range(6):
-        response = requests.post(
+    for _ in range(6):
+        response = _post_json(
             f"{BASE_URL}/api/auth/login",
-            json={
+            {
                 "email": test_email,
                 "password": "WrongPassword"
             },
-            timeout=5
+            timeout=TIMEOUT
         )
-        login_responses.append(response.status_code)
-        if i < 5:
-            time.sleep(0.3)
+        login_responses.append(response)
     
     # First 5 should fail with 401, 6th should be rate limited (429)
-    for i, status in enumerate(login_responses[:5]):
-        passed = status == 401
-        print_test(f"Login attempt {i+1} (should be rejected)", passed, f"Status {status}")
-        test_results["rate_limiter"].append({"name": f"Login attempt {i+1}", "passed": passed})
+    for i, response in enumerate(login_responses[:5]):
+        passed = response.status_code == 401
+        print_test(f"Login attempt {i+1} (should be rejected)", passed, f"Status {response.status_code}", response)
+        record("rate_limiter", f"Login attempt {i+1}", passed)
     
-    passed = login_responses[5] == 429
-    print_test("Login attempt 6 (should be rate limited)", passed, f"Status {login_responses[5]}")
-    test_results["rate_limiter"].append({"name": "Login attempt 6", "passed": passed})
+    passed = login_responses[5].status_code == 429
+    print_test("Login attempt 6 (should be rate limited)", passed, f"Status {login_responses[5].status_code}", login_responses[5])
+    record("rate_limiter", "Login attempt 6", passed)
     
     print_summary("Rate Limiter", test_results["rate_limiter"])
 
 # ===================== TEST 4: ACCOUNT LOCKOUT =====================
 
+_LOCKOUT_RE = re.compile(r"locked|too many", re.IGNORECASE)
+
 def test_account_lockout():
     """Test account lockout after 5 failed attempts"""
     print_header("TEST 4: ACCOUNT LOCKOUT (5-Attempt Threshold + 15-Min Lockout)")
@@ -366,66 +450,62 @@ def test_account_lockout():
     # Register a test user
     print("  [Setup] Registering test user for lockout testing...\n")
     
-    test_email = f"lockout_{int(time.time())}@example.com"
+    test_email = f"lockout_{RUN_SUFFIX}@example.com"
     test_password = "ValidP@ssw0rd123"
     
-    requests.post(
+    _post_json(
         f"{BASE_URL}/api/auth/register",
-        json={
+        {
             "email": test_email,
             "password": test_password,
             "full_name": "Lockout Test User",
             "gdpr_consent": True
         },
-        timeout=5
+        timeout=TIMEOUT
     )
     
     # Try 6 failed login attempts
     lockout_responses = []
     for i in range(6):
-        response = requests.post(
+        response = _post_json(
             f"{BASE_URL}/api/auth/login",
-            json={
+            {
                 "email": test_email,
                 "password": "WrongPassword"
             },
-            timeout=5
+            timeout=TIMEOUT
         )
         lockout_responses.append({
             "attempt": i + 1,
             "status": response.status_code,
-            "response": response.json() if response.text else {}
+            "response": response  # parsed only for the attempt that gets inspected
         })
-        time.sleep(0.2)
     
     # Evaluate results
-    tests = []
     for result in lockout_responses[:5]:
         passed = result["status"] == 401
         message = f"Attempt {result['attempt']}: Status {result['status']}"
-        tests.append({"name": f"Failed login attempt {result['attempt']}", "passed": passed, "message": message})
-        print_test(f"Failed login attempt {result['attempt']}", passed, message)
+        record("account_lockout", f"Failed login attempt {result['attempt']}", passed)
+        print_test(f"Failed login attempt {result['attempt']}", passed, message, result["response"])
     
     # 6th attempt should return 429 (locked)
     lockout_test = lockout_responses[5]
     passed = lockout_test["status"] == 429
     message = f"Status {lockout_test['status']} - Account locked"
-    tests.append({"name": "6th attempt (account locked)", "passed": passed, "message": message})
-    print_test("6th attempt (account locked)", passed, message)
+    record("account_lockout", "6th attempt (account locked)", passed)
+    print_test("6th attempt (account locked)", passed, message, lockout_test["response"])
     
     # Verify error message mentions lockout
     if 429 == lockout_test["status"]:
-        response_text = str(lockout_test["response"]).lower()
-        contains_lockout_msg = "locked" in response_text or "too many" in response_text
+        contains_lockout_msg = bool(_LOCKOUT_RE.search(str(parse_json(lockout_test["response"]))))
         print_test("Lockout error message", contains_lockout_msg, "Message mentions 'locked' or 'too many'")
-        tests.append({"name": "Lockout message", "passed": contains_lockout_msg})
+        record("account_lockout", "Lockout message", contains_lockout_msg)
     
-    test_results["account_lockout"] = tests
     print_summary("Account Lockout", test_results["account_lockout"])
 
 # ===================== TEST 5: JWT VALIDATION =====================
 
-def test_jwt_validation():
+def test_jwt_validation(auth_session):
     """Test JWT secret validation in settings"""
     print_header("TEST 5: JWT SECRET VALIDATION (32+ Character Requirement)")
     
@@ -434,70 +514,41 @@ def test_jwt_validation():
     print("  [Info] JWT_SECRET length:", len(os.getenv("JWT_SECRET", "")), "characters\n")
     
     # Test 1: Check that application is running (settings are valid)
+    if _backend_healthy:
+        print_test("API is responding", True, "Status 200")
+        record("jwt_validation", "API Health", True)
+    else:
+        try:
+            response = session.get(f"{BASE_URL}/api/health", timeout=TIMEOUT)
+            passed = response.status_code == 200
+            print_test("API is responding", passed, f"Status {response.status_code}", response)
+            record("jwt_validation", "API Health", passed)
+        except Exception as e:
+            print_test("API is responding", False, str(e))
+            record("jwt_validation", "API Health", False)
+    
+    # Test 2: Verify JWT tokens can be generated (requires valid secret); the
+    # shared session only exists if login returned an access token
+    has_token = auth_session is not None
+    print_test("JWT token generation", has_token, "Bearer token returned" if has_token else "Failed to obtain token")
+    record("jwt_validation", "JWT Generation", has_token)
+    
+    # Test 3: Verify invalid tokens are rejected by a token-protected endpoint
+    # (login never reads the Authorization header, and a dummy login would
+    # also count against that email's rate limit)
     try:
-        response = requests.get(f"{BASE_URL}/api/health", timeout=5)
-        passed = response.status_code == 200
-        print_test("API is responding", passed, f"Status {response.status_code}")
-        test_results["jwt_validation"].append({"name": "API Health", "passed": passed})
-    except Exception as e:
-        print_test("API is responding", False, str(e))
-        test_results["jwt_validation"].append({"name": "API Health", "passed": False})
-    
-    # Test 2: Verify JWT tokens can be generated (requires valid secret)
-    try:
-        response = requests.post(
-            f"{BASE_URL}/api/auth/register",
-            json={
-                "email": f"jwttest_{int(time.time())}@example.com",
-                "password": "ValidP@ssw0rd123",
-                "full_name": "JWT Test",
-                "gdpr_consent": True
-            },
-            timeout=5
+        response = session.get(
+            f"{BASE_URL}/api/auth/me",
+            headers={"Authorization": "Bearer invalid_token_here"},
+            timeout=TIMEOUT
         )
         
-        if response.status_code == 200:
-            # Now try to login
-            response = requests.post(
-                f"{BASE_URL}/api/auth/login",
-                json={
-                    "email": f"jwttest_{int(time.time())}@example.com",
-                    "password": "ValidP@ssw0rd123"
-                },
-                timeout=5
-            )
-            
-            if response.status_code == 200:
-                token_data = response.json()
-                has_token = "access_token" in token_data
-                print_test("JWT token generation", has_token, "Bearer token returned")
-                test_results["jwt_validation"].append({"name": "JWT Generation", "passed": has_token})
-                
-                # Test 3: Verify invalid tokens are rejected
-                response = requests.post(
-                    f"{BASE_URL}/api/auth/login",
-                    headers={"Authorization": "Bearer invalid_token_here"},
-                    json={
-                        "email": "dummy@example.com",
-                        "password": "dummy"
-                    },
-                    timeout=5
-                )
-                
-                # Should be 401 or 422
-                passed = response.status_code in [401, 422]
-                print_test("Invalid token rejection", passed, f"Status {response.status_code}")
-                test_results["jwt_validation"].append({"name": "Invalid Token Rejection", "passed": passed})
-            else:
-                print_test("JWT token generation", False, "Failed to login")
-                test_results["jwt_validation"].append({"name": "JWT Generation", "passed": False})
-        else:
-            print_test("JWT token generation", False, "Failed to register")
-            test_results["jwt_validation"].append({"name": "JWT Generation", "passed": False})
-            
+        passed = response.status_code == 401
+        print_test("Invalid token rejection", passed, f"Status {response.status_code}", response)
+        record("jwt_validation", "Invalid Token Rejection", passed)
     except Exception as e:
-        print_test("JWT token generation", False, str(e))
-        test_results["jwt_validation"].append({"name": "JWT Generation", "passed": False})
+        print_test("Invalid token rejection", False, str(e))
+        record("jwt_validation", "Invalid Token Rejection", False)
     
     print_summary("JWT Validation", test_results["jwt_validation"])
 
@@ -507,26 +558,22 @@ def print_final_summary():
     """Print final test summary"""
     print_header("FINAL TEST SUMMARY")
     
-    all_tests = []
-    category_stats = {}
-    
+    # One pass prints each category and accumulates the overall totals
+    total_passed = total_tests = 0
     for category, results in test_results.items():
-        if results:
-            passed = sum(1 for r in results if r["passed"])
-            total = len(results)
-            category_stats[category] = {"passed": passed, "total": total}
-            all_tests.extend(results)
-    
-    # Print by category
-    for category, stats in category_stats.items():
-        percentage = (stats["passed"] / stats["total"] * 100) if stats["total"] > 0 else 0
-        color = Colors.GREEN if stats["passed"] == stats["total"] else Colors.YELLOW
+        if not results["passed"]:
+            continue
+        passed = sum(results["passed"])
+        total = len(results["passed"])
+        total_passed += passed
+        total_tests += total
+        
+        percentage = passed / total * 100
+        color = Colors.GREEN if passed == total else Colors.YELLOW
         category_name = category.replace("_", " ").title()
-        print(f"{color}  {category_name}: {stats['passed']}/{stats['total']} passed ({percentage:.0f}%){Colors.RESET}")
+        print(f"{color}  {category_name}: {passed}/{total} passed ({percentage:.0f}%){Colors.RESET}")
     
     # Overall stats
-    total_passed = sum(r["passed"] for r in all_tests)
-    total_tests = len(all_tests)
     overall_percentage = (total_passed / total_tests * 100) if total_tests > 0 else 0
     
     print(f"\n{Colors.BOLD}Overall: {Colors.GREEN}{total_passed}/{total_tests} tests passed ({overall_percentage:.0f}%){Colors.RESET}")
@@ -537,6 +584,59 @@ def print_final_summary():
     else:
         print(f"\n{Colors.YELLOW}⚠️  Some tests failed. Review the output above for details.{Colors.RESET}\n")
 
+# ===================== CONCURRENT SUITE RUNNER =====================
+
+class _SuiteOutput:
+    """sys.stdout stand-in that sends each suite thread's prints to its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, text):
+        return getattr(self.local, "buffer", self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+async def run_suites(auth_session):
+    """Run the five suites concurrently, then print their reports in order.
+    
+    Each suite uses its own emails, so they don't interfere; the rate limiter
+    and account lockout suites still hold a shared semaphore so only one of
+    the two is hammering the auth endpoints at a time.
+    """
+    output = _SuiteOutput(sys.stdout)
+    stateful = asyncio.Semaphore(1)
+    
+    def capture(suite, *args):
+        output.local.buffer = io.StringIO()
+        try:
+            suite(*args)
+            return output.local.buffer.getvalue()
+        finally:
+            del output.local.buffer
+    
+    async def run(suite, *args, lock=None):
+        if lock is None:
+            return await asyncio.to_thread(capture, suite, *args)
+        async with lock:
+            return await asyncio.to_thread(capture, suite, *args)
+    
+    sys.stdout = output
+    try:
+        reports = await asyncio.gather(
+            run(test_password_validator),
+            run(test_file_validator, auth_session),
+            run(test_rate_limiter, lock=stateful),
+            run(test_account_lockout, lock=stateful),
+            run(test_jwt_validation, auth_session)
+        )
+    finally:
+        sys.stdout = output.stream
+    
+    sys.stdout.write("".join(reports))
+
 # ===================== MAIN EXECUTION =====================
 
 if __name__ == "__main__":
@@ -550,15 +650,15 @@ if __name__ == "__main__":
     try:
         # Check if backend is running
         print("Checking backend connectivity...", end=" ")
-        response = requests.get(f"{BASE_URL}/api/health", timeout=5)
+        response = session.get(f"{BASE_URL}/api/health", timeout=TIMEOUT)
+        _backend_healthy = response.status_code == 200
         print(f"{Colors.GREEN}✓ Connected to {BASE_URL}{Colors.RESET}\n")
         
+        # One registered + logged-in user serves every suite that only needs a token
+        auth_session = _bootstrap_session()
+        
         # Run all tests
-        test_password_validator()
-        test_file_validator()
-        test_rate_limiter()
-        test_account_lockout()
-        test_jwt_validation()
+        asyncio.run(run_suites(auth_session))
         
         # Print final summary
         print_final_summary()
@@ -49,6 +49,25 @@ def test_refresh_token_flow_returns_standard_success_contract():
     assert "access_token" in body["data"]
 
 
+def test_register_never_returns_tokens():
+    client = TestClient(app, base_url="http://127.0.0.1")
+
+    response = client.post(
+        "/api/auth/register?return_token=true",
+        json={
+            "email": f"register-{uuid4().hex}@example.com",
+            "password": "Password123!",
+            "full_name": "Test User",
+            "gdpr_consent": True,
+        },
+    )
+
+    assert response.status_code == 201
+    data = response.json()["data"]
+    assert "access_token" not in data
+    assert "refresh_token" not in data
+
+
 def test_http_error_contract_shape_is_standardized():
     client = TestClient(app, base_url="http://127.0.0.1")
 
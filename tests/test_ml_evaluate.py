@@ -0,0 +1,247 @@
+from pathlib import Path
+import importlib
+import importlib.util
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+pytest.importorskip("joblib")
+pytest.importorskip("sklearn")
+
+from sklearn.metrics import accuracy_score, confusion_matrix, precision_recall_fscore_support  # noqa: E402
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ML_SRC_PATH = PROJECT_ROOT / "ml_pipeline" / "src"
+
+
+def _load_ml_module(name):
+    # Register ml_pipeline/src as a package without running its __init__,
+    # which also imports mlflow
+    if "ml_src" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "ml_src", ML_SRC_PATH / "__init__.py", submodule_search_locations=[str(ML_SRC_PATH)]
+        )
+        sys.modules["ml_src"] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"ml_src.{name}")
+
+
+evaluate = _load_ml_module("evaluate")
+fast_metrics = _load_ml_module("_fast_metrics")
+
+
+def _all_paths(monkeypatch, y_true, y_pred, n):
+    # One matrix per _fast_cm path: bincount/binary, then Numba if installed
+    results = [evaluate._fast_cm(y_true, y_pred, n)]
+    if fast_metrics.NUMBA_AVAILABLE:
+        monkeypatch.setattr(evaluate, "NUMBA_MIN_SAMPLES", 0)
+        results.append(evaluate._fast_cm(y_true, y_pred, n))
+        monkeypatch.setattr(evaluate, "NUMBA_MIN_SAMPLES", 50_000)
+    return results
+
+
+@pytest.mark.parametrize("n", [2, 3, 5])
+def test_fast_cm_matches_sklearn_confusion_matrix(monkeypatch, n):
+    rng = np.random.default_rng(n)
+    y_true = rng.integers(0, n, 1000)
+    y_pred = rng.integers(0, n, 1000)
+
+    expected = confusion_matrix(y_true, y_pred, labels=list(range(n)))
+    for cm in _all_paths(monkeypatch, y_true, y_pred, n):
+        np.testing.assert_array_equal(cm, expected)
+
+
+def test_fast_cm_counts_classes_missing_from_both_arrays(monkeypatch):
+    y_true = np.array([0, 0, 2])
+    y_pred = np.array([0, 2, 2])
+
+    expected = confusion_matrix(y_true, y_pred, labels=[0, 1, 2, 3])
+    for cm in _all_paths(monkeypatch, y_true, y_pred, 4):
+        np.testing.assert_array_equal(cm, expected)
+
+
+@pytest.mark.parametrize(
+    "y_true, y_pred, n",
+    [
+        ([0, 1, 2], [0, 3, 2], 3),
+        ([0, 1, 1], [0, 2, 1], 2),
+        ([0, 1, 2], [0, -1, 2], 3),
+        ([0, 3, 2], [0, 1, 2], 3),
+    ],
+)
+def test_fast_cm_rejects_out_of_range_labels(monkeypatch, y_true, y_pred, n):
+    monkeypatch.setattr(evaluate, "NUMBA_MIN_SAMPLES", 0)
+    with pytest.raises(ValueError, match=r"must lie in \[0, "):
+        evaluate._fast_cm(np.array(y_true), np.array(y_pred), n)
+
+    monkeypatch.setattr(evaluate, "NUMBA_MIN_SAMPLES", 50_000)
+    with pytest.raises(ValueError, match=r"must lie in \[0, "):
+        evaluate._fast_cm(np.array(y_true), np.array(y_pred), n)
+
+
+@pytest.mark.skipif(not fast_metrics.NUMBA_AVAILABLE, reason="numba is not installed")
+def test_numba_kernel_rejects_out_of_range_predictions():
+    with pytest.raises(ValueError, match=r"y_pred labels must lie in \[0, 3\)"):
+        fast_metrics.cm_prf(np.array([0, 1, 2], dtype=np.int64), np.array([0, 3, 2], dtype=np.int64), 3)
+
+
+def test_evaluate_model_raises_on_out_of_range_predictions():
+    class _OutOfRangeModel:
+        def predict(self, X):
+            return np.full(X.shape[0], 3)
+
+    evaluator = evaluate.ModelEvaluator(["a", "b", "c"])
+    with pytest.raises(ValueError, match=r"y_pred labels must lie in \[0, 3\)"):
+        evaluator.evaluate_model(_OutOfRangeModel(), np.zeros((4, 2)), np.array([0, 1, 2, 0]), "bad")
+    assert "bad" not in evaluator.evaluation_results
+
+
+def _refit_problem():
+    from sklearn.linear_model import LogisticRegression
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    y = (X[:, 0] > 0).astype(int)
+    return LogisticRegression().fit(X, y), X, y
+
+
+@pytest.mark.parametrize("use_cache_dir", [False, True])
+def test_refit_in_place_invalidates_cached_predictions(tmp_path, use_cache_dir):
+    model, X, y = _refit_problem()
+    evaluator = evaluate.ModelEvaluator(["neg", "pos"], cache_dir=str(tmp_path) if use_cache_dir else None)
+
+    first = evaluator.evaluate_model(model, X, y, "lr")
+    assert first["accuracy"] > 0.9
+
+    # Same object, same X_test buffer, opposite labels
+    model.fit(X, 1 - y)
+    second = evaluator.evaluate_model(model, X, y, "lr")
+
+    assert second["accuracy"] < 0.1
+    if use_cache_dir:
+        assert len(list(tmp_path.glob("lr_*.pkl"))) == 2
+
+
+def test_cache_dir_serves_predictions_for_unchanged_model(tmp_path):
+    model, X, y = _refit_problem()
+    evaluate.ModelEvaluator(["neg", "pos"], cache_dir=str(tmp_path)).evaluate_model(model, X, y, "lr")
+
+    # A fresh evaluator (e.g. a new process) reuses the persisted predictions
+    cached, = tmp_path.glob("lr_*.pkl")
+    evaluator = evaluate.ModelEvaluator(["neg", "pos"], cache_dir=str(tmp_path))
+    digest, y_pred = evaluator._cache_lookup(model, X, "lr")
+    assert cached.name == f"lr_{digest}.pkl"
+    np.testing.assert_array_equal(y_pred, model.predict(X))
+
+
+class _FailingModel:
+    def predict(self, X):
+        raise RuntimeError("predict failed")
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_iter_evaluate_raises_when_a_model_fails(n_jobs):
+    import joblib
+
+    model, X, y = _refit_problem()
+    evaluator = evaluate.ModelEvaluator(["neg", "pos"])
+
+    # Worker processes could not import this test's module, so parallel runs
+    # use threads; error propagation is the same
+    with joblib.parallel_config(backend="threading"):
+        with pytest.raises(RuntimeError, match="predict failed"):
+            evaluator.evaluate_all_models({"lr": model, "broken": _FailingModel()}, X, y, n_jobs=n_jobs)
+    assert "lr" in evaluator.evaluation_results
+    assert "broken" not in evaluator.evaluation_results
+
+
+def test_evaluate_one_caps_model_threads_without_touching_the_model():
+    from sklearn.ensemble import RandomForestClassifier
+
+    _, X, y = _refit_problem()
+    forest = RandomForestClassifier(n_estimators=5, n_jobs=-1, random_state=0).fit(X, y)
+
+    _, metrics, y_pred, error = evaluate._evaluate_one("rf", forest, X, y, ["neg", "pos"], inner_threads=1)
+
+    assert error is None
+    assert forest.n_jobs == -1
+    np.testing.assert_array_equal(y_pred, forest.predict(X))
+    assert metrics["accuracy"] == pytest.approx(np.mean(y_pred == y))
+
+
+@pytest.mark.parametrize(
+    "y_true, y_pred, n",
+    [
+        (np.random.default_rng(1).integers(0, 3, 500), np.random.default_rng(2).integers(0, 3, 500), 3),
+        # Class 2 is never predicted, class 3 appears in neither array
+        (np.array([0, 1, 2, 2, 1, 0]), np.array([0, 1, 1, 0, 1, 0]), 4),
+        # Class 1 is predicted but never true
+        (np.array([0, 0, 2, 2]), np.array([1, 0, 2, 1]), 3),
+    ],
+)
+def test_metrics_from_cm_matches_sklearn(y_true, y_pred, n):
+    fused = evaluate._metrics_from_cm(evaluate._fast_cm(y_true, y_pred, n))
+    labels = list(range(n))
+
+    assert fused["accuracy"] == pytest.approx(accuracy_score(y_true, y_pred))
+
+    precision, recall, f1, support = precision_recall_fscore_support(
+        y_true, y_pred, labels=labels, average=None, zero_division=0
+    )
+    np.testing.assert_allclose(fused["precision_per_class"], precision)
+    np.testing.assert_allclose(fused["recall_per_class"], recall)
+    np.testing.assert_allclose(fused["f1_per_class"], f1)
+    np.testing.assert_array_equal(fused["support"], support)
+
+    # sklearn's averages ignore labels absent from both arrays
+    present = sorted(set(y_true.tolist()) | set(y_pred.tolist()))
+    for average in ("macro", "weighted"):
+        expected = precision_recall_fscore_support(
+            y_true, y_pred, labels=present, average=average, zero_division=0
+        )
+        assert fused[f"precision_{average}"] == pytest.approx(expected[0])
+        assert fused[f"recall_{average}"] == pytest.approx(expected[1])
+        assert fused[f"f1_{average}"] == pytest.approx(expected[2])
+
+
+class _CountingModel:
+    def __init__(self, y_pred):
+        self.y_pred = y_pred
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return self.y_pred
+
+
+def test_iter_evaluate_stops_at_target_f1():
+    y = np.array([0, 1, 0, 1, 0, 1])
+    X = np.zeros((6, 2))
+    models = {
+        "weak": _CountingModel(np.zeros(6, dtype=int)),
+        "perfect": _CountingModel(y.copy()),
+        "never_run": _CountingModel(y.copy()),
+    }
+    evaluator = evaluate.ModelEvaluator(["neg", "pos"])
+
+    evaluated = [name for name, _ in evaluator.iter_evaluate(models, X, y, target_f1=0.99)]
+
+    assert evaluated == ["weak", "perfect"]
+    assert models["never_run"].calls == 0
+    assert set(evaluator.evaluation_results) == {"weak", "perfect"}
+
+
+def test_iter_evaluate_can_be_abandoned_early():
+    y = np.array([0, 1, 0, 1])
+    models = {name: _CountingModel(y.copy()) for name in ("first", "second", "third")}
+    evaluator = evaluate.ModelEvaluator(["neg", "pos"])
+
+    results = evaluator.iter_evaluate(models, np.zeros((4, 2)), y)
+    assert next(results)[0] == "first"
+    results.close()
+
+    assert [model.calls for model in models.values()] == [1, 0, 0]
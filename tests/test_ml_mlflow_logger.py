@@ -0,0 +1,182 @@
+from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+import importlib
+import importlib.util
+import itertools
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("mlflow")
+
+from mlflow.entities import Metric, Param, RunTag  # noqa: E402
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ML_SRC_PATH = PROJECT_ROOT / "ml_pipeline" / "src"
+
+
+def _load_ml_module(name):
+    # Register ml_pipeline/src as a package without running its __init__
+    if "ml_src" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "ml_src", ML_SRC_PATH / "__init__.py", submodule_search_locations=[str(ML_SRC_PATH)]
+        )
+        sys.modules["ml_src"] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"ml_src.{name}")
+
+
+mlflow_logger = _load_ml_module("mlflow_logger")
+
+
+class _StubClient:
+    """Records every tracking call instead of talking to a server."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _record(self, name, run_id, **kwargs):
+        with self._lock:
+            self.calls.append((name, run_id, kwargs))
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        self._record("log_batch", run_id, metrics=list(metrics), params=list(params), tags=list(tags))
+
+    def log_text(self, run_id, text, artifact_file):
+        self._record("log_text", run_id, artifact_file=artifact_file)
+
+    def log_figure(self, run_id, figure, artifact_file, save_kwargs=None):
+        self._record("log_figure", run_id, artifact_file=artifact_file)
+
+    def log_artifact(self, run_id, local_path, artifact_path=None):
+        self._record("log_artifact", run_id, local_path=local_path)
+
+
+@pytest.fixture
+def fluent_runs(monkeypatch):
+    # Thread-local active run, like MLflow's fluent API
+    local = threading.local()
+    started = []
+
+    def start_run(run_name=None, tags=None):
+        local.run = SimpleNamespace(info=SimpleNamespace(run_id=f"run-{len(started)}"))
+        started.append(run_name)
+        return local.run
+
+    def end_run():
+        local.run = None
+
+    monkeypatch.setattr(mlflow_logger.mlflow, "start_run", start_run)
+    monkeypatch.setattr(mlflow_logger.mlflow, "active_run", lambda: getattr(local, "run", None))
+    monkeypatch.setattr(mlflow_logger.mlflow, "end_run", end_run)
+    return started
+
+
+@pytest.fixture
+def stub_logger():
+    # Skip __init__: it configures a tracking store and creates an experiment
+    ml_logger = mlflow_logger.MLflowLogger.__new__(mlflow_logger.MLflowLogger)
+    ml_logger.run_id = None
+    ml_logger._client = _StubClient()
+    ml_logger._runs_cache = {}
+    ml_logger._run_prefix = "20260101_000000"
+    ml_logger._run_counter = itertools.count()
+    ml_logger._io_pool = ThreadPoolExecutor(max_workers=2)
+    yield ml_logger
+    ml_logger._io_pool.shutdown()
+
+
+def test_current_run_id_raises_without_an_active_run(fluent_runs, stub_logger):
+    with pytest.raises(RuntimeError, match="No active MLflow run"):
+        stub_logger._current_run_id()
+    assert fluent_runs == []
+
+
+def test_background_uploads_log_to_the_callers_run(fluent_runs, stub_logger, monkeypatch, tmp_path):
+    monkeypatch.setattr(stub_logger, "log_model", lambda model, model_name: None)
+    artifact = tmp_path / "notes.txt"
+    artifact.write_text("notes")
+
+    stub_logger.log_model_experiment(
+        model=object(),
+        model_name="lr",
+        params={"C": 1.0},
+        metrics={"f1_macro": 0.5},
+        classification_report={"a": {"precision": 1.0, "support": 3}},
+        artifacts=[str(artifact)],
+    )
+
+    # One run only, and every upload (made from pool threads) landed in it
+    assert len(fluent_runs) == 1
+    assert {name for name, _, _ in stub_logger._client.calls} == {"log_batch", "log_text", "log_artifact"}
+    assert {run_id for _, run_id, _ in stub_logger._client.calls} == {"run-0"}
+
+
+def test_each_run_gets_its_own_start_timestamp_tag(monkeypatch, stub_logger):
+    tags_seen = []
+
+    def start_run(run_name=None, tags=None):
+        tags_seen.append(tags)
+        return SimpleNamespace(info=SimpleNamespace(run_id=f"run-{len(tags_seen)}"))
+
+    class _Clock:
+        moments = iter(["20260101_000001", "20260101_000502"])
+
+        @classmethod
+        def now(cls):
+            return SimpleNamespace(strftime=lambda fmt: next(cls.moments))
+
+    monkeypatch.setattr(mlflow_logger.mlflow, "start_run", start_run)
+    monkeypatch.setattr(mlflow_logger.mlflow, "active_run", lambda: SimpleNamespace(info=SimpleNamespace(run_id="x")))
+    monkeypatch.setattr(mlflow_logger, "datetime", _Clock)
+
+    stub_logger.start_run()
+    stub_logger.start_run()
+
+    assert [tags["timestamp"] for tags in tags_seen] == ["20260101_000001", "20260101_000502"]
+
+
+def _entities(n_metrics=0, n_params=0, n_tags=0):
+    metrics = [Metric(f"m{i}", float(i), 0, 0) for i in range(n_metrics)]
+    params = [Param(f"p{i}", str(i)) for i in range(n_params)]
+    tags = [RunTag(f"t{i}", str(i)) for i in range(n_tags)]
+    return metrics, params, tags
+
+
+@pytest.mark.parametrize(
+    "n_metrics, n_params, n_tags, expected_requests",
+    [
+        (0, 0, 0, 0),
+        (10, 5, 2, 1),
+        (1000, 0, 0, 1),
+        (1001, 0, 0, 2),
+        (0, 250, 0, 3),
+        (2500, 150, 120, 3),
+    ],
+)
+def test_log_batch_respects_server_limits(stub_logger, n_metrics, n_params, n_tags, expected_requests):
+    stub_logger.run_id = "run-0"
+    metrics, params, tags = _entities(n_metrics, n_params, n_tags)
+
+    stub_logger._log_batch(metrics=metrics, params=params, tags=tags)
+
+    batches = [kwargs for name, _, kwargs in stub_logger._client.calls if name == "log_batch"]
+    assert len(batches) == expected_requests
+    for batch in batches:
+        assert len(batch["params"]) <= mlflow_logger.MAX_PARAMS_PER_BATCH
+        assert len(batch["tags"]) <= mlflow_logger.MAX_TAGS_PER_BATCH
+        assert (
+            len(batch["metrics"]) + len(batch["params"]) + len(batch["tags"])
+            <= mlflow_logger.MAX_ENTITIES_PER_BATCH
+        )
+
+    # Every entity is sent exactly once, in order
+    assert [m.key for batch in batches for m in batch["metrics"]] == [m.key for m in metrics]
+    assert [p.key for batch in batches for p in batch["params"]] == [p.key for p in params]
+    assert [t.key for batch in batches for t in batch["tags"]] == [t.key for t in tags]
+    assert {run_id for _, run_id, _ in stub_logger._client.calls} <= {"run-0"}
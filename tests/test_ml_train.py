@@ -0,0 +1,97 @@
+from pathlib import Path
+import importlib
+import importlib.util
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sparse = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pandas")
+pytest.importorskip("sklearn")
+pytest.importorskip("xgboost")
+pytest.importorskip("threadpoolctl")
+
+from sklearn.neural_network import MLPClassifier  # noqa: E402
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ML_SRC_PATH = PROJECT_ROOT / "ml_pipeline" / "src"
+
+
+def _load_ml_module(name):
+    # Register ml_pipeline/src as a package without running its __init__,
+    # which also imports mlflow
+    if "ml_src" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "ml_src", ML_SRC_PATH / "__init__.py", submodule_search_locations=[str(ML_SRC_PATH)]
+        )
+        sys.modules["ml_src"] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"ml_src.{name}")
+
+
+train = _load_ml_module("train")
+mlp_numba = _load_ml_module("_mlp_numba")
+
+requires_numba = pytest.mark.skipif(not mlp_numba.NUMBA_AVAILABLE, reason="numba is not installed")
+
+
+def _sparse_problem(n_samples=600, n_features=200, n_classes=3, seed=0):
+    # Each class draws some of its terms from its own block of the vocabulary
+    # and the rest at random, so neither model can score perfectly
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, n_classes, n_samples)
+    block = n_features // n_classes
+    rows, cols = [], []
+    for i, label in enumerate(y):
+        own = rng.integers(label * block, (label + 1) * block, 5)
+        noise = rng.integers(0, n_features, 11)
+        rows.extend([i] * 16)
+        cols.extend(own.tolist() + noise.tolist())
+    X = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n_samples, n_features)
+    )
+    X.sum_duplicates()
+    return X, y
+
+
+def test_mlp_backend_defaults_to_sklearn(monkeypatch):
+    monkeypatch.delenv(train.MLP_BACKEND_ENV, raising=False)
+
+    trainer = train.ModelTrainer()
+
+    assert trainer.mlp_backend == "sklearn"
+    assert type(trainer.models["Neural_Network"]) is MLPClassifier
+
+
+@requires_numba
+def test_numba_mlp_is_opt_in(monkeypatch):
+    monkeypatch.delenv(train.MLP_BACKEND_ENV, raising=False)
+    assert isinstance(train.ModelTrainer(mlp_backend="numba").models["Neural_Network"], mlp_numba.NumbaMLPClassifier)
+
+    monkeypatch.setenv(train.MLP_BACKEND_ENV, "numba")
+    assert isinstance(train.ModelTrainer().models["Neural_Network"], mlp_numba.NumbaMLPClassifier)
+
+
+def test_unknown_mlp_backend_is_rejected():
+    with pytest.raises(ValueError, match="mlp_backend"):
+        train.ModelTrainer(mlp_backend="torch")
+
+
+@requires_numba
+def test_numba_mlp_matches_sklearn_mlp_on_sparse_input():
+    X, y = _sparse_problem()
+    X_train, y_train, X_test, y_test = X[:480], y[:480], X[480:], y[480:]
+    params = dict(hidden_layer_sizes=(32,), max_iter=200, batch_size=32, random_state=0)
+
+    reference = MLPClassifier(**params).fit(X_train, y_train)
+    compiled = mlp_numba.NumbaMLPClassifier(**params).fit(X_train, y_train)
+
+    np.testing.assert_array_equal(compiled.classes_, reference.classes_)
+    assert compiled.predict_proba(X_test).shape == reference.predict_proba(X_test).shape == (120, 3)
+    np.testing.assert_allclose(compiled.predict_proba(X_test).sum(axis=1), 1.0, rtol=1e-5)
+
+    reference_acc = np.mean(reference.predict(X_test) == y_test)
+    compiled_acc = np.mean(compiled.predict(X_test) == y_test)
+    assert reference_acc > 0.7
+    assert abs(compiled_acc - reference_acc) <= 0.05
@@ -0,0 +1,51 @@
+from pathlib import Path
+import importlib.util
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("nltk")
+pytest.importorskip("sklearn")
+
+from sklearn.preprocessing import LabelEncoder  # noqa: E402
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PREPROCESS_PATH = PROJECT_ROOT / "ml_pipeline" / "src" / "preprocess.py"
+
+
+def _load_preprocess_module():
+    # Load the module by path: the src package __init__ also imports mlflow
+    spec = importlib.util.spec_from_file_location("ml_preprocess", PREPROCESS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _bare_preprocessor(module):
+    # encode_labels/load_dataset need only the label encoder, not NLTK data
+    preprocessor = module.ResumePreprocessor.__new__(module.ResumePreprocessor)
+    preprocessor.label_encoder = LabelEncoder()
+    return preprocessor
+
+
+def test_encode_labels_matches_label_encoder_for_unsorted_arrow_labels(tmp_path):
+    module = _load_preprocess_module()
+    labels = ["real", "fake", "suspicious", "fake", "real"]
+    csv_path = tmp_path / "resumes.csv"
+    pd.DataFrame({"resume_text": [f"resume {i}" for i in range(len(labels))], "label": labels}).to_csv(
+        csv_path, index=False
+    )
+
+    preprocessor = _bare_preprocessor(module)
+    df = preprocessor.load_dataset(str(csv_path))
+    # Force appearance-order categories, as the Arrow reader may return them
+    df["label"] = df["label"].cat.reorder_categories(["real", "fake", "suspicious"])
+
+    encoded = preprocessor.encode_labels(df)
+
+    expected = LabelEncoder().fit(labels)
+    assert list(preprocessor.label_encoder.classes_) == list(expected.classes_)
+    assert list(encoded["label_encoded"]) == list(expected.transform(labels))
+    assert list(preprocessor.label_encoder.inverse_transform(encoded["label_encoded"])) == labels
@@ -13,22 +13,58 @@ Expected output:
 import os
 import sys
 import re
+import socket
 import importlib.util
+from functools import lru_cache, partial
+from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
+# Service SDKs are imported once here; a missing one leaves its name as None
+# and is reported by both the package check and the matching service check
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+try:
+    import boto3
+    from botocore.config import Config
+except ImportError:
+    boto3 = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Snapshot of the process environment, filled once main() has loaded
+# .env.production. Every check reads it instead of os.getenv, so the
+# concurrent service checks never touch the live process environment
+ENV: Dict[str, str] = {}
+
+# ANSI colors only when writing to a terminal; piped output stays plain
+_USE_COLOR = sys.stdout.isatty()
+
 class Colors:
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    RESET = '\033[0m'
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    RED = '\033[91m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    BLUE = '\033[94m' if _USE_COLOR else ''
+    RESET = '\033[0m' if _USE_COLOR else ''
 
 
 def is_strict_external_validation() -> bool:
     """Enable strict live connectivity checks for external providers."""
-    return os.getenv('STRICT_EXTERNAL_VALIDATION', 'false').strip().lower() in {'1', 'true', 'yes'}
+    return ENV.get('STRICT_EXTERNAL_VALIDATION', 'false').strip().lower() in {'1', 'true', 'yes'}
 
 
 def looks_like_placeholder(value: str) -> bool:
@@ -51,304 +87,474 @@ def strict_placeholder_result(service_name: str) -> Tuple[bool, str]:
         return False, f"❌ {service_name} values look like placeholders (strict mode requires real credentials)"
     return True, f"⚠ {service_name} values look like placeholders (live check skipped)"
 
+# Shared HTTPS session so provider checks reuse pooled keep-alive connections
+if requests is not None:
+    _HTTP = requests.Session()
+    _HTTP.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+else:
+    _HTTP = None
+
+# (connect, read) timeouts for provider HTTP checks
+HTTP_TIMEOUT = (2, 3)
+
+def _precheck_host(url: str, default_port: int) -> Optional[str]:
+    """Resolve a service URL's host before any client is built.
+
+    Returns an error message when the host is missing or does not resolve,
+    so a typo fails in milliseconds instead of after a connect timeout.
+    """
+    parsed = urlparse(url)
+    if not parsed.hostname:
+        return f"no host in {parsed.scheme or 'URL'}"
+    try:
+        port = parsed.port or default_port
+    except ValueError as e:
+        return f"invalid port: {e}"
+    try:
+        socket.getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        return f"cannot resolve {parsed.hostname}: {e}"
+    return None
+
+def missing_package_result(service_name: str, package_name: str) -> Tuple[bool, str]:
+    """Return failure for a service whose SDK is not installed."""
+    return False, f"❌ {service_name} check failed: {package_name} is not installed"
+
+
+@lru_cache(maxsize=2)
+def _aws_client(service: str):
+    """AWS client (sts, s3) built from the environment, constructed once per run."""
+    return boto3.client(
+        service,
+        aws_access_key_id=ENV.get('AWS_ACCESS_KEY_ID', ''),
+        aws_secret_access_key=ENV.get('AWS_SECRET_ACCESS_KEY', ''),
+        region_name=ENV.get('AWS_REGION', 'us-east-1'),
+        config=Config(connect_timeout=2, read_timeout=3, retries={'max_attempts': 1})
+    )
+
+
+@lru_cache(maxsize=1)
+def _redis():
+    """Redis client for REDIS_URL, constructed once per run."""
+    return redis.from_url(ENV.get('REDIS_URL', ''))
+
 def check_env_file_exists() -> Tuple[bool, str]:
     """Check if .env.production exists"""
     if Path('.env.production').exists():
         return True, "✅ .env.production file exists"
     return False, "❌ .env.production not found (create from .env.production.template)"
 
-def check_env_variable(var_name: str, min_length: int = 1) -> Tuple[bool, str]:
-    """Check if environment variable is set"""
-    value = os.getenv(var_name, '').strip()
+def check_env_variable(var_name: str, min_length: int = 1, prefix: Optional[Tuple[str, ...]] = None,
+                       env: Dict[str, str] = ENV) -> Tuple[bool, str]:
+    """Check if environment variable is set, long enough and correctly prefixed"""
+    value = env.get(var_name, '').strip()
+    n = len(value)
     
-    if not value:
+    if not n:
         return False, f"❌ {var_name} is not set"
     
-    if len(value) < min_length:
+    if n < min_length:
         return False, f"❌ {var_name} is too short (minimum {min_length} chars)"
     
-    # Mask value for security
-    if len(value) <= 8:
-        masked = '*' * len(value)
+    if prefix and not value.startswith(prefix):
+        return False, f"❌ {var_name} format invalid (must start with {' or '.join(prefix)})"
+    
+    # Mask value for security; the mask has a fixed shape so it reveals
+    # neither short values nor the length of long ones
+    if n <= 8:
+        masked = '*' * n
     else:
-        masked = value[:4] + '*' * (len(value) - 8) + value[-4:]
+        masked = f"{value[:2]}…{value[-2:]}"
     return True, f"✅ {var_name} is set ({masked})"
 
+# pip distribution names for packages whose import name differs
+PIP_NAMES = {
+    'argon2': 'argon2-cffi',
+}
+
 def check_python_package(package_name: str) -> Tuple[bool, str]:
-    """Check if Python package is installed"""
-    try:
-        if importlib.util.find_spec(package_name) is not None:
-            return True, f"✅ {package_name} is installed"
-        return False, f"❌ {package_name} is not installed - run: pip install {package_name}"
-    except Exception as e:
-        return False, f"❌ {package_name} package check failed: {str(e)}"
+    """Check if Python package is installed (without importing it)"""
+    # SDKs imported at module level are already in sys.modules
+    if package_name in sys.modules:
+        return True, f"✅ {package_name} is installed"
+    if importlib.util.find_spec(package_name) is not None:
+        return True, f"✅ {package_name} is installed"
+    pip_name = PIP_NAMES.get(package_name, package_name)
+    return False, f"❌ {package_name} is not installed - run: pip install {pip_name}"
 
 def test_database_connection() -> Tuple[bool, str]:
     """Test PostgreSQL connection"""
+    if psycopg2 is None:
+        return missing_package_result("Database", "psycopg2")
+    db_url = ENV.get('DATABASE_URL', '')
+    if not db_url:
+        return False, "❌ DATABASE_URL not configured"
+
+    parsed = urlparse(db_url)
+    if parsed.scheme not in {"postgresql", "postgresql+asyncpg", "postgresql+psycopg", "postgres"}:
+        return False, "❌ DATABASE_URL format invalid (expected postgresql:// or postgresql+asyncpg://)"
+    if not parsed.hostname or not parsed.path or parsed.path == '/':
+        return False, "❌ DATABASE_URL appears incomplete (host/database missing)"
+
+    if not is_strict_external_validation():
+        return True, "⚠ DATABASE_URL format is valid (connection check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
+
+    host_error = _precheck_host(db_url, 5432)
+    if host_error:
+        return False, f"❌ Database host check failed: {host_error}"
+
+    # libpq only understands the plain postgresql:// scheme, not driver suffixes
+    dsn = parsed._replace(scheme='postgresql').geturl()
     try:
-        import psycopg2  # noqa: F401
-        db_url = os.getenv('DATABASE_URL', '')
-        if not db_url:
-            return False, "❌ DATABASE_URL not configured"
-
-        parsed = urlparse(db_url)
-        if parsed.scheme not in {"postgresql", "postgresql+asyncpg", "postgresql+psycopg", "postgres"}:
-            return False, "❌ DATABASE_URL format invalid (expected postgresql:// or postgresql+asyncpg://)"
-        if not parsed.hostname or not parsed.path or parsed.path == '/':
-            return False, "❌ DATABASE_URL appears incomplete (host/database missing)"
-
-        return True, "✅ DATABASE_URL format is valid"
-    except Exception as e:
-        return False, f"❌ Database check failed: {str(e)}"
+        conn = psycopg2.connect(dsn, connect_timeout=2, options='-c statement_timeout=1500')
+    except psycopg2.OperationalError as e:
+        return False, f"❌ Database connection failed: {str(e).strip()}"
+    try:
+        conn.cursor().execute('SELECT 1')
+    finally:
+        conn.close()
+    return True, f"✅ Database is reachable ({parsed.hostname})"
 
 def test_aws_s3() -> Tuple[bool, str]:
     """Test AWS S3 configuration"""
-    try:
-        import boto3
-        
-        bucket = os.getenv('AWS_S3_BUCKET', '')
-        if not bucket:
-            return False, "❌ AWS_S3_BUCKET not configured"
-        
-        access_key = os.getenv('AWS_ACCESS_KEY_ID', '')
-        secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '')
-        
-        if not access_key or not secret_key:
-            return False, "❌ AWS credentials not configured"
-        
-        if looks_like_placeholder(access_key) or looks_like_placeholder(secret_key) or looks_like_placeholder(bucket):
-            return strict_placeholder_result("AWS S3")
-
-        if not is_strict_external_validation():
-            return True, "⚠ AWS S3 credentials configured (live check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
-
-        # Strict mode: verify credentials and bucket access
-        s3 = boto3.client(
-            's3',
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=os.getenv('AWS_REGION', 'us-east-1')
-        )
-        
-        s3.head_bucket(Bucket=bucket)
-        return True, f"✅ AWS S3 bucket '{bucket}' is accessible"
-    except Exception as e:
-        return False, f"❌ AWS S3 check failed: {str(e)}"
+    if boto3 is None:
+        return missing_package_result("AWS S3", "boto3")
+    bucket = ENV.get('AWS_S3_BUCKET', '')
+    if not bucket:
+        return False, "❌ AWS_S3_BUCKET not configured"
+    
+    access_key = ENV.get('AWS_ACCESS_KEY_ID', '')
+    secret_key = ENV.get('AWS_SECRET_ACCESS_KEY', '')
+    
+    if not access_key or not secret_key:
+        return False, "❌ AWS credentials not configured"
+    
+    if looks_like_placeholder(access_key) or looks_like_placeholder(secret_key) or looks_like_placeholder(bucket):
+        return strict_placeholder_result("AWS S3")
+
+    if not is_strict_external_validation():
+        return True, "⚠ AWS S3 credentials configured (live check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
+
+    # Strict mode: GetCallerIdentity validates the keys without needing
+    # any IAM permission; GetBucketLocation then confirms the bucket is
+    # visible without the s3:ListBucket grant that HeadBucket requires
+    identity = _aws_client('sts').get_caller_identity()
+    _aws_client('s3').get_bucket_location(Bucket=bucket)
+    return True, f"✅ AWS S3 bucket '{bucket}' is accessible (account: {identity.get('Account')})"
 
 def test_github_api() -> Tuple[bool, str]:
     """Test GitHub API token"""
-    try:
-        import requests
-        
-        token = os.getenv('GITHUB_API_KEY', '')
-        if not token:
-            return False, "❌ GITHUB_API_KEY not configured"
+    if requests is None:
+        return missing_package_result("GitHub API", "requests")
+    token = ENV.get('GITHUB_API_KEY', '')
+    if not token:
+        return False, "❌ GITHUB_API_KEY not configured"
 
-        if looks_like_placeholder(token):
-            return strict_placeholder_result("GitHub")
+    if looks_like_placeholder(token):
+        return strict_placeholder_result("GitHub")
 
-        if not re.match(r'^(ghp_|github_pat_|gho_|ghu_|ghs_|ghr_).+', token):
-            return False, "❌ GITHUB_API_KEY format looks invalid"
+    if not is_strict_external_validation():
+        return True, "⚠ GitHub token configured (live check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
 
-        if not is_strict_external_validation():
-            return True, "⚠ GitHub token format looks valid (live check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
-        
-        headers = {"Authorization": f"token {token}"}
-        resp = requests.get("https://api.github.com/user", headers=headers, timeout=5)
-        
-        if resp.status_code == 200:
-            user_data = resp.json()
-            return True, f"✅ GitHub API token valid (user: {user_data.get('login')})"
-        elif resp.status_code == 401:
-            return False, "❌ GitHub API token is invalid or expired"
-        else:
-            return False, f"❌ GitHub API returned {resp.status_code}"
-    except Exception as e:
-        return False, f"❌ GitHub API check failed: {str(e)}"
+    host_error = _precheck_host("https://api.github.com", 443)
+    if host_error:
+        return False, f"❌ GitHub API host check failed: {host_error}"
+    
+    headers = {"Authorization": f"token {token}"}
+    resp = _HTTP.get("https://api.github.com/user", headers=headers, timeout=HTTP_TIMEOUT)
+    
+    if resp.status_code == 200:
+        user_data = resp.json()
+        return True, f"✅ GitHub API token valid (user: {user_data.get('login')})"
+    elif resp.status_code == 401:
+        return False, "❌ GitHub API token is invalid or expired"
+    else:
+        return False, f"❌ GitHub API returned {resp.status_code}"
 
 def test_sendgrid_api() -> Tuple[bool, str]:
     """Test SendGrid configuration"""
-    try:
-        import sendgrid
-        
-        api_key = os.getenv('SENDGRID_API_KEY', '')
-        if not api_key:
-            return False, "❌ SENDGRID_API_KEY not configured"
-
-        if looks_like_placeholder(api_key):
-            return strict_placeholder_result("SendGrid")
-
-        if not api_key.startswith('SG.'):
-            return False, "❌ SENDGRID_API_KEY format invalid (must start with 'SG.')"
-
-        if not is_strict_external_validation():
-            return True, "⚠ SendGrid key format valid (live check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
-
-        sg = sendgrid.SendGridAPIClient(api_key)
-        # Simple validation - just check if client initializes
-        return True, "✅ SendGrid API key is configured"
-    except Exception as e:
-        return False, f"❌ SendGrid check failed: {str(e)}"
+    if requests is None:
+        return missing_package_result("SendGrid", "requests")
+    api_key = ENV.get('SENDGRID_API_KEY', '')
+    if not api_key:
+        return False, "❌ SENDGRID_API_KEY not configured"
+
+    if looks_like_placeholder(api_key):
+        return strict_placeholder_result("SendGrid")
+
+    if not is_strict_external_validation():
+        return True, "⚠ SendGrid key configured (live check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
+
+    # /v3/scopes is read-only and only succeeds for a live key
+    resp = _HTTP.get(
+        "https://api.sendgrid.com/v3/scopes",
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=HTTP_TIMEOUT
+    )
+    if resp.status_code == 200:
+        return True, "✅ SendGrid API key is valid"
+    elif resp.status_code == 401:
+        return False, "❌ SendGrid API key is invalid or revoked"
+    else:
+        return False, f"❌ SendGrid API returned {resp.status_code}"
 
 def test_jwt_secret() -> Tuple[bool, str]:
     """Test JWT secret configuration"""
-    secret = os.getenv('JWT_SECRET', '')
+    secret = ENV.get('JWT_SECRET', '')
     
     if not secret:
         return False, "❌ JWT_SECRET not configured"
     
     if len(secret) < 32:
-        return False, f"❌ JWT_SECRET too short (minimum 32 chars, current: {len(secret)})"
+        return False, "❌ JWT_SECRET too short (minimum 32 chars)"
     
-    return True, f"✅ JWT_SECRET is {len(secret)} characters (secure)"
+    return True, "✅ JWT_SECRET meets the 32 character minimum (secure)"
+
+# Hex formats of an Ethereum contract address and a raw private key
+_ETH_ADDRESS_RE = re.compile(r'0x[0-9a-fA-F]{40}')
+_ETH_PRIVATE_KEY_RE = re.compile(r'0x[0-9a-fA-F]{64}')
 
 def test_blockchain() -> Tuple[bool, str]:
     """Test blockchain configuration"""
-    try:
-        from web3 import Web3
-        
-        rpc_url = os.getenv('ETH_RPC_URL', '')
-        if not rpc_url:
-            return False, "❌ ETH_RPC_URL not configured"
-        
-        contract_address = os.getenv('SMART_CONTRACT_ADDRESS', '')
-        if not contract_address or not contract_address.startswith('0x'):
-            return False, "❌ SMART_CONTRACT_ADDRESS format invalid (must start with 0x)"
-        
-        private_key = os.getenv('PRIVATE_KEY', '')
-        if not private_key or not private_key.startswith('0x'):
-            return False, "❌ PRIVATE_KEY format invalid (must start with 0x)"
+    if requests is None:
+        return missing_package_result("Blockchain", "requests")
+    rpc_url = ENV.get('ETH_RPC_URL', '')
+    if not rpc_url:
+        return False, "❌ ETH_RPC_URL not configured"
+    
+    contract_address = ENV.get('SMART_CONTRACT_ADDRESS', '')
+    if not contract_address:
+        return False, "❌ SMART_CONTRACT_ADDRESS not configured"
+    
+    private_key = ENV.get('PRIVATE_KEY', '')
+    if not private_key:
+        return False, "❌ PRIVATE_KEY not configured"
 
-        if looks_like_placeholder(private_key) or looks_like_placeholder(contract_address):
-            return strict_placeholder_result("Blockchain")
+    if looks_like_placeholder(private_key) or looks_like_placeholder(contract_address):
+        return strict_placeholder_result("Blockchain")
 
-        if not is_strict_external_validation():
-            return True, "⚠ Blockchain config present (RPC check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
-        
-        # Strict mode: test RPC connectivity
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if w3.is_connected():
-            return True, f"✅ Blockchain connected (network: {w3.eth.chain_id})"
-        else:
-            return False, "❌ Could not connect to blockchain RPC"
-    except Exception as e:
-        return False, f"❌ Blockchain check failed: {str(e)}"
+    if not _ETH_ADDRESS_RE.fullmatch(contract_address):
+        return False, "❌ SMART_CONTRACT_ADDRESS format invalid (expected 0x + 40 hex chars)"
+    if not _ETH_PRIVATE_KEY_RE.fullmatch(private_key):
+        return False, "❌ PRIVATE_KEY format invalid (expected 0x + 64 hex chars)"
+
+    if not is_strict_external_validation():
+        return True, "⚠ Blockchain config present (RPC check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
+    
+    # Strict mode: one eth_chainId JSON-RPC call proves the node answers,
+    # which is all web3's is_connected() and eth.chain_id would do
+    if not rpc_url.startswith(('http://', 'https://')):
+        return False, "❌ ETH_RPC_URL must be http(s):// for the RPC check"
+    host_error = _precheck_host(rpc_url, 443 if rpc_url.startswith('https') else 80)
+    if host_error:
+        return False, f"❌ Blockchain RPC host check failed: {host_error}"
+    resp = _HTTP.post(
+        rpc_url,
+        json={'jsonrpc': '2.0', 'id': 1, 'method': 'eth_chainId', 'params': []},
+        timeout=HTTP_TIMEOUT
+    )
+    if resp.status_code != 200:
+        return False, f"❌ Blockchain RPC returned {resp.status_code}"
+    result = resp.json().get('result')
+    if not result:
+        return False, "❌ Could not connect to blockchain RPC"
+    return True, f"✅ Blockchain connected (network: {int(result, 16)})"
 
 def test_redis() -> Tuple[bool, str]:
     """Test Redis connection"""
+    if redis is None:
+        return missing_package_result("Redis", "redis")
+    redis_url = ENV.get('REDIS_URL', '')
+    if not redis_url:
+        return False, "❌ REDIS_URL not configured"
+
+    parsed = urlparse(redis_url)
+    if parsed.scheme not in {"redis", "rediss"}:
+        return False, "❌ REDIS_URL format invalid (expected redis:// or rediss://)"
+
+    if not is_strict_external_validation():
+        return True, "⚠ Redis URL format valid (connection check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
+
+    host_error = _precheck_host(redis_url, 6379)
+    if host_error:
+        return False, f"❌ Redis host check failed: {host_error}"
+
+    # PING, INFO and CONFIG GET share one round-trip; CONFIG is often
+    # disabled on managed Redis, so its error is returned, not raised
+    pipe = _redis().pipeline(transaction=False)
+    pipe.ping()
+    pipe.info('server')
+    pipe.config_get('maxmemory-policy')
+    _, server_info, policy = pipe.execute(raise_on_error=False)
+    if isinstance(server_info, Exception):
+        raise server_info
+
+    version = server_info.get('redis_version', 'unknown')
+    if not isinstance(policy, Exception):
+        eviction = policy.get('maxmemory-policy')
+        if eviction == 'noeviction' and ENV.get('ENVIRONMENT', '').strip().lower() == 'production':
+            return False, f"❌ Redis {version} uses maxmemory-policy 'noeviction' (writes fail once memory is full)"
+    return True, f"✅ Redis is connected (version {version})"
+
+# (name, min length, accepted prefixes) for every required environment
+# variable; format rules live here rather than in the service checks
+ENV_RULES: Tuple[Tuple[str, int, Optional[Tuple[str, ...]]], ...] = (
+    ('ENVIRONMENT', 1, None),
+    ('DATABASE_URL', 1, ('postgresql://', 'postgresql+', 'postgres://')),
+    ('REDIS_URL', 1, ('redis://', 'rediss://')),
+    ('JWT_SECRET', 32, None),
+    ('GITHUB_API_KEY', 1, ('ghp_', 'github_pat_', 'gho_', 'ghu_', 'ghs_', 'ghr_')),
+    ('AWS_S3_BUCKET', 1, None),
+    ('AWS_ACCESS_KEY_ID', 1, None),
+    ('AWS_SECRET_ACCESS_KEY', 1, None),
+    ('AWS_REGION', 1, None),
+    ('SENDGRID_API_KEY', 1, ('SG.',)),
+    ('ETH_RPC_URL', 1, ('http://', 'https://', 'ws://', 'wss://')),
+    ('SMART_CONTRACT_ADDRESS', 1, ('0x',)),
+    ('PRIVATE_KEY', 1, ('0x',)),
+)
+
+# (category, name, check) rows, grouped by category in report order
+CHECKS: Tuple[Tuple[str, str, Callable[[], Tuple[bool, str]]], ...] = (
+    ("Environment Files", "check_env_file_exists", check_env_file_exists),
+    *(
+        ("Python Packages", package, partial(check_python_package, package))
+        for package in ('fastapi', 'sqlalchemy', 'psycopg2', 'boto3',
+                        'sendgrid', 'argon2', 'web3', 'redis')
+    ),
+    *(
+        ("Environment Variables", var_name, partial(check_env_variable, var_name, min_length, prefix))
+        for var_name, min_length, prefix in ENV_RULES
+    ),
+    *(
+        ("Service Connections", check_func.__name__, check_func)
+        for check_func in (
+            test_database_connection,
+            test_aws_s3,
+            test_github_api,
+            test_sendgrid_api,
+            test_jwt_secret,
+            test_blockchain,
+            test_redis,
+        )
+    ),
+)
+
+# Categories whose checks wait on remote services; these run concurrently so
+# the category takes as long as its slowest check rather than their sum
+CONCURRENT_CATEGORIES = {"Service Connections"}
+
+# Wall-clock budget (seconds) for a concurrent category; checks still running
+# when it expires are reported as timed out instead of blocking the summary
+PER_CHECK_BUDGET = 8
+
+# Environment variables each service check needs; when one is unset the
+# check is skipped rather than left to fail slowly inside its SDK
+DEPS: Dict[str, Tuple[str, ...]] = {
+    'test_database_connection': ('DATABASE_URL',),
+    'test_aws_s3': ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_S3_BUCKET'),
+    'test_github_api': ('GITHUB_API_KEY',),
+    'test_sendgrid_api': ('SENDGRID_API_KEY',),
+    'test_blockchain': ('ETH_RPC_URL', 'SMART_CONTRACT_ADDRESS', 'PRIVATE_KEY'),
+    'test_redis': ('REDIS_URL',),
+}
+
+def run_check(name: str, check_func) -> Tuple[bool, str]:
+    """Run one check, turning any error it raises into a failed result"""
     try:
-        import redis
-        
-        redis_url = os.getenv('REDIS_URL', '')
-        if not redis_url:
-            return False, "❌ REDIS_URL not configured"
-
-        parsed = urlparse(redis_url)
-        if parsed.scheme not in {"redis", "rediss"}:
-            return False, "❌ REDIS_URL format invalid (expected redis:// or rediss://)"
-
-        if not is_strict_external_validation():
-            return True, "⚠ Redis URL format valid (connection check skipped; set STRICT_EXTERNAL_VALIDATION=true to enforce)"
-        
-        r = redis.from_url(redis_url)
-        r.ping()
-        return True, f"✅ Redis is connected"
+        return check_func()
     except Exception as e:
-        return False, f"❌ Redis check failed: {str(e)}"
+        return False, f"❌ {name}: {e!s}"
+
+def run_checks_concurrently(rows) -> list:
+    """Run (name, check) rows in a thread pool and return results in row order"""
+    results = [None] * len(rows)
+    pending = []
+    for index, (name, check_func) in enumerate(rows):
+        missing = [var for var in DEPS.get(name, ()) if not ENV.get(var, '').strip()]
+        if missing:
+            results[index] = (False, f"❌ {name} skipped (missing {', '.join(missing)})")
+        else:
+            pending.append((index, name, check_func))
+    if not pending:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=len(pending))
+    futures = {executor.submit(run_check, name, check_func): index
+               for index, name, check_func in pending}
+    try:
+        for future in as_completed(futures, timeout=PER_CHECK_BUDGET):
+            results[futures[future]] = future.result()
+    except TimeoutError:
+        for index, result in enumerate(results):
+            if result is None:
+                name = rows[index][0]
+                results[index] = (False, f"❌ {name} timed out after {PER_CHECK_BUDGET}s")
+    finally:
+        # Don't wait on a stalled check; its result is already recorded
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
 
 def main():
     """Run all validation checks"""
-    print(f"\n{Colors.BLUE}{'='*60}")
-    print("PRODUCTION DEPLOYMENT VALIDATOR")
-    print(f"{'='*60}{Colors.RESET}\n")
-    if is_strict_external_validation():
-        print("Mode: STRICT_EXTERNAL_VALIDATION=true (live provider checks enabled)\n")
-    else:
-        print("Mode: default (configuration validation with external live checks skipped)\n")
-    
-    # Load .env.production
+    # Load .env.production, then snapshot the environment for all checks
     if Path('.env.production').exists():
         from dotenv import load_dotenv
         load_dotenv('.env.production')
+    ENV.update(os.environ)
     
-    checks = {
-        "Environment Files": [
-            check_env_file_exists,
-        ],
-        "Python Packages": [
-            lambda: check_python_package('fastapi'),
-            lambda: check_python_package('sqlalchemy'),
-            lambda: check_python_package('psycopg2'),
-            lambda: check_python_package('boto3'),
-            lambda: check_python_package('sendgrid'),
-            lambda: check_python_package('argon2'),
-            lambda: check_python_package('web3'),
-            lambda: check_python_package('redis'),
-        ],
-        "Environment Variables": [
-            lambda: check_env_variable('ENVIRONMENT'),
-            lambda: check_env_variable('DATABASE_URL'),
-            lambda: check_env_variable('REDIS_URL'),
-            lambda: check_env_variable('JWT_SECRET', 32),
-            lambda: check_env_variable('GITHUB_API_KEY'),
-            lambda: check_env_variable('AWS_S3_BUCKET'),
-            lambda: check_env_variable('AWS_ACCESS_KEY_ID'),
-            lambda: check_env_variable('AWS_SECRET_ACCESS_KEY'),
-            lambda: check_env_variable('AWS_REGION'),
-            lambda: check_env_variable('SENDGRID_API_KEY'),
-            lambda: check_env_variable('ETH_RPC_URL'),
-            lambda: check_env_variable('SMART_CONTRACT_ADDRESS'),
-            lambda: check_env_variable('PRIVATE_KEY'),
-        ],
-        "Service Connections": [
-            test_database_connection,
-            test_aws_s3,
-            test_github_api,
-            test_sendgrid_api,
-            test_jwt_secret,
-            test_blockchain,
-            test_redis,
-        ],
-    }
+    # The report is collected here and written to stdout once at the end
+    out = []
+    out.append(f"\n{Colors.BLUE}{'='*60}\n")
+    out.append("PRODUCTION DEPLOYMENT VALIDATOR\n")
+    out.append(f"{'='*60}{Colors.RESET}\n\n")
+    if is_strict_external_validation():
+        out.append("Mode: STRICT_EXTERNAL_VALIDATION=true (live provider checks enabled)\n\n")
+    else:
+        out.append("Mode: default (configuration validation with external live checks skipped)\n\n")
     
-    total_checks = sum(len(checks_list) for checks_list in checks.values())
+    total_checks = len(CHECKS)
     passed_checks = 0
     failed_checks = []
     
-    for category, checks_list in checks.items():
-        print(f"{Colors.BLUE}{category}:{Colors.RESET}")
+    for category, group in groupby(CHECKS, key=lambda row: row[0]):
+        out.append(f"{Colors.BLUE}{category}:{Colors.RESET}\n")
+        rows = [(name, check_func) for _, name, check_func in group]
         
-        for check_func in checks_list:
-            try:
-                success, message = check_func()
-                print(f"  {message}")
-                
-                if success:
-                    passed_checks += 1
-                else:
-                    failed_checks.append(f"{category}: {message}")
-            except Exception as e:
-                print(f"  ❌ Check failed with error: {str(e)}")
-                failed_checks.append(f"{category}: {str(e)}")
+        if category in CONCURRENT_CATEGORIES:
+            results = run_checks_concurrently(rows)
+        else:
+            results = (run_check(name, check_func) for name, check_func in rows)
         
-        print()
+        for success, message in results:
+            out.append(f"  {message}\n")
+            
+            if success:
+                passed_checks += 1
+            else:
+                failed_checks.append(f"{category}: {message}")
+        
+        out.append("\n")
     
     # Summary
-    print(f"{Colors.BLUE}{'='*60}")
-    print(f"SUMMARY: {passed_checks}/{total_checks} checks passed")
-    print(f"{'='*60}{Colors.RESET}\n")
+    out.append(f"{Colors.BLUE}{'='*60}\n")
+    out.append(f"SUMMARY: {passed_checks}/{total_checks} checks passed\n")
+    out.append(f"{'='*60}{Colors.RESET}\n\n")
     
     if not failed_checks:
-        print(f"{Colors.GREEN}✅ ALL CHECKS PASSED{Colors.RESET}")
-        print(f"{Colors.GREEN}Your system is ready for production deployment!{Colors.RESET}\n")
-        return 0
+        out.append(f"{Colors.GREEN}✅ ALL CHECKS PASSED{Colors.RESET}\n")
+        out.append(f"{Colors.GREEN}Your system is ready for production deployment!{Colors.RESET}\n\n")
+        exit_code = 0
     else:
-        print(f"{Colors.RED}❌ {len(failed_checks)} CHECKS FAILED{Colors.RESET}\n")
-        print("Failures:")
+        out.append(f"{Colors.RED}❌ {len(failed_checks)} CHECKS FAILED{Colors.RESET}\n\n")
+        out.append("Failures:\n")
         for failure in failed_checks:
-            print(f"  • {failure}")
-        print()
-        return 1
+            out.append(f"  • {failure}\n")
+        out.append("\n")
+        exit_code = 1
+    
+    sys.stdout.write(''.join(out))
+    return exit_code
 
 if __name__ == '__main__':
     sys.exit(main())